@@ -15,6 +15,7 @@ from agentc_core.config import Config
 from agentc_core.defaults import DEFAULT_ACTIVITY_FILE
 from agentc_core.defaults import DEFAULT_ACTIVITY_LOG_COLLECTION
 from agentc_core.defaults import DEFAULT_ACTIVITY_SCOPE
+from agentc_core.defaults import DEFAULT_CATALOG_LATEST_VERSION_KEY
 from agentc_core.defaults import DEFAULT_CATALOG_METADATA_COLLECTION
 from agentc_core.defaults import DEFAULT_CATALOG_PROMPT_COLLECTION
 from agentc_core.defaults import DEFAULT_CATALOG_SCOPE
@@ -121,6 +122,18 @@ def clean_db(
                 if err is not None:
                     all_errs.append(err)
 
+                # Readers that cache our catalog version watch the CAS of this document.
+                remove_latest_query = f"""
+                    DELETE FROM
+                        `{cfg.bucket}`.`{DEFAULT_CATALOG_SCOPE}`.{DEFAULT_CATALOG_METADATA_COLLECTION}
+                    USE KEYS "{DEFAULT_CATALOG_LATEST_VERSION_KEY}/{k}";
+                """
+                res, err = execute_query(cluster, remove_latest_query)
+                for r in res.rows():
+                    logger.debug(r)
+                if err is not None:
+                    all_errs.append(err)
+
                 collection = DEFAULT_CATALOG_TOOL_COLLECTION if k == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
                 catalog_condition = " AND ".join([f"catalog_identifier = '{catalog}'" for catalog in catalog_ids])
                 remove_catalogs_query = f"""
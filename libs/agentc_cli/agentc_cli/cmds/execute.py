@@ -132,7 +132,10 @@ def cmd_execute(
                 )
                 file_name = python_tool_metadata.source.name
                 with (tmp_dir_path / file_name).open("w") as f:
-                    f.write(python_tool_metadata.raw)
+                    if python_tool_metadata.raw is not None:
+                        f.write(python_tool_metadata.raw)
+                    else:
+                        f.write(catalog.resolve_blob(python_tool_metadata.raw_ref))
 
                 # add temp directory and it's content as modules
                 if str(tmp_dir_path.absolute()) not in sys.path:
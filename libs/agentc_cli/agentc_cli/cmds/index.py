@@ -11,14 +11,18 @@ from .util import DASHES
 from .util import KIND_COLORS
 from .util import logging_command
 from agentc_core.catalog import __version__ as CATALOG_SCHEMA_VERSION
+from agentc_core.catalog.ann import ann_index_path
 from agentc_core.catalog.index import MetaVersion
+from agentc_core.catalog.index import collect_embedding_cache
 from agentc_core.catalog.index import index_catalog
 from agentc_core.catalog.version import lib_version
 from agentc_core.config import Config
+from agentc_core.defaults import DEFAULT_EMBEDDING_CACHE_FOLDER
 from agentc_core.defaults import DEFAULT_MAX_ERRS
 from agentc_core.defaults import DEFAULT_PROMPT_CATALOG_FILE
 from agentc_core.defaults import DEFAULT_SCAN_DIRECTORY_OPTS
 from agentc_core.defaults import DEFAULT_TOOL_CATALOG_FILE
+from agentc_core.indexer import EmbeddingCache
 from agentc_core.version import VersionDescriptor
 
 logger = logging.getLogger(__name__)
@@ -31,6 +35,7 @@ def cmd_index(
     source_dirs: list[str | os.PathLike],
     kinds: list[typing.Literal["tool", "prompt"]],
     dry_run: bool = False,
+    jobs: int = 1,
 ):
     invalid_kinds = [k for k in kinds if k not in {"tool", "prompt"}]
     if invalid_kinds:
@@ -86,6 +91,13 @@ def cmd_index(
     else:
         printer = click_extra.secho
 
+    # Embeddings of descriptions we have seen before (under the same embedding model) are reused.
+    embedding_cache = None
+    if cfg.embedding_cache_max_entries > 0:
+        embedding_cache = EmbeddingCache(
+            cfg.CatalogPath() / DEFAULT_EMBEDDING_CACHE_FOLDER, max_entries=cfg.embedding_cache_max_entries
+        )
+
     for kind in kinds:
         if kind == "tool":
             catalog_file = cfg.CatalogPath() / DEFAULT_TOOL_CATALOG_FILE
@@ -106,8 +118,27 @@ def cmd_index(
             printer=printer,
             print_progress=True,
             max_errs=DEFAULT_MAX_ERRS,
+            embedding_cache=embedding_cache,
+            jobs=jobs,
         )
         if not dry_run and len(next_catalog.catalog_descriptor.items) > 0:
-            next_catalog.dump(catalog_file)
+            next_catalog.dump(
+                catalog_file,
+                embedding_file=cfg.embedding_file or cfg.embedding_quantization is not None,
+                embedding_quantization=cfg.embedding_quantization,
+            )
+            if cfg.ann_index:
+                next_catalog.dump_ann_index(catalog_file, n_lists=cfg.ann_index_lists)
+            else:
+                # A stale ANN index should not outlive the catalog it was built for.
+                ann_index_path(catalog_file).unlink(missing_ok=True)
             click_extra.secho("\nCatalog successfully indexed!", fg="green")
         click_extra.secho(DASHES, fg=KIND_COLORS[kind])
+
+    # Finally, remove the cached embeddings that our (tool and prompt) catalogs no longer reference.
+    if not dry_run and embedding_cache is not None:
+        collect_embedding_cache(
+            embedding_cache,
+            [cfg.CatalogPath() / DEFAULT_TOOL_CATALOG_FILE, cfg.CatalogPath() / DEFAULT_PROMPT_CATALOG_FILE],
+            embedding_model,
+        )
@@ -16,13 +16,16 @@ from agentc_core.catalog import CatalogDB
 from agentc_core.catalog import CatalogMem
 from agentc_core.catalog import __version__ as CATALOG_SCHEMA_VERSION
 from agentc_core.catalog.index import MetaVersion
+from agentc_core.catalog.index import collect_embedding_cache
 from agentc_core.catalog.index import index_catalog
 from agentc_core.catalog.version import lib_version
 from agentc_core.config import Config
+from agentc_core.defaults import DEFAULT_EMBEDDING_CACHE_FOLDER
 from agentc_core.defaults import DEFAULT_MAX_ERRS
 from agentc_core.defaults import DEFAULT_PROMPT_CATALOG_FILE
 from agentc_core.defaults import DEFAULT_SCAN_DIRECTORY_OPTS
 from agentc_core.defaults import DEFAULT_TOOL_CATALOG_FILE
+from agentc_core.indexer import EmbeddingCache
 from agentc_core.version import VersionDescriptor
 
 logger = logging.getLogger(__name__)
@@ -170,6 +173,11 @@ def get_catalog(
 
                 indexer_printer = logging_printer
 
+            embedding_cache = None
+            if cfg.embedding_cache_max_entries > 0:
+                embedding_cache = EmbeddingCache(
+                    cfg.CatalogPath() / DEFAULT_EMBEDDING_CACHE_FOLDER, max_entries=cfg.embedding_cache_max_entries
+                )
             local_catalog = index_catalog(
                 embedding_model,
                 meta_version,
@@ -182,9 +190,20 @@ def get_catalog(
                 printer=indexer_printer,
                 print_progress=True,
                 max_errs=DEFAULT_MAX_ERRS,
+                embedding_cache=embedding_cache,
             )
             printer("\n", nl=False)
 
+            # Our dirty catalog is never saved, so we keep the cached embeddings of its items (and of our saved
+            # catalogs) here; all other entries are removed.
+            if embedding_cache is not None:
+                collect_embedding_cache(
+                    embedding_cache,
+                    [cfg.CatalogPath() / DEFAULT_TOOL_CATALOG_FILE, cfg.CatalogPath() / DEFAULT_PROMPT_CATALOG_FILE],
+                    embedding_model,
+                    descriptors=local_catalog.catalog_descriptor.items,
+                )
+
     # Deliver our catalog.
     if force == "local" and local_catalog:
         printer("Searching local catalog.")
@@ -194,7 +213,7 @@ def get_catalog(
         return db_catalog
     elif force == "chain" and db_catalog and local_catalog:
         printer("Searching both local and db catalogs.")
-        return CatalogChain(local_catalog, db_catalog)
+        return CatalogChain(local_catalog, db_catalog, timeout_seconds=cfg.catalog_chain_timeout_seconds)
     elif force is None:
         if local_catalog:
             printer("Searching local catalog.")
@@ -204,7 +223,7 @@ def get_catalog(
             return db_catalog
         elif local_catalog and db_catalog:
             printer("Searching both local and db catalogs.")
-            return CatalogChain(local_catalog, db_catalog)
+            return CatalogChain(local_catalog, db_catalog, timeout_seconds=cfg.catalog_chain_timeout_seconds)
     raise ValueError("No catalog found!")
 
 
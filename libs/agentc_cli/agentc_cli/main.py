@@ -499,8 +499,18 @@ def find(
     help="Flag to prevent catalog changes.",
     show_default=True,
 )
+@click_extra.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click_extra.IntRange(min=1),
+    help="Number of worker processes used to generate embeddings (for sentence-transformers models only).",
+    show_default=True,
+)
 @click_extra.pass_context
-def index(ctx: click_extra.Context, sources: list[str], tools: bool, prompts: bool, dry_run: bool = False):
+def index(
+    ctx: click_extra.Context, sources: list[str], tools: bool, prompts: bool, dry_run: bool = False, jobs: int = 1
+):
     """Walk the source directory trees (sources) to index source files into the local catalog.
     Source files that will be scanned include *.py, *.sqlpp, *.yaml, etc."""
     cfg = Config(**ctx.obj)
@@ -532,6 +542,7 @@ def index(ctx: click_extra.Context, sources: list[str], tools: bool, prompts: bo
         source_dirs=sources,
         kinds=kind,
         dry_run=dry_run,
+        jobs=jobs,
     )
 
 
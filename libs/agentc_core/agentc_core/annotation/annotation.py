@@ -70,3 +70,15 @@ class AnnotationPredicate:
         return " OR ".join(
             "(" + " AND ".join(f"a.annotations.{k} = '{v}'" for k, v in d.items()) + ")" for d in self.disjuncts
         )
+
+    def __catalog_query_parameters__(self) -> tuple[str, dict[str, str]]:
+        # Our values are given as named parameters (so the text of our condition only depends on our keys).
+        params, disjuncts = dict(), list()
+        for d in self.disjuncts:
+            conjuncts = list()
+            for k, v in d.items():
+                param = f"annotation_{len(params)}"
+                conjuncts.append(f"a.annotations.`{k}` = ${param}")
+                params[param] = v
+            disjuncts.append("(" + " AND ".join(conjuncts) + ")")
+        return " OR ".join(disjuncts), params
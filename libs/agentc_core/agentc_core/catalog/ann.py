@@ -0,0 +1,232 @@
+import logging
+import math
+import numpy
+import pathlib
+import pydantic
+import typing
+
+from ..defaults import DEFAULT_ANN_INDEX_FILE_SUFFIX
+from ..defaults import DEFAULT_ANN_INDEX_ITERATIONS
+from ..defaults import DEFAULT_ANN_INDEX_PROBES
+from ..defaults import DEFAULT_ANN_INDEX_REBUILD_RATIO
+from ..defaults import DEFAULT_ANN_INDEX_TRAINING_SAMPLES_PER_LIST
+
+logger = logging.getLogger(__name__)
+
+# Rows are scored against our centroids in chunks (to bound the memory used by the intermediate score matrix).
+_ASSIGNMENT_CHUNK_SIZE = 8192
+
+
+def ann_index_path(catalog_path: pathlib.Path) -> pathlib.Path:
+    """Returns the path of the ANN index file that accompanies the given catalog file (e.g., tools.ann.npz)."""
+    return catalog_path.with_suffix(DEFAULT_ANN_INDEX_FILE_SUFFIX)
+
+
+def _assign(matrix: numpy.ndarray, centroids: numpy.ndarray) -> numpy.ndarray:
+    assignments = numpy.empty(len(matrix), dtype=numpy.int64)
+    for i in range(0, len(matrix), _ASSIGNMENT_CHUNK_SIZE):
+        chunk = matrix[i : i + _ASSIGNMENT_CHUNK_SIZE]
+        assignments[i : i + len(chunk)] = numpy.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _spherical_kmeans(matrix: numpy.ndarray, n_lists: int, n_iter: int, seed: int) -> numpy.ndarray:
+    rng = numpy.random.default_rng(seed)
+
+    # We only need a sample of our rows to find good centroids.
+    n_samples = n_lists * DEFAULT_ANN_INDEX_TRAINING_SAMPLES_PER_LIST
+    sample = matrix if len(matrix) <= n_samples else matrix[rng.choice(len(matrix), n_samples, replace=False)]
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+    for _ in range(n_iter):
+        assignments = _assign(sample, centroids)
+        sums = numpy.zeros_like(centroids)
+        numpy.add.at(sums, assignments, sample)
+
+        # Empty lists are reseeded with a random row.
+        empty = numpy.linalg.norm(sums, axis=1) == 0
+        if numpy.any(empty):
+            sums[empty] = sample[rng.choice(len(sample), int(numpy.sum(empty)))]
+        norms = numpy.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        centroids = sums / norms
+    return centroids.astype(numpy.float32)
+
+
+class IVFFlatIndex(pydantic.BaseModel):
+    """An inverted file (IVF-flat) approximate nearest-neighbor index over the unit-length embeddings of a catalog.
+
+    Rows are partitioned into lists by their closest centroid (found using spherical k-means).
+    At query time, only the rows of the ``n_probe`` lists closest to the query are scored exactly.
+    Raising ``n_probe`` trades latency for recall (``n_probe == n_lists`` is an exact search).
+    """
+
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    catalog_identifier: typing.Optional[str] = pydantic.Field(
+        description="The version identifier of the catalog this index was built for.", default=None
+    )
+    identifiers: list[str] = pydantic.Field(description="The identifier of the catalog item behind each row.")
+    centroids: numpy.ndarray = pydantic.Field(description="A (n_lists x dimension) matrix of unit-length centroids.")
+    assignments: numpy.ndarray = pydantic.Field(description="The list (centroid) each row belongs to.")
+
+    # The row numbers of each list, derived from our assignments.
+    _lists: typing.Optional[list[numpy.ndarray]] = None
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls,
+        matrix: numpy.ndarray,
+        identifiers: list[str],
+        catalog_identifier: str = None,
+        n_lists: int = None,
+        n_iter: int = DEFAULT_ANN_INDEX_ITERATIONS,
+        seed: int = 0,
+    ) -> "IVFFlatIndex":
+        """Build an index from scratch. By default, :math:`\\sqrt{n}` lists are used for :math:`n` rows."""
+        if n_lists is None:
+            n_lists = round(math.sqrt(len(matrix)))
+        n_lists = max(1, min(n_lists, len(matrix)))
+        if len(matrix) == 0:
+            centroids = numpy.zeros((1, matrix.shape[1]), dtype=numpy.float32)
+        else:
+            centroids = _spherical_kmeans(matrix, n_lists, n_iter, seed)
+        return IVFFlatIndex(
+            catalog_identifier=catalog_identifier,
+            identifiers=list(identifiers),
+            centroids=centroids,
+            assignments=_assign(matrix, centroids),
+        )
+
+    def is_valid_for(self, identifiers: list[str], catalog_identifier: str) -> bool:
+        return self.catalog_identifier == catalog_identifier and self.identifiers == list(identifiers)
+
+    def update(
+        self, matrix: numpy.ndarray, identifiers: list[str], catalog_identifier: str = None, n_lists: int = None
+    ) -> "IVFFlatIndex":
+        """Returns an index for the given rows, reusing the centroids and row assignments of this index.
+
+        Rows whose identifiers already exist in this index keep their list, new rows are assigned to their closest
+        centroid, and rows that no longer exist are dropped.
+        If too many rows have changed (or the embedding dimension / number of lists has changed), the index is rebuilt.
+        """
+        if self.is_valid_for(identifiers, catalog_identifier):
+            return self
+        if self.centroids.shape[1] != matrix.shape[1] or (n_lists is not None and n_lists != self.n_lists):
+            logger.debug("ANN index is incompatible with the given rows. Rebuilding the index.")
+            return IVFFlatIndex.build(matrix, identifiers, catalog_identifier, n_lists=n_lists)
+
+        previous = {identifier: i for i, identifier in enumerate(self.identifiers)}
+        reused = numpy.array([previous.get(identifier, -1) for identifier in identifiers], dtype=numpy.int64)
+        is_new = reused == -1
+        if numpy.sum(is_new) > DEFAULT_ANN_INDEX_REBUILD_RATIO * max(len(identifiers), 1):
+            logger.debug("Too many catalog items have changed. Rebuilding the ANN index.")
+            return IVFFlatIndex.build(matrix, identifiers, catalog_identifier, n_lists=self.n_lists)
+
+        logger.debug(f"Updating ANN index with {numpy.sum(is_new)} new row(s).")
+        assignments = numpy.empty(len(identifiers), dtype=numpy.int64)
+        assignments[~is_new] = self.assignments[reused[~is_new]]
+        assignments[is_new] = _assign(matrix[is_new], self.centroids)
+        return IVFFlatIndex(
+            catalog_identifier=catalog_identifier,
+            identifiers=list(identifiers),
+            centroids=self.centroids,
+            assignments=assignments,
+        )
+
+    def _inverted_lists(self) -> list[numpy.ndarray]:
+        if self._lists is None:
+            order = numpy.argsort(self.assignments, kind="stable")
+            bounds = numpy.searchsorted(self.assignments[order], numpy.arange(self.n_lists + 1))
+            self._lists = [order[bounds[i] : bounds[i + 1]] for i in range(self.n_lists)]
+        return self._lists
+
+    def search(
+        self, query_vectors: numpy.ndarray, n_probe: int = DEFAULT_ANN_INDEX_PROBES, rows: numpy.ndarray = None
+    ) -> list[numpy.ndarray]:
+        """Returns the (sorted) candidate rows for each (unit-length) query vector.
+
+        :param query_vectors: A (queries x dimension) matrix of unit-length query vectors.
+        :param n_probe: The number of lists (closest to each query) to gather candidates from.
+        :param rows: If specified, candidates are restricted to these (sorted) rows.
+        """
+        inverted_lists = self._inverted_lists()
+        n_probe = max(1, min(n_probe, self.n_lists))
+        centroid_scores = query_vectors @ self.centroids.T
+        probed_lists = numpy.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+
+        candidates_per_query = list()
+        for probed in probed_lists:
+            candidates = numpy.sort(numpy.concatenate([inverted_lists[j] for j in probed]))
+            if rows is not None:
+                candidates = numpy.intersect1d(candidates, rows, assume_unique=True)
+            candidates_per_query.append(candidates)
+        return candidates_per_query
+
+    def dump(self, path: pathlib.Path):
+        with path.open("wb") as fp:
+            numpy.savez(
+                fp,
+                catalog_identifier=numpy.array(self.catalog_identifier or ""),
+                identifiers=numpy.array(self.identifiers, dtype=numpy.str_),
+                centroids=self.centroids,
+                assignments=self.assignments,
+            )
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "IVFFlatIndex":
+        with numpy.load(path, allow_pickle=False) as data:
+            return IVFFlatIndex(
+                catalog_identifier=str(data["catalog_identifier"]) or None,
+                identifiers=data["identifiers"].tolist(),
+                centroids=data["centroids"],
+                assignments=data["assignments"],
+            )
+
+
+def recall_at_k(
+    index: IVFFlatIndex, matrix: numpy.ndarray, query_vectors: numpy.ndarray, k: int = 10, n_probe: int = None
+) -> float:
+    """Returns the fraction of the exact top-k rows (averaged over all queries) that are also found by the index."""
+    n_probe = n_probe if n_probe is not None else DEFAULT_ANN_INDEX_PROBES
+    exact_deltas = query_vectors @ matrix.T
+    found = 0
+    for query_vector, deltas, candidates in zip(
+        query_vectors, exact_deltas, index.search(query_vectors, n_probe=n_probe), strict=True
+    ):
+        exact = numpy.argsort(-deltas, kind="stable")[:k]
+        approximate = candidates[numpy.argsort(-(matrix[candidates] @ query_vector), kind="stable")[:k]]
+        found += len(numpy.intersect1d(exact, approximate))
+    return found / (len(query_vectors) * min(k, len(matrix)))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # Ex: python3 -m agentc_core.catalog.ann 100000 384
+    n, dim = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) > 2 else (100_000, 384)
+    generator = numpy.random.default_rng(0)
+    topics = generator.normal(size=(round(math.sqrt(n)), dim))
+    embeddings = topics[generator.integers(len(topics), size=n)] + 0.5 * generator.normal(size=(n, dim))
+    embeddings = (embeddings / numpy.linalg.norm(embeddings, axis=1, keepdims=True)).astype(numpy.float32)
+    queries = embeddings[generator.choice(n, 100, replace=False)] + 0.1 * generator.normal(size=(100, dim))
+    queries = (queries / numpy.linalg.norm(queries, axis=1, keepdims=True)).astype(numpy.float32)
+
+    start = time.perf_counter()
+    ivf_index = IVFFlatIndex.build(embeddings, [str(i) for i in range(n)])
+    print(f"Built an index of {ivf_index.n_lists} lists over {n} rows in {time.perf_counter() - start:.2f}s.")
+    for probes in [1, 2, 4, 8, 16, 32]:
+        start = time.perf_counter()
+        for q, c in zip(queries, ivf_index.search(queries, n_probe=probes), strict=True):
+            c[numpy.argpartition(-(embeddings[c] @ q), min(9, len(c) - 1))[:10]]
+        latency = (time.perf_counter() - start) / len(queries)
+        recall = recall_at_k(ivf_index, embeddings, queries, k=10, n_probe=probes)
+        print(f"n_probe={probes}: recall@10={recall:.3f}, latency={latency * 1000:.3f}ms/query")
+    start = time.perf_counter()
+    for q in queries:
+        numpy.argpartition(-(embeddings @ q), 9)[:10]
+    print(f"Exact search: latency={(time.perf_counter() - start) / len(queries) * 1000:.3f}ms/query")
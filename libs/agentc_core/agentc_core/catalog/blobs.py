@@ -0,0 +1,39 @@
+import hashlib
+import typing
+
+from ..record.descriptor import RecordDescriptor
+
+R = typing.TypeVar("R", bound=RecordDescriptor)
+
+
+def blob_key(content: str) -> str:
+    """Returns the content-addressed key of a blob (e.g., the raw contents of a source file)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def deduplicate_raw(
+    items: list[R], resolve_blob: typing.Callable[[str], typing.Optional[str]] = None
+) -> tuple[list[R], dict[str, str]]:
+    """Replaces the raw contents of each item with a reference (raw_ref) to a blob that is stored only once.
+
+    :param items: The catalog items to deduplicate (these are not modified, copies are returned).
+    :param resolve_blob: Used to resolve the raw contents of items that already hold a reference.
+    :return: A copy of each item (in order) and the blobs referenced by these items, keyed by raw_ref.
+    """
+    blobs, deduplicated_items = dict(), list()
+    for item in items:
+        if item.raw is not None:
+            key = blob_key(item.raw)
+            blobs.setdefault(key, item.raw)
+        elif item.raw_ref is not None:
+            key = item.raw_ref
+            if key not in blobs:
+                content = resolve_blob(key) if resolve_blob is not None else None
+                if content is None:
+                    raise ValueError(f"Raw contents of catalog item {item.name} (blob {key}) could not be found.")
+                blobs[key] = content
+        else:
+            deduplicated_items.append(item)
+            continue
+        deduplicated_items.append(item.model_copy(update={"raw": None, "raw_ref": key}))
+    return deduplicated_items, blobs
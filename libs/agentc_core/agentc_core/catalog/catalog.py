@@ -1,3 +1,5 @@
+import asyncio
+import concurrent.futures
 import couchbase.auth
 import couchbase.cluster
 import couchbase.exceptions
@@ -77,6 +79,14 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
     _prompt_catalog: CatalogBase = None
     _prompt_provider: PromptProvider = None
 
+    # Our (acouchbase) cluster, connected on the first afind() call (acouchbase clusters are bound to an event loop).
+    _async_cluster: typing.Any = None
+    _async_cluster_lock: asyncio.Lock = None
+    _async_cluster_attempted: bool = False
+
+    # The background warm-ups of our embedding models (only set if embedding_model_warm_up is set).
+    _embedding_model_warm_ups: list[concurrent.futures.Future] = None
+
     @pydantic.model_validator(mode="after")
     def _find_local_catalog(self) -> typing.Self:
         try:
@@ -95,11 +105,27 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
         tool_catalog_file = self.catalog_path / DEFAULT_TOOL_CATALOG_FILE
         if tool_catalog_file.exists():
             logger.debug("Loading local tool catalog at %s.", str(tool_catalog_file.absolute()))
-            self._local_tool_catalog = CatalogMem(catalog_file=tool_catalog_file, embedding_model=embedding_model)
+            self._local_tool_catalog = CatalogMem(
+                catalog_file=tool_catalog_file,
+                embedding_model=embedding_model,
+                ann_index=self.ann_index,
+                ann_index_probes=self.ann_index_probes,
+                lazy=self.lazy_catalog,
+                embedding_quantization=self.embedding_quantization,
+                embedding_rescoring_factor=self.embedding_rescoring_factor,
+            )
         prompt_catalog_file = self.catalog_path / DEFAULT_PROMPT_CATALOG_FILE
         if prompt_catalog_file.exists():
             logger.debug("Loading local prompt catalog at %s.", str(prompt_catalog_file.absolute()))
-            self._local_prompt_catalog = CatalogMem(catalog_file=prompt_catalog_file, embedding_model=embedding_model)
+            self._local_prompt_catalog = CatalogMem(
+                catalog_file=prompt_catalog_file,
+                embedding_model=embedding_model,
+                ann_index=self.ann_index,
+                ann_index_probes=self.ann_index_probes,
+                lazy=self.lazy_catalog,
+                embedding_quantization=self.embedding_quantization,
+                embedding_rescoring_factor=self.embedding_rescoring_factor,
+            )
         return self
 
     @pydantic.model_validator(mode="after")
@@ -125,7 +151,15 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
 
         try:
             self._remote_tool_catalog = CatalogDB(
-                cluster=cluster, bucket=self.bucket, kind="tool", embedding_model=embedding_model
+                cluster=cluster,
+                bucket=self.bucket,
+                kind="tool",
+                embedding_model=embedding_model,
+                version_ttl_seconds=self.catalog_version_ttl_seconds,
+                version_cas_invalidation=self.catalog_version_cas_invalidation,
+                replica=self.catalog_replica,
+                replica_snapshot=self.catalog_replica_snapshot,
+                replica_poll_interval_seconds=self.catalog_replica_poll_interval_seconds,
             )
         except pydantic.ValidationError as e:
             logger.debug(
@@ -135,7 +169,15 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
             self._remote_tool_catalog = None
         try:
             self._remote_prompt_catalog = CatalogDB(
-                cluster=cluster, bucket=self.bucket, kind="prompt", embedding_model=embedding_model
+                cluster=cluster,
+                bucket=self.bucket,
+                kind="prompt",
+                embedding_model=embedding_model,
+                version_ttl_seconds=self.catalog_version_ttl_seconds,
+                version_cas_invalidation=self.catalog_version_cas_invalidation,
+                replica=self.catalog_replica,
+                replica_snapshot=self.catalog_replica_snapshot,
+                replica_poll_interval_seconds=self.catalog_replica_poll_interval_seconds,
             )
         except pydantic.ValidationError as e:
             logger.debug(
@@ -154,7 +196,11 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
             return self
         if self._local_tool_catalog is not None and self._remote_tool_catalog is not None:
             logger.info("A local catalog and a remote catalog have been found. Building a chained tool catalog.")
-            self._tool_catalog = CatalogChain(self._local_tool_catalog, self._remote_tool_catalog)
+            self._tool_catalog = CatalogChain(
+                self._local_tool_catalog,
+                self._remote_tool_catalog,
+                timeout_seconds=self.catalog_chain_timeout_seconds,
+            )
         elif self._local_tool_catalog is not None:
             logger.info("Only a local catalog has been found. Using the local tool catalog.")
             self._tool_catalog = self._local_tool_catalog
@@ -181,7 +227,11 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
             return self
         if self._local_prompt_catalog is not None and self._remote_prompt_catalog is not None:
             logger.info("A local catalog and a remote catalog have been found. Building a chained prompt catalog.")
-            self._prompt_catalog = CatalogChain(self._local_prompt_catalog, self._remote_prompt_catalog)
+            self._prompt_catalog = CatalogChain(
+                self._local_prompt_catalog,
+                self._remote_prompt_catalog,
+                timeout_seconds=self.catalog_chain_timeout_seconds,
+            )
         elif self._local_prompt_catalog is not None:
             logger.info("Only a local catalog has been found. Using the local prompt catalog.")
             self._prompt_catalog = self._local_prompt_catalog
@@ -208,6 +258,48 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
             )
         return self
 
+    # Note: this must be placed **after** all of our catalogs have been found.
+    @pydantic.model_validator(mode="after")
+    def _warm_up_embedding_models(self) -> typing.Self:
+        self._embedding_model_warm_ups = list()
+        if not self.embedding_model_warm_up:
+            return self
+
+        # Our local and remote catalogs may not share an embedding model instance, so we warm up each instance.
+        embedding_models = dict()
+        for catalog in [
+            self._local_tool_catalog,
+            self._remote_tool_catalog,
+            self._local_prompt_catalog,
+            self._remote_prompt_catalog,
+        ]:
+            if catalog is not None:
+                embedding_models[id(catalog.embedding_model)] = catalog.embedding_model
+        for embedding_model in embedding_models.values():
+            self._embedding_model_warm_ups.append(embedding_model.warm_up())
+        return self
+
+    @property
+    def ready(self) -> bool:
+        """True if our embedding models have been warmed up (see :py:attr:`embedding_model_warm_up`).
+
+        If :py:attr:`embedding_model_warm_up` is not set, this is always True (models are loaded on the first search).
+        """
+        return all(f.done() and f.exception() is None for f in self._embedding_model_warm_ups)
+
+    def wait_until_ready(self, timeout: float = None) -> bool:
+        """Block until our embedding models have been warmed up (e.g., for a readiness health check).
+
+        :param timeout: The maximum number of seconds to wait for (by default, we wait indefinitely).
+        :returns: True if all warm-ups have finished within the timeout, False otherwise.
+        :raises Exception: The error raised while loading an embedding model, if its warm-up has failed.
+        """
+        _, not_done = concurrent.futures.wait(self._embedding_model_warm_ups, timeout=timeout)
+        for future in self._embedding_model_warm_ups:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+        return len(not_done) == 0
+
     @pydantic.computed_field
     @property
     def version(self) -> VersionDescriptor:
@@ -218,16 +310,32 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
 
         # We will take the latest version across all catalogs.
         version_tuples = list()
-        if self._local_tool_catalog is not None:
-            version_tuples += [self._local_tool_catalog.version]
-        if self._remote_tool_catalog is not None and len(self._remote_tool_catalog) > 0:
-            version_tuples += [self._remote_tool_catalog.version]
-        if self._local_prompt_catalog is not None:
-            version_tuples += [self._local_prompt_catalog.version]
-        if self._remote_prompt_catalog is not None and len(self._remote_prompt_catalog) > 0:
-            version_tuples += [self._remote_prompt_catalog.version]
+        for catalog in [self._local_tool_catalog, self._local_prompt_catalog]:
+            if catalog is not None:
+                version_tuples += [catalog.version]
+
+        # Note: we do not count the items of our remote catalogs here (a remote catalog without a published version
+        # raises a LookupError), so each remote catalog costs (at most) one version access.
+        for catalog in [self._remote_tool_catalog, self._remote_prompt_catalog]:
+            if catalog is None:
+                continue
+            try:
+                version_tuples += [catalog.version]
+            except LookupError as e:
+                logger.debug(f"Remote catalog has not been published. Swallowing exception {str(e)}.")
         return sorted(version_tuples, key=lambda x: x.timestamp, reverse=True)[0]
 
+    def refresh(self) -> None:
+        """Discard the cached versions of our remote catalogs, so a newly published catalog is served immediately.
+
+        If our remote catalogs are served from a replica, the latest snapshot is pulled (and swapped in) here.
+
+        Remote catalog versions are otherwise cached for :py:attr:`catalog_version_ttl_seconds`.
+        """
+        for catalog in [self._remote_tool_catalog, self._remote_prompt_catalog]:
+            if catalog is not None:
+                catalog.refresh()
+
     def Span(
         self,
         name: str,
@@ -266,7 +374,7 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
     def find(
         self,
         kind: typing.Literal["tool", "prompt"],
-        query: str = None,
+        query: str | list[str] = None,
         name: str = None,
         annotations: str = None,
         catalog_id: str = LATEST_SNAPSHOT_VERSION,
@@ -295,7 +403,7 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
                 prompt_for_agent = summarize_article_instructions.content
 
         :param kind: The type of item to search for, either 'tool' or 'prompt'.
-        :param query: A query string (natural language) to search the catalog with.
+        :param query: A query string (natural language) to search the catalog with (or a list of query strings).
         :param name: The specific name of the catalog entry to search for.
         :param annotations: An annotation query string in the form of ``KEY="VALUE" (AND|OR KEY="VALUE")*``.
         :param catalog_id: The snapshot version to find the tools for. By default, we use the latest snapshot.
@@ -316,15 +424,17 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
 
     def find_tools(
         self,
-        query: str = None,
+        query: str | list[str] = None,
         name: str = None,
         annotations: str = None,
         catalog_id: str = LATEST_SNAPSHOT_VERSION,
         limit: typing.Union[int | None] = 1,
-    ) -> list[Tool] | Tool | None:
+    ) -> list[list[Tool]] | list[Tool] | Tool | None:
         """Return a list of tools based on the specified search criteria.
 
         :param query: A query string (natural language) to search the catalog with.
+            If a list of query strings is given, all queries are searched for together (in one batch) and a list of
+            results is returned for each query (in the same order).
         :param name: The specific name of the catalog entry to search for.
         :param annotations: An annotation query string in the form of ``KEY="VALUE" (AND|OR KEY="VALUE")*``.
         :param catalog_id: The snapshot version to find the tools for. By default, we use the latest snapshot.
@@ -343,7 +453,11 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
                 "Tool provider has not been initialized. "
                 "Please run 'agentc index [SOURCES] --tools' to define a local FS tool catalog."
             )
-        if query is not None:
+        if isinstance(query, list):
+            return self._tool_provider.find_with_queries(
+                queries=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        elif query is not None:
             return self._tool_provider.find_with_query(
                 query=query, annotations=annotations, snapshot=catalog_id, limit=limit
             )
@@ -352,15 +466,17 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
 
     def find_prompts(
         self,
-        query: str = None,
+        query: str | list[str] = None,
         name: str = None,
         annotations: str = None,
         catalog_id: str = LATEST_SNAPSHOT_VERSION,
         limit: typing.Union[int | None] = 1,
-    ) -> list[Prompt] | Prompt | None:
+    ) -> list[list[Prompt]] | list[Prompt] | Prompt | None:
         """Return a list of prompts based on the specified search criteria.
 
         :param query: A query string (natural language) to search the catalog with.
+            If a list of query strings is given, all queries are searched for together (in one batch) and a list of
+            results is returned for each query (in the same order).
         :param name: The specific name of the catalog entry to search for.
         :param annotations: An annotation query string in the form of ``KEY="VALUE" (AND|OR KEY="VALUE")*``.
         :param catalog_id: The snapshot version to find the tools for. By default, we use the latest snapshot.
@@ -378,9 +494,112 @@ class Catalog(EmbeddingModelConfig, LocalCatalogConfig, RemoteCatalogConfig, Too
                 "Prompt provider has not been initialized. "
                 "Please run 'agentc index [SOURCES] --prompts' to define a local FS catalog with prompts."
             )
-        if query is not None:
+        if isinstance(query, list):
+            return self._prompt_provider.find_with_queries(
+                queries=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        elif query is not None:
             return self._prompt_provider.find_with_query(
                 query=query, annotations=annotations, snapshot=catalog_id, limit=limit
             )
         else:
             return self._prompt_provider.find_with_name(name=name, annotations=annotations, snapshot=catalog_id)
+
+    async def _aconnect(self) -> None:
+        if self._async_cluster_attempted or (self._remote_tool_catalog is None and self._remote_prompt_catalog is None):
+            return
+        if self._async_cluster_lock is None:
+            self._async_cluster_lock = asyncio.Lock()
+        async with self._async_cluster_lock:
+            if self._async_cluster_attempted:
+                return
+            try:
+                self._async_cluster = await self.AsyncCluster()
+                for remote_catalog in [self._remote_tool_catalog, self._remote_prompt_catalog]:
+                    if remote_catalog is not None:
+                        remote_catalog.async_cluster = self._async_cluster
+            except (couchbase.exceptions.CouchbaseException, ValueError) as e:
+                logger.warning(
+                    "Could not connect to the Couchbase cluster (asyncio). "
+                    f"Remote catalogs will be searched on worker threads. Swallowing exception {str(e)}."
+                )
+            self._async_cluster_attempted = True
+
+    async def afind(
+        self,
+        kind: typing.Literal["tool", "prompt"],
+        query: str | list[str] = None,
+        name: str = None,
+        annotations: str = None,
+        catalog_id: str = LATEST_SNAPSHOT_VERSION,
+        limit: typing.Union[int | None] = 1,
+    ) -> list[Tool] | list[Prompt] | Tool | Prompt | None:
+        """An asyncio counterpart of :py:meth:`find` (see :py:meth:`find` for details).
+
+        .. card:: Method Description
+
+            Remote catalogs are searched with an asyncio Couchbase client (``acouchbase``) and queries are encoded
+            without blocking the event loop, so this method can be awaited from async handlers (e.g., FastAPI).
+
+            .. code-block:: python
+
+                results = await catalog.afind(kind="tool", name="get_sentiment_of_text")
+        """
+        if kind.lower() == "tool":
+            return await self.afind_tools(query, name, annotations, catalog_id, limit)
+        elif kind.lower() == "prompt":
+            return await self.afind_prompts(query, name, annotations, catalog_id)
+        else:
+            raise ValueError(f"Unknown item type: {kind}, expected 'tool' or 'prompt'.")
+
+    async def afind_tools(
+        self,
+        query: str | list[str] = None,
+        name: str = None,
+        annotations: str = None,
+        catalog_id: str = LATEST_SNAPSHOT_VERSION,
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[Tool]] | list[Tool] | Tool | None:
+        """An asyncio counterpart of :py:meth:`find_tools` (see :py:meth:`find_tools` for details)."""
+        if self._tool_provider is None:
+            raise RuntimeError(
+                "Tool provider has not been initialized. "
+                "Please run 'agentc index [SOURCES] --tools' to define a local FS tool catalog."
+            )
+        await self._aconnect()
+        if isinstance(query, list):
+            return await self._tool_provider.afind_with_queries(
+                queries=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        elif query is not None:
+            return await self._tool_provider.afind_with_query(
+                query=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        else:
+            return await self._tool_provider.afind_with_name(name=name, annotations=annotations, snapshot=catalog_id)
+
+    async def afind_prompts(
+        self,
+        query: str | list[str] = None,
+        name: str = None,
+        annotations: str = None,
+        catalog_id: str = LATEST_SNAPSHOT_VERSION,
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[Prompt]] | list[Prompt] | Prompt | None:
+        """An asyncio counterpart of :py:meth:`find_prompts` (see :py:meth:`find_prompts` for details)."""
+        if self._prompt_provider is None:
+            raise RuntimeError(
+                "Prompt provider has not been initialized. "
+                "Please run 'agentc index [SOURCES] --prompts' to define a local FS catalog with prompts."
+            )
+        await self._aconnect()
+        if isinstance(query, list):
+            return await self._prompt_provider.afind_with_queries(
+                queries=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        elif query is not None:
+            return await self._prompt_provider.afind_with_query(
+                query=query, annotations=annotations, snapshot=catalog_id, limit=limit
+            )
+        else:
+            return await self._prompt_provider.afind_with_name(name=name, annotations=annotations, snapshot=catalog_id)
@@ -1,16 +1,22 @@
 import enum
+import hashlib
 import jsbeautifier
 import json
+import pathlib
 import pydantic
 import typing
 
+from ..defaults import DEFAULT_CATALOG_ITEM_KEY_MAX_BYTES
 from ..prompt.models import PromptDescriptor
 from ..record.descriptor import BEAUTIFY_OPTS
+from ..record.descriptor import RecordKind
+from ..record.descriptor import record_identifier
 from ..tool.descriptor.models import HTTPRequestToolDescriptor
 from ..tool.descriptor.models import PythonToolDescriptor
 from ..tool.descriptor.models import SemanticSearchToolDescriptor
 from ..tool.descriptor.models import SQLPPQueryToolDescriptor
 from ..version import VersionDescriptor
+from .quantization import EmbeddingQuantization
 from agentc_core.learned.model import EmbeddingModel
 
 
@@ -19,6 +25,17 @@ class CatalogKind(enum.StrEnum):
     Prompt = "prompt"
 
 
+def catalog_item_key(catalog_identifier: str, kind: str, name: str) -> str:
+    """Returns the (deterministic) document key of a published catalog item, given its catalog version, kind, and name.
+
+    Keys are limited in length, so the names of keys that would be too long are hashed.
+    """
+    key = f"{catalog_identifier}/{kind}/{name}"
+    if len(key.encode("utf-8")) > DEFAULT_CATALOG_ITEM_KEY_MAX_BYTES:
+        key = f"{catalog_identifier}/{kind}/{hashlib.sha256(name.encode('utf-8')).hexdigest()}"
+    return key
+
+
 RecordDescriptorUnionType = typing.Annotated[
     PythonToolDescriptor
     | SQLPPQueryToolDescriptor
@@ -29,6 +46,27 @@ RecordDescriptorUnionType = typing.Annotated[
 ]
 
 
+class RecordDescriptorStub(pydantic.BaseModel):
+    """The search-relevant fields of a catalog item (used to load a catalog without validating every item in full).
+
+    Embeddings are not held here (these are read directly into the catalog's embedding matrix).
+    """
+
+    model_config = pydantic.ConfigDict(use_enum_values=True, extra="ignore")
+
+    record_kind: RecordKind
+    name: str
+    description: str
+    source: pathlib.Path
+    version: VersionDescriptor
+    annotations: typing.Optional[dict[str, str]] = None
+    embedding_row: typing.Optional[int] = None
+
+    @property
+    def identifier(self) -> str:
+        return record_identifier(self.source, self.name, self.version)
+
+
 class CatalogDescriptor(pydantic.BaseModel):
     """This model represents a persistable tool/prompt catalog for local and in-memory catalog representations."""
 
@@ -58,6 +96,23 @@ class CatalogDescriptor(pydantic.BaseModel):
 
     items: list[RecordDescriptorUnionType] = pydantic.Field(description="The entries in the catalog.")
 
+    blobs: typing.Optional[dict[str, str]] = pydantic.Field(
+        default=None,
+        description="The raw contents of each source file referenced by the catalog items, keyed by content hash.",
+    )
+
+    embedding_file: typing.Optional[str] = pydantic.Field(
+        default=None,
+        description="Name of the .npy file (next to the catalog file) holding the embeddings of all items. "
+        "If unset, each item holds its own embedding.",
+    )
+
+    embedding_quantization: typing.Optional[EmbeddingQuantization] = pydantic.Field(
+        default=None,
+        description="If set, quantized (float16 or int8) unit-length embeddings are stored next to the (float32) "
+        "embedding file.",
+    )
+
     def __str__(self):
         return jsbeautifier.beautify(
             json.dumps(
@@ -0,0 +1,131 @@
+import logging
+import numpy
+import pathlib
+import typing
+
+from ..defaults import DEFAULT_EMBEDDING_CODES_FILE_SUFFIX
+from ..defaults import DEFAULT_EMBEDDING_FILE_SUFFIX
+from ..defaults import DEFAULT_EMBEDDING_SCALES_FILE_SUFFIX
+from .descriptor import CatalogDescriptor
+from .quantization import EmbeddingQuantization
+from .quantization import QuantizedEmbeddings
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_file_path(catalog_path: pathlib.Path) -> pathlib.Path:
+    """Returns the path of the embedding (sidecar) file that accompanies the given catalog file."""
+    return catalog_path.with_suffix(DEFAULT_EMBEDDING_FILE_SUFFIX)
+
+
+def embedding_codes_file_path(catalog_path: pathlib.Path) -> pathlib.Path:
+    """Returns the path of the quantized embedding (codes) file that accompanies the given catalog file."""
+    return catalog_path.with_suffix(DEFAULT_EMBEDDING_CODES_FILE_SUFFIX)
+
+
+def embedding_scales_file_path(catalog_path: pathlib.Path) -> pathlib.Path:
+    """Returns the path of the (int8) embedding scales file that accompanies the given catalog file."""
+    return catalog_path.with_suffix(DEFAULT_EMBEDDING_SCALES_FILE_SUFFIX)
+
+
+def dump_embeddings(
+    catalog_path: pathlib.Path, matrix: numpy.ndarray, quantization: typing.Optional[EmbeddingQuantization] = None
+) -> str:
+    """Writes a (items x dimension) matrix of embeddings as a contiguous .npy file next to catalog_path.
+
+    Embeddings are always written as float32.
+    If quantization is specified, the normalized rows of matrix are also written as float16 or int8 codes to a second
+    file (and the scale of each int8 row to a third file).
+    Returns the name of the embedding file (relative to the catalog file's folder).
+    """
+    path = embedding_file_path(catalog_path)
+    codes_path, scales_path = embedding_codes_file_path(catalog_path), embedding_scales_file_path(catalog_path)
+    matrix = numpy.ascontiguousarray(matrix, dtype=numpy.float32)
+    with path.open("wb") as fp:
+        numpy.save(fp, matrix, allow_pickle=False)
+
+    quantized = None
+    if quantization is not None:
+        norms = numpy.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        quantized = QuantizedEmbeddings.quantize(matrix / norms, quantization)
+        with codes_path.open("wb") as fp:
+            numpy.save(fp, quantized.codes, allow_pickle=False)
+    else:
+        codes_path.unlink(missing_ok=True)
+    if quantized is not None and quantized.scales is not None:
+        with scales_path.open("wb") as fp:
+            numpy.save(fp, quantized.scales, allow_pickle=False)
+    else:
+        scales_path.unlink(missing_ok=True)
+    return path.name
+
+
+def remove_embeddings(catalog_path: pathlib.Path) -> None:
+    """Removes the embedding, codes, and scales files (if any) that accompany the given catalog file."""
+    for path in [
+        embedding_file_path(catalog_path),
+        embedding_codes_file_path(catalog_path),
+        embedding_scales_file_path(catalog_path),
+    ]:
+        path.unlink(missing_ok=True)
+
+
+def _align(
+    matrix: numpy.ndarray, path: pathlib.Path, catalog_path: pathlib.Path, catalog_descriptor: CatalogDescriptor
+) -> numpy.ndarray:
+    rows = [item.embedding_row for item in catalog_descriptor.items]
+    if any(row is None or not 0 <= row < len(matrix) for row in rows):
+        raise ValueError(f"Catalog {catalog_path} has item(s) without a valid row in embedding file {path}.")
+    if rows == list(range(len(matrix))):
+        return matrix
+    logger.debug("Rows of embedding file %s are not aligned with the catalog items. Copying embeddings.", str(path))
+    return numpy.asarray(matrix[numpy.array(rows, dtype=numpy.int64)])
+
+
+def load_embeddings(catalog_path: pathlib.Path, catalog_descriptor: CatalogDescriptor) -> numpy.ndarray:
+    """Returns a (memory-mapped) matrix whose i-th row is the embedding of the i-th catalog item.
+
+    The embedding file is mapped read-only, so processes that load the same catalog share its pages (through the OS
+    page cache). A copy is only made if the rows of the embedding file are not in the same order as the items.
+    """
+    path = catalog_path.parent / catalog_descriptor.embedding_file
+    matrix = numpy.load(path, mmap_mode="r", allow_pickle=False)
+    if matrix.ndim != 2 or matrix.dtype != numpy.float32:
+        raise ValueError(f"Embedding file {path} must hold a 2D float32 matrix (found {matrix.dtype} {matrix.shape}).")
+    return _align(matrix, path, catalog_path, catalog_descriptor)
+
+
+def load_quantized_embeddings(catalog_path: pathlib.Path, catalog_descriptor: CatalogDescriptor) -> QuantizedEmbeddings:
+    """Returns the (item-aligned) quantized embeddings of a catalog that stores float16 or int8 codes.
+
+    Quantized embeddings are read into memory (these are scanned in full on each search), while the float32 embeddings
+    of the same catalog stay memory-mapped (see :py:func:`load_embeddings`).
+    """
+    path = embedding_codes_file_path(catalog_path)
+    quantization = catalog_descriptor.embedding_quantization
+    codes = numpy.load(path, allow_pickle=False)
+    expected_dtype = numpy.float16 if quantization == "float16" else numpy.int8
+    if codes.ndim != 2 or codes.dtype != expected_dtype:
+        raise ValueError(
+            f"Embedding codes file {path} must hold a 2D {quantization} matrix (found {codes.dtype} {codes.shape})."
+        )
+    scales = None
+    if quantization == "int8":
+        scales_path = embedding_scales_file_path(catalog_path)
+        scales = numpy.load(scales_path, allow_pickle=False)
+        if scales.shape != (len(codes),):
+            raise ValueError(f"Embedding scales file {scales_path} does not match embedding codes file {path}.")
+        scales = _align(scales, scales_path, catalog_path, catalog_descriptor)
+    return QuantizedEmbeddings(
+        quantization=quantization,
+        codes=_align(codes, path, catalog_path, catalog_descriptor),
+        scales=scales,
+    )
+
+
+def hydrate_embeddings(catalog_descriptor: CatalogDescriptor, matrix: numpy.ndarray) -> None:
+    """Copies each (item-aligned) row of matrix into the embedding field of the corresponding catalog item."""
+    for item, embedding in zip(catalog_descriptor.items, matrix, strict=True):
+        if not item.embedding:
+            item.embedding = embedding.tolist()
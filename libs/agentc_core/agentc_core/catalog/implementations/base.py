@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import math
 import pydantic
 import typing
@@ -35,6 +36,57 @@ class CatalogBase(abc.ABC):
         """Returns the catalog items that best match a query."""
         raise NotImplementedError("CatalogBase.find()")
 
+    def find_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """Returns the catalog items that best match each query (one list of results per query, in order)."""
+        return [self.find(query=q, snapshot=snapshot, limit=limit, annotations=annotations) for q in queries]
+
+    def find_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        """Returns the catalog item with each name (one list of results per name, in order)."""
+        return [self.find(name=name, snapshot=snapshot, limit=1) for name in names]
+
+    async def afind(
+        self,
+        query: str = None,
+        name: str = None,
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        """An asyncio counterpart of find(). By default, find() is run on a worker thread."""
+        return await asyncio.to_thread(
+            self.find, query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations
+        )
+
+    async def afind_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """An asyncio counterpart of find_many(). By default, find_many() is run on a worker thread."""
+        return await asyncio.to_thread(
+            self.find_many, queries=queries, snapshot=snapshot, limit=limit, annotations=annotations
+        )
+
+    async def afind_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        """An asyncio counterpart of find_names(). By default, find_names() is run on a worker thread."""
+        return await asyncio.to_thread(self.find_names, names=names, snapshot=snapshot)
+
+    def refresh(self) -> None:
+        """Discards any state cached about the catalog (e.g., its version). By default, nothing is cached."""
+        return None
+
+    def resolve_blob(self, key: str) -> typing.Optional[str]:
+        """Returns the raw contents referenced by a catalog item's raw_ref (or None if the blob cannot be found)."""
+        return None
+
     @abc.abstractmethod
     def __iter__(self) -> typing.Iterator[RecordDescriptor]:
         raise NotImplementedError("CatalogBase.__iter__()")
@@ -1,20 +1,88 @@
+import asyncio
+import concurrent.futures
+import logging
+import time
 import typing
 
 from ...annotation import AnnotationPredicate
+from ...defaults import DEFAULT_CATALOG_CHAIN_TIMEOUT_SECONDS
 from ...version import VersionDescriptor
 from .base import CatalogBase
 from .base import SearchResult
 from agentc_core.record.descriptor import RecordDescriptor
 
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
 
 class CatalogChain(CatalogBase):
-    """Represents a chain of catalogs, where all catalogs are searched
-    during find(), but results from earlier catalogs take precedence."""
+    """Represents a chain of catalogs, where all catalogs are searched (concurrently)
+    during find(), but results from earlier catalogs take precedence.
+
+    Catalogs (other than the first) that do not respond within timeout_seconds are skipped (a value of None waits for
+    every catalog)."""
 
     chain: list[CatalogBase]
+    timeout_seconds: typing.Optional[float]
 
-    def __init__(self, *chain: CatalogBase):
+    def __init__(
+        self, *chain: CatalogBase, timeout_seconds: typing.Optional[float] = DEFAULT_CATALOG_CHAIN_TIMEOUT_SECONDS
+    ):
         self.chain = chain if chain is not None else []
+        self.timeout_seconds = timeout_seconds
+
+    def _fan_out(self, search: typing.Callable[[CatalogBase], T], on_timeout: typing.Callable[[], T]) -> list[T]:
+        # The rest of our catalogs are searched on their own threads, so our latency is that of our slowest catalog
+        # (not their sum). Our first (i.e., local) catalog is searched on the calling thread.
+        if len(self.chain) <= 1:
+            return [search(c) for c in self.chain]
+        start = time.monotonic()
+
+        # Note: a search that misses our deadline keeps running (running threads cannot be cancelled), so each call
+        # has its own executor (a hung search must never hold a worker that a later call is waiting on).
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.chain) - 1, thread_name_prefix="agentc-catalog-chain"
+        )
+        try:
+            futures = [executor.submit(search, c) for c in self.chain[1:]]
+            results = [search(self.chain[0])]
+            timeout = (
+                None if self.timeout_seconds is None else max(0.0, start + self.timeout_seconds - time.monotonic())
+            )
+            _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for catalog, future in zip(self.chain[1:], futures, strict=True):
+            if future in not_done:
+                logger.warning(
+                    f"{type(catalog).__name__} did not respond within {self.timeout_seconds} seconds. "
+                    "Skipping its results."
+                )
+                results.append(on_timeout())
+            else:
+                results.append(future.result())
+        return results
+
+    async def _afan_out(
+        self, search: typing.Callable[[CatalogBase], typing.Awaitable[T]], on_timeout: typing.Callable[[], T]
+    ) -> list[T]:
+        # Like _fan_out, our first (i.e., local) catalog is always waited for (only the rest have a deadline).
+        if len(self.chain) == 0:
+            return list()
+
+        async def _search(catalog: CatalogBase) -> T:
+            try:
+                return await asyncio.wait_for(search(catalog), timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"{type(catalog).__name__} did not respond within {self.timeout_seconds} seconds. "
+                    "Skipping its results."
+                )
+                return on_timeout()
+
+        return list(await asyncio.gather(search(self.chain[0]), *[_search(c) for c in self.chain[1:]]))
 
     def find(
         self,
@@ -24,13 +92,71 @@ class CatalogChain(CatalogBase):
         limit: typing.Union[int | None] = 1,
         annotations: AnnotationPredicate = None,
     ) -> list[SearchResult]:
+        results_per_catalog = self._fan_out(
+            lambda c: c.find(query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations),
+            on_timeout=list,
+        )
+        return self._merge(results_per_catalog, limit)
+
+    def find_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        results_per_catalog = self._fan_out(
+            lambda c: c.find_many(queries=queries, snapshot=snapshot, limit=limit, annotations=annotations),
+            on_timeout=lambda: [[] for _ in queries],
+        )
+        return [self._merge([r[i] for r in results_per_catalog], limit) for i in range(len(queries))]
+
+    async def afind(
+        self,
+        query: str = None,
+        name: str = None,
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        results_per_catalog = await self._afan_out(
+            lambda c: c.afind(query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations),
+            on_timeout=list,
+        )
+        return self._merge(results_per_catalog, limit)
+
+    async def afind_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        results_per_catalog = await self._afan_out(
+            lambda c: c.afind_many(queries=queries, snapshot=snapshot, limit=limit, annotations=annotations),
+            on_timeout=lambda: [[] for _ in queries],
+        )
+        return [self._merge([r[i] for r in results_per_catalog], limit) for i in range(len(queries))]
+
+    def find_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        results_per_catalog = self._fan_out(
+            lambda c: c.find_names(names=names, snapshot=snapshot), on_timeout=lambda: [[] for _ in names]
+        )
+        return [self._merge([r[i] for r in results_per_catalog], 1) for i in range(len(names))]
+
+    async def afind_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        results_per_catalog = await self._afan_out(
+            lambda c: c.afind_names(names=names, snapshot=snapshot), on_timeout=lambda: [[] for _ in names]
+        )
+        return [self._merge([r[i] for r in results_per_catalog], 1) for i in range(len(names))]
+
+    @staticmethod
+    def _merge(results_per_catalog: list[list[SearchResult]], limit: typing.Union[int | None]) -> list[SearchResult]:
         results = []
 
         seen = set()  # Keyed by 'source:name'.
 
-        for c in self.chain:
-            results_c = c.find(query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations)
-
+        for results_c in results_per_catalog:
             for x in results_c:
                 source_name = str(x.entry.source) + ":" + x.entry.name
 
@@ -38,17 +164,30 @@ class CatalogChain(CatalogBase):
                     seen.add(source_name)
                     results.append(x)
 
-        if limit > 0:
+        # Results are merged by their distance to the query (ties are broken in chain order).
+        results.sort(key=lambda x: x.delta, reverse=True)
+        if limit is not None and limit > 0:
             results = results[:limit]
 
         return results
 
+    def refresh(self) -> None:
+        for catalog in self.chain:
+            catalog.refresh()
+
+    def resolve_blob(self, key: str) -> typing.Optional[str]:
+        for catalog in self.chain:
+            content = catalog.resolve_blob(key)
+            if content is not None:
+                return content
+        return None
+
     def __iter__(self) -> typing.Iterator[RecordDescriptor]:
         """Returns unique catalog items after aggregating results from both local,db and removing duplicates."""
         seen = set()  # Keyed by 'source:name'
         for catalog in self.chain:
-            catalog_items = list(catalog)
-            for item in catalog_items:
+            # Items are streamed from each catalog (so a remote catalog is never held in memory at once).
+            for item in catalog:
                 source_name = str(item.source) + ":" + item.name
                 if source_name not in seen:
                     seen.add(source_name)
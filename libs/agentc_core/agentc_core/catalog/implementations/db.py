@@ -1,25 +1,44 @@
+import acouchbase.cluster
+import asyncio
+import concurrent.futures
 import couchbase.cluster
-import json
+import couchbase.exceptions
+import couchbase.subdocument
 import logging
 import math
 import pydantic
 import re
+import threading
 import typing
 
 from agentc_core.annotation import AnnotationPredicate
+from agentc_core.catalog.descriptor import CatalogDescriptor
 from agentc_core.catalog.descriptor import CatalogKind
+from agentc_core.catalog.descriptor import catalog_item_key
 from agentc_core.catalog.implementations.base import CatalogBase
 from agentc_core.catalog.implementations.base import SearchResult
+from agentc_core.catalog.implementations.mem import CatalogMem
 from agentc_core.config import LATEST_SNAPSHOT_VERSION
+from agentc_core.defaults import DEFAULT_CATALOG_BLOB_COLLECTION
+from agentc_core.defaults import DEFAULT_CATALOG_FIND_MANY_MAX_WORKERS
+from agentc_core.defaults import DEFAULT_CATALOG_KNN_MAX_CANDIDATES
+from agentc_core.defaults import DEFAULT_CATALOG_KNN_MIN_CANDIDATES
+from agentc_core.defaults import DEFAULT_CATALOG_KNN_OVERSAMPLING
+from agentc_core.defaults import DEFAULT_CATALOG_LATEST_VERSION_KEY
 from agentc_core.defaults import DEFAULT_CATALOG_METADATA_COLLECTION
+from agentc_core.defaults import DEFAULT_CATALOG_PAGE_SIZE
 from agentc_core.defaults import DEFAULT_CATALOG_PROMPT_COLLECTION
+from agentc_core.defaults import DEFAULT_CATALOG_REPLICA_POLL_INTERVAL_SECONDS
 from agentc_core.defaults import DEFAULT_CATALOG_SCOPE
 from agentc_core.defaults import DEFAULT_CATALOG_TOOL_COLLECTION
+from agentc_core.defaults import DEFAULT_CATALOG_VERSION_TTL_SECONDS
+from agentc_core.learned.cache import LRUCache
 from agentc_core.learned.embedding import EmbeddingModel
 from agentc_core.prompt.models import PromptDescriptor
 from agentc_core.record.descriptor import RecordDescriptor
 from agentc_core.record.descriptor import RecordKind
-from agentc_core.remote.util.query import execute_query
+from agentc_core.remote.util.ddl import VECTOR_INDEX_FILTER_PROPERTIES
+from agentc_core.remote.util.query import aexecute_query_with_parameters
 from agentc_core.remote.util.query import execute_query_with_parameters
 from agentc_core.remote.util.query import quote_sql_keyspace
 from agentc_core.tool.descriptor import HTTPRequestToolDescriptor
@@ -27,6 +46,8 @@ from agentc_core.tool.descriptor import PythonToolDescriptor
 from agentc_core.tool.descriptor import SemanticSearchToolDescriptor
 from agentc_core.tool.descriptor import SQLPPQueryToolDescriptor
 from agentc_core.version import VersionDescriptor
+from couchbase.exceptions import CollectionNotFoundException
+from couchbase.exceptions import DocumentNotFoundException
 from couchbase.exceptions import KeyspaceNotFoundException
 from couchbase.exceptions import ScopeNotFoundException
 
@@ -50,6 +71,18 @@ def _descriptor_from_row(row: dict[str, typing.Any]) -> RecordDescriptor:
             raise LookupError(f"Unknown record encountered of kind = '{kind}'!")
 
 
+# Items fetched by query leave their embeddings and (inline) raw contents on the cluster. The inline raw contents of
+# catalogs published before raw contents were deduplicated are then referenced by item key (see resolve_blob()).
+_ITEM_RAW_REF_PREFIX = "item:"
+
+
+def _item_projection(alias: str, key_expression: str) -> str:
+    return (
+        f'OBJECT_PUT(OBJECT_REMOVE(OBJECT_REMOVE({alias}, "embedding"), "raw"), "raw_ref", '
+        f'CASE WHEN {alias}.raw IS VALUED THEN "{_ITEM_RAW_REF_PREFIX}" || {key_expression} ELSE {alias}.raw_ref END)'
+    )
+
+
 _VALID_INDEX_NAME_RE = re.compile(r"^[A-Za-z0-9_.:-]{1,256}$")
 
 
@@ -61,7 +94,7 @@ def _sanitize_search_index_name(index_name: str) -> str:
     return index_name
 
 
-def _serialize_query_embeddings(query_embeddings: list[typing.Any]) -> str:
+def _clean_query_embeddings(query_embeddings: list[typing.Any]) -> list[float]:
     if not isinstance(query_embeddings, list) or len(query_embeddings) == 0:
         raise ValueError("query_embeddings must be a non-empty list")
 
@@ -73,8 +106,7 @@ def _serialize_query_embeddings(query_embeddings: list[typing.Any]) -> str:
         if not math.isfinite(embedding_value):
             raise ValueError("query_embeddings cannot contain NaN or Infinity")
         cleaned_embeddings.append(embedding_value)
-    # JSON serialization produces a safe SQL++ array literal.
-    return json.dumps(cleaned_embeddings, separators=(",", ":"))
+    return cleaned_embeddings
 
 
 class CatalogDB(pydantic.BaseModel, CatalogBase):
@@ -87,15 +119,203 @@ class CatalogDB(pydantic.BaseModel, CatalogBase):
     bucket: str
     kind: typing.Literal["tool", "prompt"]
 
+    # If set, afind() and afind_many() issue their statements on this (acouchbase) cluster.
+    # Otherwise, these run their synchronous counterparts on a worker thread.
+    async_cluster: typing.Optional[acouchbase.cluster.Cluster] = None
+
+    # Our resolved version (and item count) are cached for version_ttl_seconds (None caches these until refresh() is
+    # called, and 0 disables caching). If version_cas_invalidation is set, each access also checks (with a KV get) the
+    # CAS of the "latest" metadata document touched by 'agentc publish', so a new catalog version is seen immediately.
+    version_ttl_seconds: typing.Optional[float] = pydantic.Field(default=DEFAULT_CATALOG_VERSION_TTL_SECONDS, ge=0)
+    version_cas_invalidation: bool = False
+
+    # If replica is set, the items of our snapshot (replica_snapshot, or the latest snapshot if this is not set) are
+    # pulled into an in-process CatalogMem, and finds on this snapshot are served from memory. Unless a snapshot has
+    # been pinned, a background thread polls our metadata every replica_poll_interval_seconds and swaps in each new
+    # snapshot (only the items that have changed between snapshots are fetched).
+    replica: bool = False
+    replica_snapshot: typing.Optional[str] = None
+    replica_poll_interval_seconds: typing.Optional[float] = pydantic.Field(
+        default=DEFAULT_CATALOG_REPLICA_POLL_INTERVAL_SECONDS, gt=0
+    )
+
+    # Our kNN clause asks for limit * knn_oversampling candidates (bounded by knn_max_candidates). If our vector index
+    # cannot filter on our snapshot and annotations itself (i.e., it was created before these fields were indexed),
+    # candidates are filtered afterwards, and our oversampling grows whenever such a search comes back short.
+    knn_oversampling: float = pydantic.Field(default=DEFAULT_CATALOG_KNN_OVERSAMPLING, ge=1)
+    knn_max_candidates: int = pydantic.Field(default=DEFAULT_CATALOG_KNN_MAX_CANDIDATES, gt=0)
+
+    # Items are iterated over in pages of (at most) page_size items.
+    page_size: int = pydantic.Field(default=DEFAULT_CATALOG_PAGE_SIZE, gt=0)
+
+    _version_cache: typing.Optional[LRUCache[str, typing.Any]] = None
+    _version_cas: typing.Optional[int] = None
+
+    # Marks (per thread) that the CAS of our "latest" document has been checked by an enclosing access.
+    _version_cas_check: typing.Optional[threading.local] = None
+
+    # Our replica is never mutated in place (new snapshots are swapped in), so readers need no lock.
+    _replica: typing.Optional[CatalogMem] = None
+    _replica_stop: typing.Optional[threading.Event] = None
+
+    _knn_prefilter: bool = False
+    _knn_post_filter_oversampling: typing.Optional[float] = None
+
     @pydantic.model_validator(mode="after")
     def _cluster_should_be_reachable(self) -> "CatalogDB":
         collection = DEFAULT_CATALOG_TOOL_COLLECTION if self.kind == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
         keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, collection)
         try:
             self.cluster.query(f"FROM {keyspace} SELECT 1 LIMIT 1;").execute()
-            return self
         except (ScopeNotFoundException, KeyspaceNotFoundException) as e:
             raise ValueError("Catalog does not exist! Please run 'agentc publish' first.") from e
+        if self._version_cache is None:
+            # Note: a TTL of 0 disables our cache (an empty cache never holds an entry, so it needs no TTL).
+            if self.version_ttl_seconds == 0:
+                self._version_cache = LRUCache(max_size=0)
+            else:
+                self._version_cache = LRUCache(max_size=2, ttl_seconds=self.version_ttl_seconds)
+        if self._version_cas_check is None:
+            self._version_cas_check = threading.local()
+        if self._knn_post_filter_oversampling is None:
+            self._knn_post_filter_oversampling = self.knn_oversampling
+            self._knn_prefilter = self._vector_index_can_prefilter()
+        return self
+
+    def _vector_index_name(self) -> str:
+        # In the future, we may need to condition on the catalog schema version.
+        return f"v2_AgentCatalog{self.kind.capitalize()}sEmbeddingIndex"
+
+    def _vector_index_can_prefilter(self) -> bool:
+        try:
+            scope = self.cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            index = scope.search_indexes().get_index(self._vector_index_name())
+            properties = index.params["mapping"]["types"][f"{DEFAULT_CATALOG_SCOPE}.{self._items_collection_name()}"]
+            return all(x in properties["properties"] for x in VECTOR_INDEX_FILTER_PROPERTIES)
+        except (couchbase.exceptions.CouchbaseException, KeyError, TypeError) as e:
+            logger.debug(f"Could not inspect the {self.kind} vector index. Swallowing exception {str(e)}.")
+            return False
+
+    @pydantic.model_validator(mode="after")
+    def _replica_should_be_pulled(self) -> "CatalogDB":
+        if not self.replica or self._replica is not None:
+            return self
+        try:
+            snapshot = self.replica_snapshot or self._query_version().identifier
+            self._replica = self._pull_replica(snapshot)
+        except (LookupError, couchbase.exceptions.CouchbaseException) as e:
+            raise ValueError(f"Could not pull a replica of the {self.kind} catalog!\n{str(e)}") from e
+        if self.replica_snapshot is None and self.replica_poll_interval_seconds is not None:
+            self._replica_stop = threading.Event()
+            threading.Thread(target=self._poll_replica, name=f"agentc-{self.kind}-replica", daemon=True).start()
+        return self
+
+    def _pull_replica(self, snapshot: str, previous: CatalogMem = None) -> CatalogMem:
+        # Our catalog metadata is keyed by snapshot and kind (see 'agentc publish').
+        try:
+            scope = self.cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            metadata_collection = scope.collection(DEFAULT_CATALOG_METADATA_COLLECTION)
+            metadata = metadata_collection.get(f"{snapshot}/{self.kind}").content_as[dict]
+        except couchbase.exceptions.DocumentNotFoundException as e:
+            raise LookupError(f"Catalog snapshot '{snapshot}' not found for kind = '{self.kind}'!") from e
+
+        # Items that have not changed since our previous snapshot keep their identifier, so we only fetch new items.
+        reused = {item.identifier: item for item in previous} if previous is not None else dict()
+        identifiers_query = f"""
+            FROM {self._items_keyspace()} AS t
+            WHERE t.catalog_identifier = $snapshot
+            SELECT RAW t.identifier;
+        """
+        identifiers = self._replica_rows(identifiers_query, {"snapshot": snapshot})
+        missing = [identifier for identifier in identifiers if identifier not in reused]
+        fetched = dict()
+        if len(missing) > 0:
+            items_query = f"""
+                FROM {self._items_keyspace()} AS t
+                WHERE t.catalog_identifier = $snapshot AND t.identifier IN $identifiers
+                SELECT t.*;
+            """
+            for row in self._replica_rows(items_query, {"snapshot": snapshot, "identifiers": missing}):
+                descriptor = _descriptor_from_row(row)
+                fetched[descriptor.identifier] = descriptor
+        logger.debug(
+            f"Pulled {len(fetched)} new item(s) (and reused {len(identifiers) - len(missing)} item(s)) "
+            f"into the replica of the {self.kind} catalog snapshot {snapshot}."
+        )
+
+        catalog_descriptor = CatalogDescriptor.model_validate(metadata | {"items": list()})
+        catalog_descriptor.items = [reused.get(x) or fetched[x] for x in identifiers if x in reused or x in fetched]
+        replica = CatalogMem(embedding_model=self.embedding_model, catalog_descriptor=catalog_descriptor)
+
+        # Our embedding matrix and annotation index are built here (i.e., not by the first find after a swap).
+        replica._build_embedding_matrix()
+        replica._build_annotation_index()
+        return replica
+
+    def _replica_rows(self, sqlpp_query: str, params: dict[str, typing.Any]) -> list:
+        res, err = execute_query_with_parameters(self.cluster, sqlpp_query, params, adhoc=False)
+        if err is not None:
+            raise err
+        return list(res)
+
+    def _refresh_replica(self):
+        version = self._query_version()
+        if version.identifier != self._replica.version.identifier:
+            logger.debug(f"Swapping in the {self.kind} catalog snapshot {version.identifier}.")
+            self._replica = self._pull_replica(version.identifier, previous=self._replica)
+
+    def _poll_replica(self):
+        while not self._replica_stop.wait(self.replica_poll_interval_seconds):
+            try:
+                self._refresh_replica()
+            except (LookupError, pydantic.ValidationError, couchbase.exceptions.CouchbaseException) as e:
+                logger.warning(f"Could not refresh the {self.kind} catalog replica. Swallowing exception {str(e)}.")
+
+    def _replica_for(self, snapshot: typing.Optional[str]) -> typing.Optional[CatalogMem]:
+        # Our replica serves both its own snapshot and (as it is the latest snapshot we know of) the latest snapshot.
+        replica = self._replica
+        if replica is not None and snapshot in {LATEST_SNAPSHOT_VERSION, replica.version.identifier}:
+            return replica
+        return None
+
+    def close(self) -> None:
+        """Stops the background thread that polls for new snapshots (if this catalog is an unpinned replica)."""
+        if self._replica_stop is not None:
+            self._replica_stop.set()
+
+    def _items_collection_name(self) -> str:
+        return DEFAULT_CATALOG_TOOL_COLLECTION if self.kind == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
+
+    def _items_keyspace(self) -> str:
+        return quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, self._items_collection_name())
+
+    def _name_result(
+        self, name: str, content: typing.Optional[dict], err: Exception
+    ) -> typing.Optional[list[SearchResult]]:
+        if isinstance(err, couchbase.exceptions.DocumentNotFoundException):
+            # Items published before our keys were deterministic must be found with a query.
+            return None
+        elif err is not None:
+            logger.debug(f"Could not fetch catalog item {name} by key. Swallowing exception {str(err)}.")
+            return None
+        return [SearchResult(entry=_descriptor_from_row(content), delta=1)]
+
+    def _name_statement(self, name: str, snapshot: str) -> tuple[str, dict[str, typing.Any]]:
+        sqlpp_query = f"""
+            FROM {self._items_keyspace()} AS a
+            WHERE a.name = $name AND a.catalog_identifier = $snapshot
+            SELECT RAW {_item_projection("a", "META(a).id")};
+        """
+        return sqlpp_query, {"name": name, "snapshot": snapshot}
+
+    def _name_results(self, rows: typing.Optional[list[dict]], err: Exception, sqlpp_query: str) -> list[SearchResult]:
+        if err is not None:
+            logger.debug(err)
+            return []
+        if len(rows) == 0:
+            logger.debug(f"No catalog items found using the SQL++ query: {sqlpp_query}")
+            return []
+        return [SearchResult(entry=_descriptor_from_row(rows[0]), delta=1)]
 
     def find(
         self,
@@ -106,165 +326,492 @@ class CatalogDB(pydantic.BaseModel, CatalogBase):
         annotations: AnnotationPredicate = None,
     ) -> list[SearchResult]:
         """Returns the catalog items that best match a query."""
-        collection = DEFAULT_CATALOG_TOOL_COLLECTION if self.kind == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
-        sqlpp_query = None
+        if (replica := self._replica_for(snapshot)) is not None:
+            return replica.find(
+                query=query, name=name, snapshot=LATEST_SNAPSHOT_VERSION, limit=limit, annotations=annotations
+            )
 
-        # Catalog item has to be queried directly
+        # Catalog item has to be fetched directly
         if name is not None:
-            if snapshot == LATEST_SNAPSHOT_VERSION:
-                snapshot = self.version.identifier
-            keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, collection)
-            sqlpp_query = f"""
-                FROM {keyspace} AS a
-                WHERE a.name = $name AND a.catalog_identifier = $snapshot
-                SELECT a.*;
-            """
-            res, err = execute_query_with_parameters(self.cluster, sqlpp_query, {"name": name, "snapshot": snapshot})
-            if err is not None:
-                logger.debug(err)
-                return []
-            query_embeddings = None
+            return self.find_names([name], snapshot=snapshot)[0]
+
+        # Generate embeddings for user query
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            snapshot = self.version.identifier
+        return self._find_with_embedding(self.embedding_model.encode(query), snapshot, limit, annotations)
+
+    def find_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """Returns the catalog items that best match each query (one list of results per query, in order)."""
+        if (replica := self._replica_for(snapshot)) is not None:
+            return replica.find_many(
+                queries=queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=limit, annotations=annotations
+            )
+        if len(queries) == 0:
+            return list()
+
+        # All queries are encoded in one batch, and the snapshot is resolved once for all queries.
+        query_embeddings = self.embedding_model.encode_batch(queries)
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            snapshot = self.version.identifier
+
+        # Our kNN statements are independent of each other, so we'll issue them concurrently.
+        max_workers = min(len(queries), DEFAULT_CATALOG_FIND_MANY_MAX_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._find_with_embedding, e, snapshot, limit, annotations) for e in query_embeddings
+            ]
+            return [f.result() for f in futures]
+
+    def find_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        """Returns the catalog item with each name (fetched by key, all names in one batch)."""
+        if len(names) == 0:
+            return list()
+        if (replica := self._replica_for(snapshot)) is not None:
+            return replica.find_names(names=names, snapshot=LATEST_SNAPSHOT_VERSION)
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            snapshot = self.version.identifier
+        if snapshot is None:
+            return [self._find_name_with_query(name, snapshot) for name in names]
+
+        # Items are published under keys derived from their catalog version, kind, and name (see 'agentc publish').
+        keys = [catalog_item_key(snapshot, self.kind, name) for name in names]
+        scope = self.cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+        try:
+            multi_get_result = scope.collection(self._items_collection_name()).get_multi(keys)
+        except couchbase.exceptions.CouchbaseException as e:
+            logger.warning(f"Could not fetch catalog items by key. Swallowing exception {str(e)} and querying instead.")
+            return [self._find_name_with_query(name, snapshot) for name in names]
+        results = list()
+        for name, key in zip(names, keys, strict=True):
+            get_result, err = multi_get_result.results.get(key), multi_get_result.exceptions.get(key)
+            result = self._name_result(name, get_result.content_as[dict] if get_result is not None else None, err)
+            results.append(result if result is not None else self._find_name_with_query(name, snapshot))
+        return results
+
+    def _find_name_with_query(self, name: str, snapshot: str) -> list[SearchResult]:
+        sqlpp_query, params = self._name_statement(name, snapshot)
+        res, err = execute_query_with_parameters(self.cluster, sqlpp_query, params, adhoc=False)
+        return self._name_results(list(res) if err is None else None, err, sqlpp_query)
+
+    async def _afind_name(self, name: str, snapshot: str) -> list[SearchResult]:
+        if snapshot is not None:
+            scope = self.async_cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            try:
+                get_result = await scope.collection(self._items_collection_name()).get(
+                    catalog_item_key(snapshot, self.kind, name)
+                )
+                result = self._name_result(name, get_result.content_as[dict], None)
+            except couchbase.exceptions.CouchbaseException as e:
+                result = self._name_result(name, None, e)
+            if result is not None:
+                return result
+        sqlpp_query, params = self._name_statement(name, snapshot)
+        rows, err = await aexecute_query_with_parameters(self.async_cluster, sqlpp_query, params, adhoc=False)
+        return self._name_results(rows, err, sqlpp_query)
+
+    async def afind_names(self, names: list[str], snapshot: str = None) -> list[list[SearchResult]]:
+        """An asyncio counterpart of find_names() (issued on our async_cluster, if it has been set)."""
+        if len(names) == 0:
+            return list()
+        if (replica := self._replica_for(snapshot)) is not None:
+            return replica.find_names(names=names, snapshot=LATEST_SNAPSHOT_VERSION)
+        if self.async_cluster is None:
+            return await super().afind_names(names=names, snapshot=snapshot)
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            snapshot = (await self.aversion()).identifier
+        return list(await asyncio.gather(*[self._afind_name(name, snapshot) for name in names]))
+
+    async def afind(
+        self,
+        query: str = None,
+        name: str = None,
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        """An asyncio counterpart of find() (issued on our async_cluster, if it has been set)."""
+        if (replica := self._replica_for(snapshot)) is not None:
+            return await replica.afind(
+                query=query, name=name, snapshot=LATEST_SNAPSHOT_VERSION, limit=limit, annotations=annotations
+            )
+        if self.async_cluster is None:
+            return await super().afind(query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations)
+
+        if name is not None:
+            return (await self.afind_names([name], snapshot=snapshot))[0]
 
+        # Our query is encoded while our snapshot is resolved.
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            query_embeddings, version = await asyncio.gather(self.embedding_model.aencode(query), self.aversion())
+            snapshot = version.identifier
         else:
-            # Generate embeddings for user query
-            query_embeddings = self.embedding_model.encode(query)
-            dim = len(query_embeddings)
-
-            # ---------------------------------------------------------------------------------------- #
-            #                         Get all relevant items from catalog                              #
-            # ---------------------------------------------------------------------------------------- #
-
-            # Get annotations condition
-            annotation_condition = annotations.__catalog_query_str__() if annotations is not None else "1==1"
-
-            # Index used (in the future, we may need to condition on the catalog schema version).
-            idx = f"v2_AgentCatalog{self.kind.capitalize()}sEmbeddingIndex"
-            keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, collection)
-            index_name = f"{self.bucket}.{DEFAULT_CATALOG_SCOPE}.{idx}"
-            safe_index_name = _sanitize_search_index_name(index_name)
-            safe_query_embeddings = _serialize_query_embeddings(query_embeddings)
-
-            # User has specified a snapshot id
-            if snapshot is not None:
-                if snapshot == LATEST_SNAPSHOT_VERSION:
-                    snapshot = self.version.identifier
-
-                sqlpp_query = f"""
-                    SELECT a.* FROM (
-                        SELECT t.*, SEARCH_SCORE() AS score
-                        FROM {keyspace} AS t
-                        WHERE SEARCH(
-                            t,
-                            {{
-                                'query': {{ 'match_none': {{}} }},
-                                'knn': [
-                                    {{
-                                        'field': 'embedding_{dim}',
-                                        'vector': {safe_query_embeddings},
-                                        'k': 10
-                                    }}
-                                ]
-                            }},
-                            {{
-                                'index': '{safe_index_name}'
-                            }}
-                        )
-                    ) AS a
-                    WHERE {annotation_condition} AND a.catalog_identifier = $snapshot
-                    ORDER BY a.score DESC
-                    LIMIT $limit;
-                """
-                params = {
-                    "snapshot": snapshot,
-                    "limit": limit,
-                }
-
-            # No snapshot id has been mentioned
-            else:
-                sqlpp_query = f"""
-                    SELECT a.* FROM (
-                        SELECT t.*, SEARCH_SCORE() AS score
-                        FROM {keyspace} as t
-                        WHERE SEARCH(
-                            t,
-                            {{
-                                'query': {{ 'match_none': {{}} }},
-                                'knn': [
-                                    {{
-                                        'field': 'embedding_{dim}',
-                                        'vector': {safe_query_embeddings},
-                                        'k': 10
-                                    }}
-                                ]
-                            }},
+            query_embeddings = await self.embedding_model.aencode(query)
+        return await self._afind_with_embedding(query_embeddings, snapshot, limit, annotations)
+
+    async def afind_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """An asyncio counterpart of find_many() (issued on our async_cluster, if it has been set)."""
+        if (replica := self._replica_for(snapshot)) is not None:
+            return await replica.afind_many(
+                queries=queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=limit, annotations=annotations
+            )
+        if self.async_cluster is None:
+            return await super().afind_many(queries=queries, snapshot=snapshot, limit=limit, annotations=annotations)
+        if len(queries) == 0:
+            return list()
+
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            query_embeddings, version = await asyncio.gather(
+                self.embedding_model.aencode_batch(queries), self.aversion()
+            )
+            snapshot = version.identifier
+        else:
+            query_embeddings = await self.embedding_model.aencode_batch(queries)
+        return list(
+            await asyncio.gather(
+                *[self._afind_with_embedding(e, snapshot, limit, annotations) for e in query_embeddings]
+            )
+        )
+
+    def _knn_statement(
+        self,
+        query_embeddings: list[float],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> tuple[str, dict[str, typing.Any]]:
+        dim = len(query_embeddings)
+
+        # All values (our query vector, annotation values, snapshot, and limit) are given as named parameters.
+        # Our statement text then only depends on our kind, embedding dimension, and annotation keys, so we can reuse
+        # one prepared statement (and its plan) across finds.
+        if annotations is not None:
+            annotation_condition, params = annotations.__catalog_query_parameters__()
+        else:
+            annotation_condition, params = "1==1", dict()
+
+        index_name = f"{self.bucket}.{DEFAULT_CATALOG_SCOPE}.{self._vector_index_name()}"
+        safe_index_name = _sanitize_search_index_name(index_name)
+        params["query_vector"] = _clean_query_embeddings(query_embeddings)
+        params["query_norm"] = math.sqrt(sum(x**2 for x in params["query_vector"]))
+
+        # If the user has specified a snapshot id, we'll filter by catalog_identifier.
+        params["limit"] = limit
+        snapshot_condition = ""
+        if snapshot is not None:
+            snapshot_condition = "AND a.catalog_identifier = $snapshot"
+            params["snapshot"] = snapshot
+
+        # Our snapshot and annotation filters are given to our kNN clause as well (if our vector index supports this),
+        # so all k candidates satisfy our filters. Our outer WHERE clause then only guards against inexact matches.
+        knn_filter, filter_clause = self._knn_filter(snapshot, annotations), ""
+        if knn_filter is not None:
+            params["knn_filter"] = knn_filter
+            filter_clause = ", 'filter': $knn_filter"
+        post_filtered = knn_filter is None and (snapshot is not None or annotations is not None)
+        params["k"] = self._knn_candidates(limit, post_filtered)
+
+        # We compute the true cosine similarity on the query service (Couchbase uses a different score :-)), so only
+        # this similarity and the items themselves (without their embeddings and raw contents) are sent back to us.
+        sqlpp_query = f"""
+            SELECT
+                {_item_projection("a", "s.id")} AS item,
+                ARRAY_SUM(ARRAY e * $query_vector[i] FOR i:e IN a.embedding END) / NULLIF(
+                    SQRT(ARRAY_SUM(ARRAY e * e FOR e IN a.embedding END)) * $query_norm, 0
+                ) AS delta
+            FROM (
+                SELECT t AS item, META(t).id AS id, SEARCH_SCORE() AS score
+                FROM {self._items_keyspace()} AS t
+                WHERE SEARCH(
+                    t,
+                    {{
+                        'query': {{ 'match_none': {{}} }},
+                        'knn': [
                             {{
-                                'index': '{safe_index_name}'
+                                'field': 'embedding_{dim}',
+                                'vector': $query_vector,
+                                'k': $k{filter_clause}
                             }}
-                        )
-                    ) AS a
-                    WHERE {annotation_condition}
-                    ORDER BY a.score DESC
-                    LIMIT $limit;
-                """
-                params = {"limit": limit}
-
-            # Execute query after filtering by catalog_identifier if provided
-            res, err = execute_query_with_parameters(self.cluster, sqlpp_query, params)
-            if err is not None:
-                logger.error(err)
-                return []
+                        ]
+                    }},
+                    {{
+                        'index': '{safe_index_name}'
+                    }}
+                )
+            ) AS s
+            LET a = s.item
+            WHERE {annotation_condition} {snapshot_condition}
+            ORDER BY s.score DESC
+            LIMIT $limit;
+        """
+        return sqlpp_query, params
+
+    def _knn_filter(
+        self, snapshot: typing.Optional[str], annotations: typing.Optional[AnnotationPredicate]
+    ) -> typing.Optional[dict[str, typing.Any]]:
+        if not self._knn_prefilter or (snapshot is None and annotations is None):
+            return None
+        conjuncts = list()
+        if snapshot is not None:
+            conjuncts.append({"term": snapshot, "field": "catalog_identifier"})
+        if annotations is not None:
+            # Our annotation predicate is given in DNF.
+            disjuncts = [
+                {"conjuncts": [{"term": v, "field": f"annotations.{k}"} for k, v in d.items()]}
+                for d in annotations.disjuncts
+            ]
+            conjuncts.append({"disjuncts": disjuncts})
+        return {"conjuncts": conjuncts}
+
+    def _knn_candidates(self, limit: typing.Union[int | None], post_filtered: bool) -> int:
+        if limit is None or limit <= 0:
+            return self.knn_max_candidates
+        oversampling = self._knn_post_filter_oversampling if post_filtered else self.knn_oversampling
+        k = max(math.ceil(limit * oversampling), DEFAULT_CATALOG_KNN_MIN_CANDIDATES)
+        return min(k, self.knn_max_candidates)
+
+    def _adapt_knn_oversampling(
+        self,
+        snapshot: typing.Optional[str],
+        annotations: typing.Optional[AnnotationPredicate],
+        params: dict[str, typing.Any],
+        results: list[SearchResult],
+    ):
+        # Only searches whose candidates are filtered after our kNN clause can come back short of their limit.
+        post_filtered = "knn_filter" not in params and (snapshot is not None or annotations is not None)
+        limit = params["limit"]
+        if not post_filtered or limit is None or limit <= 0:
+            return
 
-        resp = list(res)
+        # We double our oversampling when a search comes back short (and halve it, down to knn_oversampling, when a
+        # search comes back full), so one selective filter does not inflate k for all of our later searches.
+        oversampling = self._knn_post_filter_oversampling
+        if len(results) >= limit:
+            oversampling = max(oversampling / 2, self.knn_oversampling)
+        elif params["k"] < self.knn_max_candidates:
+            oversampling = min(oversampling * 2, self.knn_max_candidates / limit)
+        if oversampling != self._knn_post_filter_oversampling:
+            logger.debug(f"Setting our (post-filter) kNN oversampling to {oversampling}.")
+            self._knn_post_filter_oversampling = oversampling
+
+    def _knn_results(self, rows: typing.Optional[list[dict]], err: Exception, sqlpp_query: str) -> list[SearchResult]:
+        if err is not None:
+            logger.error(err)
+            return []
 
         # If result set is empty
-        if len(resp) == 0:
+        if len(rows) == 0:
             logger.debug(f"No catalog items found using the SQL++ query: {sqlpp_query}")
             return []
 
-        # ---------------------------------------------------------------------------------------- #
-        #                Format catalog items into SearchResults and child types                   #
-        # ---------------------------------------------------------------------------------------- #
-
-        # List of catalog items from query
-        descriptors: list[RecordDescriptor] = []
-        for row in resp:
-            descriptors.append(_descriptor_from_row(row))
+        # List of catalog items from query (items without an embedding have no similarity to our query).
+        results = [SearchResult(entry=_descriptor_from_row(row["item"]), delta=row.get("delta") or 0) for row in rows]
+        return sorted(results, key=lambda t: t.delta, reverse=True)
 
-        # We compute the true cosine distance here (Couchbase uses a different score :-)).
-        if name is not None:
-            return [SearchResult(entry=descriptors[0], delta=1)]
+    def _find_with_embedding(
+        self,
+        query_embeddings: list[float],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        sqlpp_query, params = self._knn_statement(query_embeddings, snapshot, limit, annotations)
+        res, err = execute_query_with_parameters(self.cluster, sqlpp_query, params, adhoc=False)
+        results = self._knn_results(list(res) if err is None else None, err, sqlpp_query)
+        self._adapt_knn_oversampling(snapshot, annotations, params, results)
+        return results
 
-        deltas = self.get_deltas(query_embeddings, [t.embedding for t in descriptors])
-        results = [SearchResult(entry=descriptors[i], delta=deltas[i]) for i in range(len(deltas))]
-        return sorted(results, key=lambda t: t.delta, reverse=True)
+    async def _afind_with_embedding(
+        self,
+        query_embeddings: list[float],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        sqlpp_query, params = self._knn_statement(query_embeddings, snapshot, limit, annotations)
+        rows, err = await aexecute_query_with_parameters(self.async_cluster, sqlpp_query, params, adhoc=False)
+        results = self._knn_results(rows, err, sqlpp_query)
+        self._adapt_knn_oversampling(snapshot, annotations, params, results)
+        return results
+
+    def resolve_blob(self, key: str) -> typing.Optional[str]:
+        # Blobs are content-addressed, so we can fetch these directly (by key) instead of issuing a query.
+        try:
+            scope = self.cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            if key.startswith(_ITEM_RAW_REF_PREFIX):
+                # The (inline) raw contents of an item are fetched from the item itself.
+                item_key = key.removeprefix(_ITEM_RAW_REF_PREFIX)
+                collection = scope.collection(self._items_collection_name())
+                return collection.lookup_in(item_key, [couchbase.subdocument.get("raw")]).content_as[str](0)
+            return scope.collection(DEFAULT_CATALOG_BLOB_COLLECTION).get(key).content_as[dict]["content"]
+        except couchbase.exceptions.DocumentNotFoundException:
+            logger.debug(f"Blob {key} not found in the DB catalog.")
+            return None
+        except couchbase.exceptions.CouchbaseException as e:
+            logger.warning(f"Unable to fetch blob {key} from the DB catalog. Swallowing exception {str(e)}.")
+            return None
 
     def __iter__(self) -> typing.Iterator[RecordDescriptor]:
-        """Return all items in a DB catalog."""
-        collection = DEFAULT_CATALOG_TOOL_COLLECTION if self.kind == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
-        keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, collection)
-        query = f"FROM {keyspace} AS t SELECT t.*;"
-        res, err = execute_query(self.cluster, query)
-        if err is not None:
-            logger.error(err)
+        """Return all items in the latest snapshot of a DB catalog (see iterate())."""
+        return self.iterate()
+
+    def iterate(self, snapshot: str = LATEST_SNAPSHOT_VERSION) -> typing.Iterator[RecordDescriptor]:
+        """Streams all items in a snapshot of a DB catalog (fetched in pages of page_size items)."""
+        if (replica := self._replica_for(snapshot)) is not None:
+            yield from replica
             return
-        for row in res:
-            yield _descriptor_from_row(row)
+        if snapshot == LATEST_SNAPSHOT_VERSION:
+            try:
+                snapshot = self.version.identifier
+            except LookupError as e:
+                logger.debug(f"No {self.kind} catalog has been published. Swallowing exception {str(e)}.")
+                return
+
+        # Pages are keyed by document key (so each page is a range scan over our catalog_identifier index).
+        # Our embeddings are only needed for search and our raw contents are resolved on use (so both are left on the
+        # cluster).
+        sqlpp_query = f"""
+            FROM {self._items_keyspace()} AS t
+            WHERE t.catalog_identifier = $snapshot AND META(t).id > $after
+            SELECT META(t).id AS id, {_item_projection("t", "META(t).id")} AS item
+            ORDER BY META(t).id
+            LIMIT $page_size;
+        """
+        params = {"snapshot": snapshot, "after": "", "page_size": self.page_size}
+        while True:
+            res, err = execute_query_with_parameters(self.cluster, sqlpp_query, params, adhoc=False)
+            if err is not None:
+                logger.error(err)
+                return
+            rows = list(res)
+            for row in rows:
+                yield _descriptor_from_row(row["item"])
+            if len(rows) < self.page_size:
+                return
+            params["after"] = rows[-1]["id"]
 
     def __len__(self):
-        collection = DEFAULT_CATALOG_TOOL_COLLECTION if self.kind == "tool" else DEFAULT_CATALOG_PROMPT_COLLECTION
-        keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, collection)
-        query = f"FROM {keyspace} SELECT VALUE COUNT(*);"
-        res, err = execute_query(self.cluster, query)
+        if self._replica is not None:
+            return len(self._replica.catalog_descriptor.items)
+        return self._cached("len", self._count)
+
+    def _count(self) -> int:
+        # Like our iterator, we only count the items in the latest snapshot.
+        try:
+            snapshot = self.version.identifier
+        except LookupError as e:
+            logger.debug(f"No {self.kind} catalog has been published. Swallowing exception {str(e)}.")
+            return 0
+        sqlpp_query = f"""
+            FROM {self._items_keyspace()} AS t
+            WHERE t.catalog_identifier = $snapshot
+            SELECT VALUE COUNT(*);
+        """
+        res, err = execute_query_with_parameters(self.cluster, sqlpp_query, {"snapshot": snapshot}, adhoc=False)
         if err is not None:
             logger.error(err)
             raise err
         for row in res:
             return row
-        return None
+        return 0
+
+    def refresh(self) -> None:
+        """Discards our cached version (and item count), so both are resolved again on their next access.
+
+        If this catalog is an unpinned replica, the latest snapshot is also swapped in (without waiting for our poller).
+        """
+        self._version_cache.clear()
+        self._knn_prefilter = self._vector_index_can_prefilter()
+        if self._replica is not None and self.replica_snapshot is None:
+            self._refresh_replica()
+
+    def _latest_version_key(self) -> str:
+        return f"{DEFAULT_CATALOG_LATEST_VERSION_KEY}/{self.kind}"
+
+    def _check_latest_version_cas(self, cas: typing.Optional[int]) -> None:
+        # A publish (or a clean) has touched the "latest" document since we last resolved our version.
+        if cas != self._version_cas:
+            logger.debug(f"The latest {self.kind} catalog version has changed. Discarding our cached version.")
+            self._version_cache.clear()
+            self._version_cas = cas
+
+    def _latest_version_cas(self) -> typing.Optional[int]:
+        try:
+            scope = self.cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            return scope.collection(DEFAULT_CATALOG_METADATA_COLLECTION).get(self._latest_version_key()).cas
+        except (DocumentNotFoundException, ScopeNotFoundException, CollectionNotFoundException):
+            return None
+        except couchbase.exceptions.CouchbaseException as e:
+            logger.debug(f"Could not fetch the latest {self.kind} catalog version. Swallowing exception {str(e)}.")
+            return self._version_cas
+
+    async def _alatest_version_cas(self) -> typing.Optional[int]:
+        try:
+            scope = self.async_cluster.bucket(self.bucket).scope(DEFAULT_CATALOG_SCOPE)
+            return (await scope.collection(DEFAULT_CATALOG_METADATA_COLLECTION).get(self._latest_version_key())).cas
+        except (DocumentNotFoundException, ScopeNotFoundException, CollectionNotFoundException):
+            return None
+        except couchbase.exceptions.CouchbaseException as e:
+            logger.debug(f"Could not fetch the latest {self.kind} catalog version. Swallowing exception {str(e)}.")
+            return self._version_cas
+
+    def _cached(self, key: str, resolve: typing.Callable[[], typing.Any]) -> typing.Any:
+        # Nested accesses (e.g., our count resolves our version) share the CAS check of the outermost access.
+        is_outermost = not getattr(self._version_cas_check, "active", False)
+        if self.version_cas_invalidation and is_outermost:
+            self._check_latest_version_cas(self._latest_version_cas())
+        value = self._version_cache.get(key)
+        if value is None:
+            self._version_cas_check.active = True
+            try:
+                value = resolve()
+            finally:
+                self._version_cas_check.active = not is_outermost
+            self._version_cache.put(key, value)
+        return value
 
     @property
     def version(self) -> VersionDescriptor:
-        """Returns the latest version of the catalog."""
+        """Returns the latest version of the catalog (cached for version_ttl_seconds), or the version of our replica."""
+        if self._replica is not None:
+            return self._replica.version
+        return self._cached("version", self._query_version)
+
+    def _query_version(self) -> VersionDescriptor:
+        ts_query, params = self._version_statement()
+        res, err = execute_query_with_parameters(self.cluster, ts_query, params, adhoc=False)
+        return self._version_from_rows(res, err)
+
+    async def aversion(self) -> VersionDescriptor:
+        """An asyncio counterpart of version (issued on our async_cluster, if it has been set)."""
+        if self._replica is not None:
+            return self._replica.version
+        if not self.version_cas_invalidation and (version := self._version_cache.get("version")) is not None:
+            return version
+        if self.async_cluster is None:
+            return await asyncio.to_thread(lambda: self.version)
+        if self.version_cas_invalidation:
+            self._check_latest_version_cas(await self._alatest_version_cas())
+        version = self._version_cache.get("version")
+        if version is None:
+            ts_query, params = self._version_statement()
+            rows, err = await aexecute_query_with_parameters(self.async_cluster, ts_query, params, adhoc=False)
+            version = self._version_from_rows(rows, err)
+            self._version_cache.put("version", version)
+        return version
+
+    def _version_statement(self) -> tuple[str, dict[str, typing.Any]]:
         kind = CatalogKind.Tool if self.kind == "tool" else CatalogKind.Prompt
         keyspace = quote_sql_keyspace(self.bucket, DEFAULT_CATALOG_SCOPE, DEFAULT_CATALOG_METADATA_COLLECTION)
         ts_query = f"""
@@ -274,12 +821,14 @@ class CatalogDB(pydantic.BaseModel, CatalogBase):
             ORDER BY STR_TO_MILLIS(t.version.timestamp) DESC
             LIMIT 1
         """
-        res, err = execute_query_with_parameters(self.cluster, ts_query, {"kind": kind.value})
+        return ts_query, {"kind": kind.value}
+
+    def _version_from_rows(self, rows: typing.Iterable[dict], err: Exception) -> VersionDescriptor:
         if err is not None:
             logger.error(err)
             raise LookupError(f"No results found? -- Error: {err}")
-        for row in res:
+        for row in rows:
             return VersionDescriptor.model_validate(row)
         raise LookupError(
-            f"Catalog version not found for kind = '{kind}'! Please run 'agentc publish' to create the catalog."
+            f"Catalog version not found for kind = '{self.kind}'! Please run 'agentc publish' to create the catalog."
         )
@@ -1,12 +1,28 @@
 import click_extra
+import json
 import logging
+import numpy
 import pathlib
 import pydantic
 import typing
 
 from ...annotation import AnnotationPredicate
+from ...catalog.ann import IVFFlatIndex
+from ...catalog.ann import ann_index_path
+from ...catalog.blobs import deduplicate_raw
 from ...catalog.descriptor import CatalogDescriptor
+from ...catalog.descriptor import RecordDescriptorStub
+from ...catalog.descriptor import RecordDescriptorUnionType
+from ...catalog.embeddings import dump_embeddings
+from ...catalog.embeddings import hydrate_embeddings
+from ...catalog.embeddings import load_embeddings
+from ...catalog.embeddings import load_quantized_embeddings
+from ...catalog.embeddings import remove_embeddings
+from ...catalog.quantization import EmbeddingQuantization
+from ...catalog.quantization import QuantizedEmbeddings
 from ...config import LATEST_SNAPSHOT_VERSION
+from ...defaults import DEFAULT_ANN_INDEX_PROBES
+from ...defaults import DEFAULT_EMBEDDING_RESCORING_FACTOR
 from ...learned.embedding import EmbeddingModel
 from ...version import VersionDescriptor
 from .base import CatalogBase
@@ -15,6 +31,12 @@ from agentc_core.record.descriptor import RecordDescriptor
 
 logger = logging.getLogger(__name__)
 
+# Rows whose norm is within this distance of 1 are considered to be of unit length (float32 rounding aside).
+_UNIT_NORM_TOLERANCE = 1e-5
+
+# Used to validate (hydrate) a single catalog item of a lazily loaded catalog.
+_record_descriptor_adapter = pydantic.TypeAdapter(RecordDescriptorUnionType)
+
 
 class CatalogMem(pydantic.BaseModel, CatalogBase):
     """Represents an in-memory catalog."""
@@ -23,9 +45,45 @@ class CatalogMem(pydantic.BaseModel, CatalogBase):
     catalog_file: typing.Optional[pathlib.Path] = None
     catalog_descriptor: typing.Optional[CatalogDescriptor] = None
 
+    # Approximate nearest-neighbor (IVF-flat) search parameters (by default, an exact search is performed).
+    ann_index: bool = False
+    ann_index_probes: int = pydantic.Field(default=DEFAULT_ANN_INDEX_PROBES, gt=0)
+
+    # If set, only the search-relevant fields of each item are validated on load (the rest are validated on access).
+    lazy: bool = False
+
+    # If set, candidates are first scored against quantized (float16 or int8) embeddings, and only the top
+    # (limit * embedding_rescoring_factor) candidates are rescored exactly (in float32).
+    # Catalogs that store quantized embeddings (next to their float32 embedding file) are always searched this way.
+    embedding_quantization: typing.Optional[EmbeddingQuantization] = None
+    embedding_rescoring_factor: int = pydantic.Field(default=DEFAULT_EMBEDDING_RESCORING_FACTOR, gt=0)
+
+    # A (row-aligned with catalog_descriptor.items) matrix of float32 embeddings and the (non-zero) norm of each row.
+    # If the catalog stores its embeddings in an embedding file, this matrix is memory-mapped (and read-only).
+    _embedding_matrix: typing.Optional[numpy.ndarray] = None
+    _embedding_norms: typing.Optional[numpy.ndarray] = None
+
+    # Our matrix with each row scaled to unit length (built once, on first use). If the rows of our matrix are already
+    # of unit length (e.g., embeddings of sentence-transformers models), this is our (memory-mapped) matrix itself.
+    _unit_embedding_matrix: typing.Optional[numpy.ndarray] = None
+
+    # Our quantized (unit-length) embeddings. Once these are set, only our codes are scanned (and kept resident): the
+    # float32 rows of our best candidates are read from our memory-mapped matrix (or from our items) for rescoring.
+    _quantized_embeddings: typing.Optional[QuantizedEmbeddings] = None
+
+    # A posting list (sorted row numbers) for each (annotation key, annotation value) pair in the catalog.
+    _annotation_index: typing.Optional[dict[tuple[str, str], numpy.ndarray]] = None
+
+    # Our ANN index (only set if ann_index is True).
+    _ann_index: typing.Optional[IVFFlatIndex] = None
+
+    # For lazily loaded catalogs, the (unvalidated) JSON of each item that has not been hydrated yet.
+    _raw_items: typing.Optional[list[typing.Optional[dict]]] = None
+
     @pydantic.model_validator(mode="after")
     def _catalog_path_or_descriptor_should_exist(self) -> "CatalogMem":
         if self.catalog_descriptor is not None:
+            # Note: descriptors given directly (e.g., on index) may not have embeddings yet, so we build lazily.
             return self
 
         if self.catalog_file is None:
@@ -35,17 +93,312 @@ class CatalogMem(pydantic.BaseModel, CatalogBase):
 
         # If there are any validation errors in the local catalog, we'll catch them here.
         with self.catalog_file.open("r") as fp:
-            self.catalog_descriptor = CatalogDescriptor.model_validate_json(fp.read())
+            if self.lazy:
+                self._load_lazily(fp.read())
+            else:
+                self.catalog_descriptor = CatalogDescriptor.model_validate_json(fp.read())
 
+        # Build our embedding matrix (or map our embedding file) and annotation index once (here).
+        # Note: the float32 rows of a quantized catalog are only read when rescoring, so we do not compute norms here.
+        if self.catalog_descriptor.embedding_file is not None:
+            self._embedding_matrix = load_embeddings(self.catalog_file, self.catalog_descriptor)
+        if self.catalog_descriptor.embedding_quantization is not None:
+            self._quantized_embeddings = load_quantized_embeddings(self.catalog_file, self.catalog_descriptor)
+        else:
+            self._build_embedding_matrix()
+        self._build_annotation_index()
+        if self.ann_index:
+            self._load_ann_index()
         return self
 
-    def dump(self, catalog_path: pathlib.Path):
-        """Save to a catalog_path JSON file."""
+    def _load_lazily(self, catalog_json: str):
+        # Only the catalog metadata and the search-relevant fields of each item are validated here.
+        catalog_dict = json.loads(catalog_json)
+        raw_items = catalog_dict.pop("items")
+        self.catalog_descriptor = CatalogDescriptor.model_validate(catalog_dict | {"items": list()})
+        self.catalog_descriptor.items = [RecordDescriptorStub.model_validate(x) for x in raw_items]
+        self._raw_items = raw_items
+
+    def _item(self, row: int) -> RecordDescriptor:
+        # Items of a lazily loaded catalog are validated in full (hydrated) on their first access.
+        # Note: searches may run concurrently, so we read each raw item once (another thread may hydrate it after our
+        # read, in which case both threads validate the same dict and store equal items).
+        raw_items = self._raw_items
+        raw_item = raw_items[row] if raw_items is not None else None
+        if raw_item is not None:
+            self.catalog_descriptor.items[row] = _record_descriptor_adapter.validate_python(raw_item)
+            raw_items[row] = None
+        return self.catalog_descriptor.items[row]
+
+    def _hydrate_items(self):
+        if self._raw_items is not None:
+            for i in range(len(self.catalog_descriptor.items)):
+                self._item(i)
+            self._raw_items = None
+
+    def _item_embedding(self, row: int) -> typing.Optional[list[float]]:
+        raw_items = self._raw_items
+        raw_item = raw_items[row] if raw_items is not None else None
+        if raw_item is not None:
+            return raw_item.get("embedding")
+        return self.catalog_descriptor.items[row].embedding
+
+    def _item_embeddings(self) -> typing.Iterable[typing.Optional[list[float]]]:
+        for i in range(len(self.catalog_descriptor.items)):
+            yield self._item_embedding(i)
+
+    def _build_embedding_matrix(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        if self._embedding_matrix is None:
+            embeddings = list(self._item_embeddings())
+            dim = max((len(x) for x in embeddings if x is not None), default=0)
+            self._embedding_matrix = numpy.zeros((len(embeddings), dim), dtype=numpy.float32)
+            for i, embedding in enumerate(embeddings):
+                if embedding:
+                    self._embedding_matrix[i, : len(embedding)] = embedding
+
+        # Compute the norm of each row up front, so cosine similarity is reduced to a dot product at query time.
+        self._embedding_norms = numpy.linalg.norm(self._embedding_matrix, axis=1)
+        self._embedding_norms[self._embedding_norms == 0] = 1
+        self._unit_embedding_matrix = None
+        return self._embedding_matrix, self._embedding_norms
+
+    def _embeddings(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        if self._embedding_matrix is None or self._embedding_norms is None:
+            return self._build_embedding_matrix()
+        return self._embedding_matrix, self._embedding_norms
+
+    def _unit_embeddings(self) -> numpy.ndarray:
+        if self._unit_embedding_matrix is None:
+            matrix, norms = self._embeddings()
+            if numpy.allclose(norms, 1, atol=_UNIT_NORM_TOLERANCE):
+                self._unit_embedding_matrix = matrix
+            else:
+                logger.debug("Embeddings of our catalog are not of unit length. Normalizing these (once).")
+                self._unit_embedding_matrix = matrix / norms[:, None]
+        return self._unit_embedding_matrix
+
+    def _quantized(self) -> typing.Optional[QuantizedEmbeddings]:
+        if self._quantized_embeddings is None and self.embedding_quantization is not None:
+            self._quantized_embeddings = QuantizedEmbeddings.quantize(
+                self._unit_embeddings(), self.embedding_quantization
+            )
+            if self.catalog_descriptor.embedding_file is None:
+                # Our float32 matrix was built from our items (which we can rescore from), so we only keep our codes.
+                self._embedding_matrix = None
+                self._embedding_norms = None
+                self._unit_embedding_matrix = None
+        return self._quantized_embeddings
+
+    def _candidate_embeddings(self, rows: numpy.ndarray) -> numpy.ndarray:
+        if self._embedding_matrix is not None:
+            return numpy.asarray(self._embedding_matrix[rows], dtype=numpy.float32)
+        candidates = numpy.zeros((len(rows), self._quantized_embeddings.codes.shape[1]), dtype=numpy.float32)
+        for i, row in enumerate(rows):
+            embedding = self._item_embedding(row)
+            if embedding:
+                candidates[i, : len(embedding)] = embedding
+        return candidates
+
+    def _load_ann_index(self) -> IVFFlatIndex:
+        matrix = self._unit_embeddings()
+        identifiers = [x.identifier for x in self.catalog_descriptor.items]
+        catalog_identifier = self.catalog_descriptor.version.identifier
+
+        # Use the persisted index if it exists (an index built for a different catalog version is updated in memory).
+        persisted_index = None
+        if self.catalog_file is not None and ann_index_path(self.catalog_file).exists():
+            try:
+                persisted_index = IVFFlatIndex.load(ann_index_path(self.catalog_file))
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Could not load the ANN index for {self.catalog_file}. Swallowing exception {str(e)}.")
+        if persisted_index is not None:
+            if not persisted_index.is_valid_for(identifiers, catalog_identifier):
+                logger.debug("ANN index does not match the catalog version. Updating the ANN index in memory.")
+            self._ann_index = persisted_index.update(matrix, identifiers, catalog_identifier)
+        else:
+            logger.debug("No ANN index found. Building the ANN index in memory.")
+            self._ann_index = IVFFlatIndex.build(matrix, identifiers, catalog_identifier)
+        return self._ann_index
+
+    def _build_annotation_index(self) -> dict[tuple[str, str], numpy.ndarray]:
+        postings: dict[tuple[str, str], list[int]] = dict()
+        for i, item in enumerate(self.catalog_descriptor.items):
+            for k, v in (item.annotations or dict()).items():
+                postings.setdefault((k, v), list()).append(i)
+        self._annotation_index = {kv: numpy.array(rows, dtype=numpy.int64) for kv, rows in postings.items()}
+        return self._annotation_index
+
+    def _filter(self, annotations: AnnotationPredicate) -> numpy.ndarray:
+        index = self._annotation_index if self._annotation_index is not None else self._build_annotation_index()
+        empty = numpy.empty(0, dtype=numpy.int64)
+
+        # Our predicate is given in DNF, so we intersect the posting lists of each conjunct and union each disjunct.
+        candidate_rows = empty
+        for disjunct in annotations.disjuncts:
+            disjunct_rows = None
+            for kv in sorted(disjunct.items(), key=lambda x: len(index.get(x, empty))):
+                posting = index.get(kv, empty)
+                if disjunct_rows is None:
+                    disjunct_rows = posting
+                else:
+                    disjunct_rows = numpy.intersect1d(disjunct_rows, posting, assume_unique=True)
+                if len(disjunct_rows) == 0:
+                    break
+            if disjunct_rows is not None:
+                candidate_rows = numpy.union1d(candidate_rows, disjunct_rows)
+        return candidate_rows
+
+    def _exact_deltas(self, query_vector: numpy.ndarray, rows: numpy.ndarray) -> numpy.ndarray:
+        if self._quantized_embeddings is not None:
+            # Only our codes are resident, so we read the (exact) float32 embeddings of our candidates here.
+            candidates = self._candidate_embeddings(rows)
+            norms = numpy.linalg.norm(candidates, axis=1)
+            norms[norms == 0] = 1
+            return (candidates @ query_vector) / norms
+        matrix, norms = self._embeddings()
+        return (matrix[rows] @ query_vector) / norms[rows]
+
+    def _rescore(
+        self,
+        query_vector: numpy.ndarray,
+        approximate_deltas: numpy.ndarray,
+        rows: numpy.ndarray,
+        limit: typing.Union[int | None],
+    ) -> list[SearchResult]:
+        # Only the top (limit * rescoring factor) candidates of our quantized pass are rescored.
+        if limit is not None and 0 < limit * self.embedding_rescoring_factor < len(rows):
+            n_candidates = limit * self.embedding_rescoring_factor
+            rows = rows[numpy.sort(numpy.argpartition(-approximate_deltas, n_candidates - 1)[:n_candidates])]
+        return self._top_k(self._exact_deltas(query_vector, rows), rows, limit)
+
+    def _score(
+        self, query_vectors: list[list[float]], rows: numpy.ndarray = None, limit: typing.Union[int | None] = 1
+    ) -> list[list[SearchResult]]:
+        queries = numpy.asarray(query_vectors, dtype=numpy.float32)
+        query_magnitudes = numpy.linalg.norm(queries, axis=1, keepdims=True)
+        query_magnitudes[query_magnitudes == 0] = 1
+        queries = queries / query_magnitudes
+        quantized = self._quantized()
+
+        # If we have an ANN index, only the candidates found in the probed lists are scored.
+        if self.ann_index:
+            ann_index = self._ann_index if self._ann_index is not None else self._load_ann_index()
+            candidates_per_query = ann_index.search(queries, n_probe=self.ann_index_probes, rows=rows)
+            if quantized is not None:
+                return [
+                    self._rescore(query, quantized.score(query[None, :], candidates)[:, 0], candidates, limit)
+                    for query, candidates in zip(queries, candidates_per_query, strict=True)
+                ]
+            return [
+                self._top_k(self._exact_deltas(query, candidates), candidates, limit)
+                for query, candidates in zip(queries, candidates_per_query, strict=True)
+            ]
+
+        # If we have quantized embeddings, all candidates are scored approximately (and the best are rescored).
+        if quantized is not None:
+            rows = rows if rows is not None else numpy.arange(len(quantized.codes))
+            deltas = quantized.score(queries, rows)
+            return [self._rescore(queries[j], deltas[:, j], rows, limit) for j in range(deltas.shape[1])]
+
+        # Otherwise, compute the cosine similarity of each candidate to each query with a single matrix product.
+        matrix, norms = self._embeddings()
+        if rows is not None:
+            deltas = (matrix[rows] @ queries.T) / norms[rows, None]
+        else:
+            rows = numpy.arange(matrix.shape[0])
+            deltas = (matrix @ queries.T) / norms[:, None]
+        return [self._top_k(deltas[:, j], rows, limit) for j in range(deltas.shape[1])]
+
+    def _top_k(self, deltas: numpy.ndarray, rows: numpy.ndarray, limit: typing.Union[int | None]) -> list[SearchResult]:
+        # Order results by their distance to the query (larger is "closer"), only sorting the top-k.
+        if limit is not None and 0 < limit < len(deltas):
+            top_k = numpy.argpartition(-deltas, limit - 1)[:limit]
+            top_k = numpy.sort(top_k)
+        else:
+            top_k = numpy.arange(len(deltas))
+        top_k = top_k[numpy.argsort(-deltas[top_k], kind="stable")]
+
+        # Only the top-k rows are materialized as SearchResults.
+        return [SearchResult(entry=self._item(rows[i]), delta=float(deltas[i])) for i in top_k]
+
+    def hydrate_embeddings(self):
+        """Copies each item's embedding out of our embedding file (if any) and into the item itself."""
+        self._hydrate_items()
+        if self._embedding_matrix is None:
+            return
+        if any(not x.embedding for x in self.catalog_descriptor.items):
+            hydrate_embeddings(self.catalog_descriptor, self._embedding_matrix)
+
+    def dump(
+        self,
+        catalog_path: pathlib.Path,
+        embedding_file: bool = False,
+        embedding_quantization: typing.Optional[EmbeddingQuantization] = None,
+    ):
+        """Save to a catalog_path JSON file.
+
+        If embedding_file is set, all embeddings are saved to a float32 .npy file next to catalog_path (and the JSON
+        file only holds the row of each item's embedding).
+        If embedding_quantization is also set, (unit-length) float16 or int8 embeddings are saved alongside these.
+        """
+        if embedding_quantization is not None and not embedding_file:
+            raise ValueError("Quantized embeddings can only be saved to an embedding file.")
+        self.hydrate_embeddings()
         self.catalog_descriptor.items.sort(key=lambda x: x.identifier)
+        self._embedding_matrix = None
+        self._embedding_norms = None
+        self._unit_embedding_matrix = None
+        self._quantized_embeddings = None
+        self._annotation_index = None
+        self._ann_index = None
+
+        # The raw contents of each source file are stored once (and referenced by each item sourced from the file).
+        items, blobs = deduplicate_raw(self.catalog_descriptor.items, resolve_blob=self.resolve_blob)
+        if embedding_file:
+            matrix = self._embeddings()[0]
+            catalog_descriptor = self.catalog_descriptor.model_copy(
+                update={
+                    "blobs": blobs,
+                    "embedding_file": dump_embeddings(catalog_path, matrix, embedding_quantization),
+                    "embedding_quantization": embedding_quantization,
+                    "items": [
+                        x.model_copy(update={"embedding": None, "embedding_row": i}) for i, x in enumerate(items)
+                    ],
+                }
+            )
+        else:
+            remove_embeddings(catalog_path)
+            catalog_descriptor = self.catalog_descriptor.model_copy(
+                update={
+                    "blobs": blobs,
+                    "embedding_file": None,
+                    "embedding_quantization": None,
+                    "items": [x.model_copy(update={"embedding_row": None}) for x in items],
+                }
+            )
         with catalog_path.open("w") as fp:
-            fp.write(str(self.catalog_descriptor))
+            fp.write(str(catalog_descriptor))
             fp.write("\n")
 
+    def dump_ann_index(self, catalog_path: pathlib.Path, n_lists: int = None):
+        """Save an ANN index next to the catalog_path JSON file, updating the index already there (if any)."""
+        matrix = self._unit_embeddings()
+        identifiers = [x.identifier for x in self.catalog_descriptor.items]
+        catalog_identifier = self.catalog_descriptor.version.identifier
+
+        index_path = ann_index_path(catalog_path)
+        previous_index = None
+        if index_path.exists():
+            try:
+                previous_index = IVFFlatIndex.load(index_path)
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Could not load the previous ANN index. Swallowing exception {str(e)}.")
+        if previous_index is not None:
+            self._ann_index = previous_index.update(matrix, identifiers, catalog_identifier, n_lists=n_lists)
+        else:
+            self._ann_index = IVFFlatIndex.build(matrix, identifiers, catalog_identifier, n_lists=n_lists)
+        self._ann_index.dump(index_path)
+
     def find(
         self,
         query: str = None,
@@ -62,54 +415,80 @@ class CatalogMem(pydantic.BaseModel, CatalogBase):
 
         # Return the exact tool instead of doing vector search in case name is provided
         if name is not None:
-            catalog = [x for x in self.catalog_descriptor.items if x.name == name]
-            if len(catalog) != 0:
-                return [SearchResult(entry=catalog[0], delta=1)]
-            else:
-                click_extra.secho(f"No catalog items found with name '{name}'", fg="yellow")
-                return []
+            for i, item in enumerate(self.catalog_descriptor.items):
+                if item.name == name:
+                    return [SearchResult(entry=self._item(i), delta=1)]
+            click_extra.secho(f"No catalog items found with name '{name}'", fg="yellow")
+            return []
 
         # If annotations have been specified, prune all tools that do not possess these annotations.
-        candidate_tools = [x for x in self.catalog_descriptor.items]
-        if annotations is not None:
-            candidates_for_annotation_search = candidate_tools.copy()
-            candidate_tools = list()
-            for tool in candidates_for_annotation_search:
-                if tool.annotations is None:
-                    # Tools without annotations will always be excluded.
-                    continue
-
-                # Iterate through our disjuncts.
-                for disjunct in annotations.disjuncts:
-                    is_valid_tool = True
-                    for k, v in disjunct.items():
-                        if k not in tool.annotations or tool.annotations[k] != v:
-                            is_valid_tool = False
-                            break
-                    if is_valid_tool:
-                        candidate_tools += [tool]
-                        break
-
-        if len(candidate_tools) == 0:
+        # Note: tools without annotations will never appear in our index (and thus, will always be excluded).
+        candidate_rows = self._filter(annotations) if annotations is not None else None
+
+        if not self._has_candidates(candidate_rows):
             # Exit early if there are no candidates.
             return list()
 
-        # Compute the distance of each tool in the catalog to the query.
-        deltas = self.get_deltas(
-            query=self.embedding_model.encode(query), entries=[t.embedding for t in candidate_tools]
-        )
+        # Compute the distance of each tool in the catalog to the query (and apply our limit clause).
+        return self._score([self.embedding_model.encode(query)], rows=candidate_rows, limit=limit)[0]
+
+    def _has_candidates(self, candidate_rows: typing.Optional[numpy.ndarray]) -> bool:
+        return len(self.catalog_descriptor.items) > 0 and (candidate_rows is None or len(candidate_rows) > 0)
 
-        # Order results by their distance to the query (larger is "closer").
-        results = [SearchResult(entry=candidate_tools[i], delta=deltas[i]) for i in range(len(deltas))]
-        results = sorted(results, key=lambda t: t.delta, reverse=True)
+    def find_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """Returns the catalog items that best match each query (one list of results per query, in order)."""
+        if snapshot != LATEST_SNAPSHOT_VERSION:
+            logger.debug("Specific snapshot has been specified. Returning empty lists (for in-memory catalog).")
+            return [[] for _ in queries]
+
+        candidate_rows = self._filter(annotations) if annotations is not None else None
+        if len(queries) == 0:
+            return list()
+        elif not self._has_candidates(candidate_rows):
+            return [[] for _ in queries]
+
+        # All queries are encoded in one batch and scored together.
+        return self._score(self.embedding_model.encode_batch(queries), rows=candidate_rows, limit=limit)
+
+    async def afind(
+        self,
+        query: str = None,
+        name: str = None,
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[SearchResult]:
+        """An asyncio counterpart of find() (only the query is encoded asynchronously, the rest is served from memory)."""
+        candidate_rows = self._filter(annotations) if annotations is not None else None
+        if snapshot != LATEST_SNAPSHOT_VERSION or name is not None or not self._has_candidates(candidate_rows):
+            return self.find(query=query, name=name, snapshot=snapshot, limit=limit, annotations=annotations)
+        return self._score([await self.embedding_model.aencode(query)], rows=candidate_rows, limit=limit)[0]
+
+    async def afind_many(
+        self,
+        queries: list[str],
+        snapshot: str = None,
+        limit: typing.Union[int | None] = 1,
+        annotations: AnnotationPredicate = None,
+    ) -> list[list[SearchResult]]:
+        """An asyncio counterpart of find_many() (see afind())."""
+        candidate_rows = self._filter(annotations) if annotations is not None else None
+        if snapshot != LATEST_SNAPSHOT_VERSION or len(queries) == 0 or not self._has_candidates(candidate_rows):
+            return self.find_many(queries=queries, snapshot=snapshot, limit=limit, annotations=annotations)
+        return self._score(await self.embedding_model.aencode_batch(queries), rows=candidate_rows, limit=limit)
 
-        # Apply our limit clause.
-        if limit > 0:
-            results = results[:limit]
-        return results
+    def resolve_blob(self, key: str) -> typing.Optional[str]:
+        return (self.catalog_descriptor.blobs or dict()).get(key)
 
     def __iter__(self) -> list[RecordDescriptor]:
-        yield from self.catalog_descriptor.items
+        for i in range(len(self.catalog_descriptor.items)):
+            yield self._item(i)
 
     @property
     def version(self) -> VersionDescriptor:
@@ -1,15 +1,20 @@
 import dataclasses
 import fnmatch
+import json
 import logging
 import os
+import pathlib
 import tqdm
 import typing
 
+from ..defaults import DEFAULT_EMBEDDING_BATCH_SIZE
 from ..defaults import DEFAULT_ITEM_DESCRIPTION_MAX_LEN
 from ..indexer import AllIndexers
-from ..indexer import vectorize_descriptor
+from ..indexer import EmbeddingCache
+from ..indexer import vectorize_descriptors
 from ..learned.embedding import EmbeddingModel
 from ..learned.model import EmbeddingModel as CatalogDescriptorEmbeddingModel
+from ..learned.pool import EmbeddingProcessPool
 from ..record.descriptor import RecordDescriptor
 from .descriptor import CatalogDescriptor
 from .directory import ScanDirectoryOpts
@@ -41,6 +46,9 @@ def index_catalog(
     printer: typing.Callable = lambda x, *args, **kwargs: print(x),
     print_progress: bool = True,
     max_errs=1,
+    embedding_cache: EmbeddingCache = None,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    jobs: int = 1,
 ):
     all_errs, next_catalog, uninitialized_items = index_catalog_start(
         embedding_model=embedding_model,
@@ -73,23 +81,68 @@ def index_catalog(
 
     logger.debug("Now generating embeddings for descriptors.")
     printer("\nGenerating embeddings:")
-    item_iterator = tqdm.tqdm(uninitialized_items) if print_progress else uninitialized_items
-    for descriptor in item_iterator:
-        if 0 < max_errs <= len(all_errs):
-            break
-        if print_progress:
-            item_iterator.set_description(f"{descriptor.name}")
-        logger.debug(f"Generating embedding for {descriptor.name}.")
-        errs = vectorize_descriptor(descriptor, embedding_model)
-        all_errs += errs or []
+    progress_bar = tqdm.tqdm(total=len(uninitialized_items)) if print_progress else None
+
+    # Local embedding models can be sharded across worker processes (each of which loads the model once).
+    # Note: remote embedding models already encode concurrently, and small catalogs are not worth the worker start-up.
+    encoder = embedding_model
+    if jobs > 1 and embedding_model.embedding_model_url is None and len(uninitialized_items) > batch_size:
+        logger.debug(f"Generating embeddings with {jobs} worker processes.")
+        encoder = EmbeddingProcessPool(embedding_model, jobs)
+
+    # Concurrent encoders (remote models and worker pools) are given several batches at a time.
+    step = batch_size * encoder.concurrency
+    try:
+        for i in range(0, len(uninitialized_items), step):
+            if 0 < max_errs <= len(all_errs):
+                break
+            batch = uninitialized_items[i : i + step]
+            if print_progress:
+                progress_bar.set_description(f"{batch[-1].name}")
+            logger.debug(f"Generating embeddings for {', '.join(d.name for d in batch)}.")
+            errs = vectorize_descriptors(batch, encoder, embedding_cache=embedding_cache, batch_size=batch_size)
+            all_errs += errs or []
+            if print_progress:
+                progress_bar.update(len(batch))
+    finally:
+        if encoder is not embedding_model:
+            encoder.close()
+    if print_progress:
+        progress_bar.close()
 
     if all_errs:
         logger.warning("Encountered error(s) during embedding generation: " + "\n".join([str(e) for e in all_errs]))
         raise all_errs[0]
 
+    # Items carried over from our previous catalog are also cached (so a future change to their version is cheap).
+    if embedding_cache is not None:
+        for descriptor in next_catalog.catalog_descriptor.items:
+            if descriptor.embedding is not None:
+                embedding_cache.put(descriptor.description, embedding_model.name, descriptor.embedding)
+
     return next_catalog
 
 
+def collect_embedding_cache(
+    embedding_cache: EmbeddingCache,
+    catalog_files: list[pathlib.Path],
+    embedding_model: EmbeddingModel,
+    descriptors: typing.Iterable[RecordDescriptor] = (),
+) -> int:
+    """Removes all entries of the embedding cache that are not referenced by the given (local) catalog files.
+
+    Entries of the given descriptors (e.g., the items of a dirty catalog that is never saved) are also kept.
+    Returns the number of entries removed."""
+    referenced_keys = {EmbeddingCache.key(x.description, embedding_model.name) for x in descriptors}
+    for catalog_file in catalog_files:
+        if not catalog_file.exists():
+            continue
+        with catalog_file.open("r") as fp:
+            for item in json.load(fp)["items"]:
+                referenced_keys.add(EmbeddingCache.key(item["description"], embedding_model.name))
+    return embedding_cache.collect(referenced_keys)
+
+
 def index_catalog_start(
     embedding_model: EmbeddingModel,
     meta_version: MetaVersion,
@@ -223,6 +276,9 @@ def init_from_catalog(working: CatalogMem, other: CatalogMem) -> list[RecordDesc
             # TODO: Perhaps we're too strict here and should allow micro versions that get ahead.
             raise ValueError("Version of local catalog's lib_version is ahead.")
 
+        # Items of a catalog with an embedding file do not hold their embeddings (so we copy these in first).
+        other.hydrate_embeddings()
+
         # A lookup dict of items keyed by "source:name".
         other_items = {str(o.source) + ":" + o.name: o for o in other.catalog_descriptor.items or []}
 
@@ -231,7 +287,8 @@ def init_from_catalog(working: CatalogMem, other: CatalogMem) -> list[RecordDesc
             if o and not s.version.is_dirty and o.version.identifier == s.version.identifier:
                 # The prev item and self item have the same version IDs,
                 # so copy the prev item contents into the self item.
-                for k, v in o.model_dump().items():
+                # Note: the raw contents of s are freshly read (o may only hold a reference to its raw contents).
+                for k, v in o.model_dump(exclude={"raw", "raw_ref"}).items():
                     setattr(s, k, v)
             else:
                 uninitialized_items.append(s)
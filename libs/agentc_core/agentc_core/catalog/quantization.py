@@ -0,0 +1,68 @@
+import numpy
+import pydantic
+import typing
+
+# int8 codes span [-127, 127] (we keep the range symmetric, so -x is always representable).
+_INT8_MAX = 127
+
+# Codes are cast to float32 and scored in chunks (one reused buffer of this many rows), so we never hold a float32 copy
+# of all our rows.
+_SCORING_CHUNK_SIZE = 1024
+
+EmbeddingQuantization = typing.Literal["float16", "int8"]
+
+
+class QuantizedEmbeddings(pydantic.BaseModel):
+    """A quantized (float16, or int8 with a per-row scale) matrix of unit-length embeddings.
+
+    These are used for a cheap first pass over all candidates of a search.
+    The top candidates of this pass are then rescored exactly against the float32 embeddings (see
+    :py:meth:`CatalogMem._score`).
+    """
+
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    quantization: EmbeddingQuantization
+    codes: numpy.ndarray = pydantic.Field(description="A (items x dimension) float16 or int8 matrix.")
+    scales: typing.Optional[numpy.ndarray] = pydantic.Field(
+        description="The float32 scale of each row (only set for int8 codes).", default=None
+    )
+
+    @classmethod
+    def quantize(cls, matrix: numpy.ndarray, quantization: EmbeddingQuantization) -> "QuantizedEmbeddings":
+        """Quantize a (items x dimension) matrix of unit-length embeddings."""
+        if quantization == "float16":
+            return QuantizedEmbeddings(quantization=quantization, codes=matrix.astype(numpy.float16))
+        elif quantization == "int8":
+            # Each row is scaled such that its largest (absolute) component maps to the largest int8 code.
+            scales = numpy.max(numpy.abs(matrix), axis=1).astype(numpy.float32) / _INT8_MAX
+            scales[scales == 0] = 1
+            codes = numpy.clip(numpy.rint(matrix / scales[:, None]), -_INT8_MAX, _INT8_MAX).astype(numpy.int8)
+            return QuantizedEmbeddings(quantization=quantization, codes=codes, scales=scales)
+        raise ValueError(f"Unknown embedding quantization '{quantization}'.")
+
+    def score(self, query_vectors: numpy.ndarray, rows: numpy.ndarray = None) -> numpy.ndarray:
+        """Returns a (rows x queries) matrix of approximate cosine similarities to the given unit-length queries."""
+        query_vectors = numpy.asarray(query_vectors, dtype=numpy.float32)
+        n_rows = len(self.codes) if rows is None else len(rows)
+        deltas = numpy.empty((n_rows, len(query_vectors)), dtype=numpy.float32)
+        buffer = numpy.empty((min(n_rows, _SCORING_CHUNK_SIZE), self.codes.shape[1]), dtype=numpy.float32)
+        for i in range(0, n_rows, _SCORING_CHUNK_SIZE):
+            codes = (
+                self.codes[i : i + _SCORING_CHUNK_SIZE]
+                if rows is None
+                else self.codes[rows[i : i + _SCORING_CHUNK_SIZE]]
+            )
+            chunk = buffer[: len(codes)]
+            chunk[...] = codes
+            numpy.matmul(chunk, query_vectors.T, out=deltas[i : i + len(codes)])
+
+        # The scale of an int8 row factors out of its dot products, so it is applied once per (row, query) here.
+        # Note: a float16 matmul (or an integer dot product) is slower than casting our codes to float32 for BLAS.
+        if self.scales is not None:
+            deltas *= (self.scales if rows is None else self.scales[rows])[:, None]
+        return deltas
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0)
@@ -1,3 +1,4 @@
+import acouchbase.cluster
 import couchbase.auth
 import couchbase.cluster
 import couchbase.options
@@ -15,13 +16,23 @@ import urllib.parse
 from agentc_core.catalog.implementations.base import SearchResult
 from agentc_core.defaults import DEFAULT_ACTIVITY_FOLDER
 from agentc_core.defaults import DEFAULT_ACTIVITY_ROLLOVER_BYTES
+from agentc_core.defaults import DEFAULT_ANN_INDEX_PROBES
+from agentc_core.defaults import DEFAULT_CATALOG_CHAIN_TIMEOUT_SECONDS
 from agentc_core.defaults import DEFAULT_CATALOG_FOLDER
+from agentc_core.defaults import DEFAULT_CATALOG_REPLICA_POLL_INTERVAL_SECONDS
+from agentc_core.defaults import DEFAULT_CATALOG_VERSION_TTL_SECONDS
 from agentc_core.defaults import DEFAULT_CLUSTER_DDL_RETRY_ATTEMPTS
 from agentc_core.defaults import DEFAULT_CLUSTER_DDL_RETRY_WAIT_SECONDS
 from agentc_core.defaults import DEFAULT_CLUSTER_WAIT_UNTIL_READY_SECONDS
 from agentc_core.defaults import DEFAULT_DDL_CREATE_INDEX_INTERVAL_SECONDS
+from agentc_core.defaults import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_RETRIES
 from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_NAME
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS
+from agentc_core.defaults import DEFAULT_EMBEDDING_RESCORING_FACTOR
 from agentc_core.defaults import DEFAULT_MODEL_CACHE_FOLDER
+from agentc_core.defaults import DEFAULT_QUERY_EMBEDDING_CACHE_SIZE
 from agentc_core.defaults import DEFAULT_VERBOSITY_LEVEL
 from agentc_core.learned.embedding import EmbeddingModel
 from agentc_core.provider.provider import ToolProvider
@@ -130,6 +141,55 @@ class RemoteCatalogConfig(pydantic_settings.BaseSettings):
     By default, this value is 5 seconds.
     """
 
+    catalog_chain_timeout_seconds: typing.Optional[float] = DEFAULT_CATALOG_CHAIN_TIMEOUT_SECONDS
+    """ Maximum wait time (in seconds) for each catalog when both a local and a remote catalog are searched.
+
+    Local and remote catalogs are searched concurrently, and the results of a catalog that does not respond within
+    this time are skipped (so a slow cluster cannot stall the results of a local catalog).
+    Set this value to :python:`None` to wait for every catalog.
+    By default, this value is 10 seconds.
+    """
+
+    catalog_version_ttl_seconds: typing.Optional[float] = DEFAULT_CATALOG_VERSION_TTL_SECONDS
+    """ Time (in seconds) that the resolved version of a remote catalog is cached for.
+
+    Spans and searches reuse this version instead of querying the catalog metadata on each call.
+    Set this value to :python:`None` to cache the version until :py:meth:`Catalog.refresh` is called, or to 0 to
+    disable the cache.
+    By default, this value is 60 seconds.
+    """
+
+    catalog_version_cas_invalidation: bool = False
+    """ A flag to check (with a single KV get) whether a new catalog has been published on each version access.
+
+    If set, a cached version is discarded as soon as 'agentc publish' is run (regardless of its TTL).
+    By default, this flag is not set.
+    """
+
+    catalog_replica: bool = False
+    """ A flag to serve remote catalogs from an in-process replica (instead of issuing a query per search).
+
+    If set, the items of the latest snapshot (or of :py:attr:`catalog_replica_snapshot`) are pulled from Couchbase
+    once, and searches on this snapshot are served from memory.
+    By default, this flag is not set.
+    """
+
+    catalog_replica_snapshot: typing.Optional[str] = None
+    """ The catalog snapshot to pin our replica to.
+
+    If this value is not set, the replica follows the latest snapshot (see
+    :py:attr:`catalog_replica_poll_interval_seconds`).
+    By default, this value is not set.
+    """
+
+    catalog_replica_poll_interval_seconds: typing.Optional[float] = DEFAULT_CATALOG_REPLICA_POLL_INTERVAL_SECONDS
+    """ Time (in seconds) between checks for a newly published snapshot (for replicas that are not pinned).
+
+    New snapshots are pulled in the background (only the items that have changed are fetched) and then swapped in.
+    Set this value to :python:`None` to only swap in new snapshots on :py:meth:`Catalog.refresh`.
+    By default, this value is 30 seconds.
+    """
+
     @pydantic.field_validator("conn_string")
     @classmethod
     def _conn_string_must_follow_supported_url_pattern(cls, v: str) -> str:
@@ -191,7 +251,7 @@ class RemoteCatalogConfig(pydantic_settings.BaseSettings):
     def _serialize_password_as_stars(self, _: pydantic.SecretStr, _info):
         return "***"
 
-    def Cluster(self) -> couchbase.cluster.Cluster:
+    def _cluster_options(self) -> couchbase.options.ClusterOptions:
         if self.conn_string is None:
             raise ValueError(
                 "Could not find the environment variable $AGENT_CATALOG_CONN_STRING!\n"
@@ -226,6 +286,10 @@ class RemoteCatalogConfig(pydantic_settings.BaseSettings):
         )
         options = couchbase.options.ClusterOptions(auth)
         options.apply_profile("wan_development")
+        return options
+
+    def Cluster(self) -> couchbase.cluster.Cluster:
+        options = self._cluster_options()
 
         # Connect to our cluster.
         logger.debug(f"Connecting to Couchbase cluster at {self.conn_string}...")
@@ -234,6 +298,20 @@ class RemoteCatalogConfig(pydantic_settings.BaseSettings):
         logger.debug("Connection successfully established.")
         return cluster
 
+    async def AsyncCluster(self) -> acouchbase.cluster.Cluster:
+        """An asyncio (acouchbase) counterpart of :py:meth:`Cluster`.
+
+        Note that an acouchbase cluster is bound to the event loop it was created on.
+        """
+        options = self._cluster_options()
+
+        # Connect to our cluster.
+        logger.debug(f"Connecting to Couchbase cluster at {self.conn_string} (asyncio)...")
+        cluster = await acouchbase.cluster.Cluster.connect(self.conn_string, options)
+        await cluster.wait_until_ready(datetime.timedelta(seconds=self.wait_until_ready_seconds))
+        logger.debug("Connection successfully established.")
+        return cluster
+
 
 class ToolRuntimeConfig(pydantic_settings.BaseSettings):
     model_config = pydantic_settings.SettingsConfigDict(env_file=".env", env_prefix="AGENT_CATALOG_", extra="ignore")
@@ -341,6 +419,78 @@ class LocalCatalogConfig(pydantic_settings.BaseSettings):
     If this value is set to 0, no rollover will occur and logs will not be compressed.
     """
 
+    lazy_catalog: bool = False
+    """ Flag to load local catalogs lazily.
+
+    When set, only the search-relevant fields of each catalog item (e.g., its name, description, embedding, and
+    annotations) are validated when a local catalog is loaded.
+    The remaining fields (e.g., the raw source of a tool) are validated the first time the item is returned.
+    By default, every catalog item is validated in full when a local catalog is loaded.
+    """
+
+    embedding_file: bool = False
+    """ Flag to store the embeddings of local catalogs in a separate (float32) ``.npy`` file.
+
+    When set, ``agentc index`` writes all embeddings of a catalog to a file next to its JSON file (e.g.,
+    ``tools.embeddings.npy``), and the JSON file only holds the row of each item's embedding.
+    Local catalogs memory-map this file on load, so processes that load the same catalog share its pages (and avoid
+    parsing each embedding from JSON).
+    By default, embeddings are stored in the catalog's JSON file.
+    """
+
+    embedding_quantization: typing.Optional[typing.Literal["float16", "int8"]] = None
+    """ Quantization (``float16`` or ``int8``) used to store and search the embeddings of local catalogs.
+
+    When set, ``agentc index`` also writes quantized unit-length embeddings next to the catalog's (float32) embedding
+    file, e.g., ``tools.embedding-codes.npy`` (this implies ``embedding_file``). ``int8`` embeddings use a per-item
+    scale, written to e.g., ``tools.embedding-scales.npy``.
+    This reduces the memory used to search a catalog by 2x (``float16``) or 4x (``int8``).
+    Local catalogs are searched in two passes: all candidates are first scored against the quantized embeddings, and
+    the best candidates are then rescored exactly against the (memory-mapped) float32 embedding file (see
+    ``embedding_rescoring_factor``).
+    By default, embeddings are stored and searched in float32.
+    """
+
+    embedding_rescoring_factor: int = DEFAULT_EMBEDDING_RESCORING_FACTOR
+    """ Number of candidates (per result) rescored exactly after a search over quantized embeddings.
+
+    For example, a search with a limit of 5 rescores the top 20 candidates of its quantized pass by default.
+    Raising this value makes ranking errors from quantization less likely at the cost of latency.
+    """
+
+    ann_index: bool = False
+    """ Flag to search local catalogs with an approximate nearest-neighbor (IVF-flat) index.
+
+    When set, ``agentc index`` persists an index (e.g., ``tools.ann.npz``) next to each local catalog file and updates
+    this index incrementally on subsequent calls.
+    When a local catalog is loaded, its index is validated against the catalog's version (and rebuilt in memory if the
+    index is missing or stale).
+    By default, local catalogs are searched exactly.
+    """
+
+    ann_index_lists: typing.Optional[int] = None
+    """ Number of lists (partitions) to build the ANN index with.
+
+    By default, this value is the square root of the number of catalog items.
+    """
+
+    ann_index_probes: int = DEFAULT_ANN_INDEX_PROBES
+    """ Number of lists searched per query when the ANN index is used.
+
+    Raising this value improves recall at the cost of latency (a value equal to the number of lists is an exact search).
+    """
+
+    embedding_cache_max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+    """ Maximum number of embeddings kept in the on-disk embedding cache (``$AGENT_CATALOG_CATALOG_PATH/embedding-cache``).
+
+    ``agentc index`` consults this cache (keyed by the hash of a catalog item's description and the embedding model
+    name) before computing an embedding, so catalog items whose descriptions have not changed are not re-embedded.
+    After indexing, entries not referenced by the local catalogs are removed (as are the least-recently-used entries
+    beyond this limit).
+    By default, this value is 100,000.
+    If this value is set to 0, the embedding cache is not used.
+    """
+
     @pydantic.field_validator("activity_path", mode="before")
     @classmethod
     def _empty_string_is_none_path(cls, v: typing.Any) -> typing.Any:
@@ -458,6 +608,35 @@ class EmbeddingModelConfig(LocalCatalogConfig, RemoteCatalogConfig):
     For endpoints hosted on Capella, this is your JWT.
     """
 
+    embedding_model_max_concurrency: int = DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY
+    """ The maximum number of concurrent requests sent to the endpoint specified by ``embedding_model_url``.
+
+    When many texts are embedded at once (e.g., by ``agentc index``), texts are sent in batches and up to this many
+    batches are in flight at a time.
+    By default, this value is 4.
+    """
+
+    embedding_model_requests_per_second: typing.Optional[float] = None
+    """ The maximum rate (in requests per second) at which requests are sent to ``embedding_model_url``.
+
+    This rate is shared by all users of the same endpoint in a process.
+    By default, requests are not rate-limited.
+    """
+
+    embedding_model_max_retries: int = DEFAULT_EMBEDDING_MODEL_MAX_RETRIES
+    """ The number of times a failed request to ``embedding_model_url`` is retried.
+
+    Only transient failures (e.g., connection errors, timeouts, 429 and 5xx responses) are retried, with exponential
+    backoff between attempts.
+    By default, this value is 5.
+    """
+
+    embedding_model_timeout_seconds: float = DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS
+    """ The number of seconds to wait for a response from ``embedding_model_url`` before retrying.
+
+    By default, this value is 60 seconds.
+    """
+
     sentence_transformers_model_cache: typing.Optional[str] = DEFAULT_MODEL_CACHE_FOLDER
     """ The path to the folder where sentence-transformer embedding models will be cached.
 
@@ -474,6 +653,51 @@ class EmbeddingModelConfig(LocalCatalogConfig, RemoteCatalogConfig):
     By default, this value is 3.
     """
 
+    sentence_transformers_backend: typing.Literal["torch", "onnx"] = "torch"
+    """ The runtime used to run sentence-transformers embedding models.
+
+    If this field is set to ``onnx``, the ONNX export of the model (``onnx/model.onnx``) is run with ONNX Runtime
+    instead of torch (this requires the ``onnxruntime``, ``tokenizers``, and ``huggingface_hub`` packages).
+    ONNX Runtime starts faster and uses less memory than torch on CPU-only machines.
+    By default, this value is ``torch``.
+    For OpenAI embedding models, this field is ignored.
+    """
+
+    sentence_transformers_onnx_quantization: typing.Optional[typing.Literal["int8"]] = None
+    """ The quantization applied to the ONNX export of a sentence-transformers embedding model.
+
+    If this field is set to ``int8``, model weights are dynamically quantized to int8 (once, and the quantized model
+    is kept in ``sentence_transformers_model_cache``).
+    This lowers encode latency further, at the cost of embeddings that differ slightly from their unquantized
+    counterparts (catalogs should be indexed and queried with the same setting).
+    By default, models are not quantized.
+    This field is only used if ``sentence_transformers_backend`` is ``onnx``.
+    """
+
+    embedding_model_query_cache_size: int = DEFAULT_QUERY_EMBEDDING_CACHE_SIZE
+    """ The maximum number of text embeddings to keep in memory (least-recently-used embeddings are evicted first).
+
+    Agents tend to issue the same queries repeatedly, so cached embeddings avoid recomputing these queries (and, for
+    OpenAI-client-compatible endpoints, a network round trip).
+    By default, this value is 1024.
+    If this value is set to 0, embeddings will not be cached.
+    """
+
+    embedding_model_query_cache_ttl_seconds: typing.Optional[float] = None
+    """ The number of seconds a cached text embedding remains valid for.
+
+    By default, cached embeddings do not expire (they are only evicted when the cache is full).
+    """
+
+    embedding_model_warm_up: bool = False
+    """ A flag to load the embedding model on a background thread as soon as a :py:class:`Catalog` is built.
+
+    Without this flag, the embedding model is loaded by the first search (which can take several seconds for
+    sentence-transformers models).
+    The :py:class:`Catalog` constructor never waits on this warm-up (see :py:meth:`Catalog.wait_until_ready`).
+    By default, this flag is not set.
+    """
+
     def EmbeddingModel(self, *load_from: typing.Literal["NAME", "LOCAL", "DB"]) -> EmbeddingModel:
         if len(load_from) == 0:
             load_from = (
@@ -481,8 +705,16 @@ class EmbeddingModelConfig(LocalCatalogConfig, RemoteCatalogConfig):
                 "LOCAL",
             )
         params = {
+            "embedding_model_max_concurrency": self.embedding_model_max_concurrency,
+            "embedding_model_requests_per_second": self.embedding_model_requests_per_second,
+            "embedding_model_max_retries": self.embedding_model_max_retries,
+            "embedding_model_timeout_seconds": self.embedding_model_timeout_seconds,
             "sentence_transformers_model_cache": self.sentence_transformers_model_cache,
             "sentence_transformers_retry_attempts": self.sentence_transformers_retry_attempts,
+            "sentence_transformers_backend": self.sentence_transformers_backend,
+            "sentence_transformers_onnx_quantization": self.sentence_transformers_onnx_quantization,
+            "query_cache_size": self.embedding_model_query_cache_size,
+            "query_cache_ttl_seconds": self.embedding_model_query_cache_ttl_seconds,
         }
         for source in set(load_from):
             match source.upper():
@@ -2,11 +2,26 @@ import gitignore_parser
 
 DEFAULT_EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L12-v2"
 DEFAULT_MODEL_CACHE_FOLDER = ".model-cache"
+DEFAULT_QUERY_EMBEDDING_CACHE_SIZE = 1024
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY = 4
+DEFAULT_EMBEDDING_MODEL_MAX_RETRIES = 5
+DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS = 60
 DEFAULT_CATALOG_FOLDER = ".agent-catalog"
 DEFAULT_CATALOG_SCOPE = "agent_catalog"
 DEFAULT_CATALOG_METADATA_COLLECTION = "metadata"
+DEFAULT_CATALOG_PAGE_SIZE = 500
 DEFAULT_CATALOG_TOOL_COLLECTION = "tools"
 DEFAULT_CATALOG_PROMPT_COLLECTION = "prompts"
+DEFAULT_CATALOG_BLOB_COLLECTION = "blobs"
+DEFAULT_CATALOG_FIND_MANY_MAX_WORKERS = 16
+DEFAULT_CATALOG_ITEM_KEY_MAX_BYTES = 250
+DEFAULT_CATALOG_KNN_MAX_CANDIDATES = 1000
+DEFAULT_CATALOG_KNN_MIN_CANDIDATES = 10
+DEFAULT_CATALOG_KNN_OVERSAMPLING = 2
+DEFAULT_CATALOG_LATEST_VERSION_KEY = "latest"
+DEFAULT_CATALOG_REPLICA_POLL_INTERVAL_SECONDS = 30
+DEFAULT_CATALOG_VERSION_TTL_SECONDS = 60
 DEFAULT_ACTIVITY_SCOPE = "agent_activity"
 DEFAULT_ACTIVITY_LOG_COLLECTION = "logs"
 DEFAULT_AUDIT_TESTS_COLLECTION = "tests"
@@ -20,12 +35,24 @@ DEFAULT_ACTIVITY_FOLDER = ".agent-activity"
 DEFAULT_ACTIVITY_FILE = "activity.log"
 DEFAULT_TOOL_CATALOG_FILE = "tools.json"
 DEFAULT_PROMPT_CATALOG_FILE = "prompts.json"
+DEFAULT_EMBEDDING_CACHE_FOLDER = "embedding-cache"
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 100_000
+DEFAULT_EMBEDDING_FILE_SUFFIX = ".embeddings.npy"
+DEFAULT_EMBEDDING_CODES_FILE_SUFFIX = ".embedding-codes.npy"
+DEFAULT_EMBEDDING_SCALES_FILE_SUFFIX = ".embedding-scales.npy"
+DEFAULT_EMBEDDING_RESCORING_FACTOR = 4
+DEFAULT_ANN_INDEX_FILE_SUFFIX = ".ann.npz"
+DEFAULT_ANN_INDEX_PROBES = 8
+DEFAULT_ANN_INDEX_ITERATIONS = 10
+DEFAULT_ANN_INDEX_TRAINING_SAMPLES_PER_LIST = 256
+DEFAULT_ANN_INDEX_REBUILD_RATIO = 0.5
 DEFAULT_WEB_HOST_PORT = "127.0.0.1:5555"
 DEFAULT_MAX_ERRS = 10
 DEFAULT_CLUSTER_WAIT_UNTIL_READY_SECONDS = 5
 DEFAULT_DDL_CREATE_INDEX_INTERVAL_SECONDS = 1
 DEFAULT_CLUSTER_DDL_RETRY_ATTEMPTS = 3
 DEFAULT_CLUSTER_DDL_RETRY_WAIT_SECONDS = 5
+DEFAULT_CATALOG_CHAIN_TIMEOUT_SECONDS = 10
 DEFAULT_VERBOSITY_LEVEL = 0
 DEFAULT_SCAN_DIRECTORY_OPTS = dict(
     unwanted_patterns=frozenset([".git", "*__pycache__*", "*.lock", "*.toml", "*.md"]),
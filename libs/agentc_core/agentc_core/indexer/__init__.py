@@ -1,5 +1,7 @@
+from .cache import EmbeddingCache
 from .indexer import AllIndexers
 from .indexer import augment_descriptor
 from .indexer import vectorize_descriptor
+from .indexer import vectorize_descriptors
 
-__all__ = ["vectorize_descriptor", "augment_descriptor", "AllIndexers"]
+__all__ = ["vectorize_descriptor", "vectorize_descriptors", "augment_descriptor", "AllIndexers", "EmbeddingCache"]
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import typing
+
+from ..defaults import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """A content-addressed, on-disk cache of text embeddings (used by ``agentc index``).
+
+    Each embedding is stored in its own file, named by the hash of the embedded text and the embedding model name.
+    Unlike the version-based reuse in :py:func:`init_from_catalog`, entries survive any change that leaves the text
+    of a catalog item untouched (e.g., a commit that moves a tool to a different file).
+    """
+
+    def __init__(self, cache_path: pathlib.Path, max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES):
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(text: str, model_name: str) -> str:
+        return hashlib.sha256(json.dumps([model_name, text]).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        # Entries are sharded by the first two characters of their key (to keep our directories small).
+        return self.cache_path / key[:2] / f"{key}.json"
+
+    def get(self, text: str, model_name: str) -> typing.Optional[list[float]]:
+        entry_path = self._entry_path(self.key(text, model_name))
+        try:
+            with entry_path.open("r") as fp:
+                embedding = json.load(fp)
+
+            # We touch our entry so that the least-recently-used entries are removed first.
+            os.utime(entry_path)
+            return embedding
+
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unable to read embedding cache entry {entry_path}. Swallowing exception {str(e)}.")
+            return None
+
+    def put(self, text: str, model_name: str, embedding: list[float]) -> None:
+        entry_path = self._entry_path(self.key(text, model_name))
+        if entry_path.exists():
+            return
+
+        # Entries are written atomically (concurrent indexers may share the same cache).
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=entry_path.parent, suffix=".tmp", delete=False) as fp:
+            json.dump(embedding, fp)
+        os.replace(fp.name, entry_path)
+
+    def collect(self, referenced_keys: typing.Iterable[str]) -> int:
+        """Removes all entries not in referenced_keys, and then the least-recently-used entries beyond max_entries.
+
+        :param referenced_keys: The keys of the texts found in the current catalog(s).
+        :return: The number of entries removed.
+        """
+        if not self.cache_path.exists():
+            return 0
+        referenced_keys = set(referenced_keys)
+        kept_entries, removed = list(), 0
+        for entry_path in self.cache_path.glob("*/*.json"):
+            if entry_path.stem in referenced_keys:
+                kept_entries.append(entry_path)
+            else:
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+        if len(kept_entries) > self.max_entries:
+            kept_entries.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+            for entry_path in kept_entries[self.max_entries :]:
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+        logger.debug(f"Removed {removed} entries from the embedding cache at {self.cache_path}.")
+        return removed
@@ -5,7 +5,9 @@ import pydantic
 import typing
 import yaml
 
+from ..defaults import DEFAULT_EMBEDDING_BATCH_SIZE
 from ..learned.embedding import EmbeddingModel
+from ..learned.pool import EmbeddingProcessPool
 from ..prompt.models import PromptDescriptor
 from ..record.descriptor import RecordDescriptor
 from ..record.descriptor import RecordKind
@@ -13,6 +15,7 @@ from ..tool.descriptor import HTTPRequestToolDescriptor
 from ..tool.descriptor import PythonToolDescriptor
 from ..tool.descriptor import SemanticSearchToolDescriptor
 from ..tool.descriptor import SQLPPQueryToolDescriptor
+from .cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -167,16 +170,48 @@ def augment_descriptor(descriptor: RecordDescriptor) -> list[ValueError]:
     return None
 
 
-def vectorize_descriptor(descriptor: RecordDescriptor, embedding_model: EmbeddingModel) -> list[ValueError]:
+def vectorize_descriptor(
+    descriptor: RecordDescriptor, embedding_model: EmbeddingModel, embedding_cache: EmbeddingCache = None
+) -> list[ValueError]:
     """Adds vector embeddings to a single catalog item descriptor (in-place,
     destructive), and/or return 'keep-on-going' errors if any encountered.
+    If an embedding cache is given, the cache is consulted before the embedding model.
+    """
+    return vectorize_descriptors([descriptor], embedding_model, embedding_cache=embedding_cache)
+
+
+def vectorize_descriptors(
+    descriptors: list[RecordDescriptor],
+    embedding_model: EmbeddingModel | EmbeddingProcessPool,
+    embedding_cache: EmbeddingCache = None,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+) -> list[ValueError]:
+    """Adds vector embeddings to a list of catalog item descriptors (in-place,
+    destructive), and/or return 'keep-on-going' errors if any encountered.
+    Descriptors whose embeddings are not in the (optional) embedding cache are
+    encoded together, in batches of batch_size descriptions.
     """
 
     # TODO: Different source file models might have different ways
     # to compute & add vector embedding(s), perhaps by using additional
     # fields besides description?
 
-    descriptor.embedding = embedding_model.encode(descriptor.description)
+    uncached_descriptors = list()
+    for descriptor in descriptors:
+        embedding = None
+        if embedding_cache is not None:
+            embedding = embedding_cache.get(descriptor.description, embedding_model.name)
+        if embedding is not None:
+            descriptor.embedding = embedding
+        else:
+            uncached_descriptors.append(descriptor)
+
+    if len(uncached_descriptors) > 0:
+        embeddings = embedding_model.encode_batch([d.description for d in uncached_descriptors], batch_size=batch_size)
+        for descriptor, embedding in zip(uncached_descriptors, embeddings, strict=True):
+            descriptor.embedding = embedding
+            if embedding_cache is not None:
+                embedding_cache.put(descriptor.description, embedding_model.name, embedding)
 
     return None
 
@@ -0,0 +1,85 @@
+import collections
+import dataclasses
+import threading
+import time
+import typing
+
+K = typing.TypeVar("K", bound=typing.Hashable)
+V = typing.TypeVar("V")
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class LRUCache(typing.Generic[K, V]):
+    """A thread-safe, size-bounded least-recently-used cache whose entries (optionally) expire after some TTL.
+
+    Entries are evicted when the cache exceeds max_size (least-recently-used first) or when they are accessed after
+    ttl_seconds have passed since they were inserted (expired entries are counted as misses and evictions).
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: typing.Optional[float] = None):
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative.")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive (or None for no expiry).")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        # Entries are kept in least-recently-used order (each value is stored alongside its insertion time).
+        self._entries: collections.OrderedDict[K, tuple[V, float]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> typing.Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, inserted_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - inserted_at > self.ttl_seconds:
+                del self._entries[key]
+                self._evictions += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            if self.max_size == 0:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
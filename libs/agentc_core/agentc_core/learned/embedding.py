@@ -1,19 +1,31 @@
 import agentc_core.learned.model
+import asyncio
+import concurrent.futures
 import couchbase.cluster
 import couchbase.exceptions
 import logging
 import os
 import pathlib
 import pydantic
+import threading
 import typing
+import weakref
 
 from agentc_core.catalog.descriptor import CatalogDescriptor
 from agentc_core.defaults import DEFAULT_CATALOG_METADATA_COLLECTION
 from agentc_core.defaults import DEFAULT_CATALOG_SCOPE
+from agentc_core.defaults import DEFAULT_EMBEDDING_BATCH_SIZE
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_RETRIES
 from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_NAME
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS
 from agentc_core.defaults import DEFAULT_MODEL_CACHE_FOLDER
 from agentc_core.defaults import DEFAULT_PROMPT_CATALOG_FILE
+from agentc_core.defaults import DEFAULT_QUERY_EMBEDDING_CACHE_SIZE
 from agentc_core.defaults import DEFAULT_TOOL_CATALOG_FILE
+from agentc_core.learned.cache import CacheStats
+from agentc_core.learned.cache import LRUCache
+from agentc_core.learned.registry import model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +38,12 @@ class EmbeddingModel(pydantic.BaseModel):
     embedding_model_url: typing.Optional[str] = None
     embedding_model_auth: typing.Optional[str] = None
 
+    # Parameters for our client of OpenAI-client-compatible endpoints (see learned/remote.py).
+    embedding_model_max_concurrency: int = pydantic.Field(default=DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY, ge=1)
+    embedding_model_requests_per_second: typing.Optional[float] = pydantic.Field(default=None, gt=0)
+    embedding_model_max_retries: int = pydantic.Field(default=DEFAULT_EMBEDDING_MODEL_MAX_RETRIES, ge=0)
+    embedding_model_timeout_seconds: float = pydantic.Field(default=DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS, gt=0)
+
     # ...or implicitly (by path)...
     catalog_path: typing.Optional[pathlib.Path] = None
 
@@ -36,10 +54,28 @@ class EmbeddingModel(pydantic.BaseModel):
     # Sentence-transformers-specific parameters.
     sentence_transformers_model_cache: typing.Optional[str] = DEFAULT_MODEL_CACHE_FOLDER
     sentence_transformers_retry_attempts: typing.Optional[int] = 3
+    sentence_transformers_backend: typing.Literal["torch", "onnx"] = "torch"
+    sentence_transformers_onnx_quantization: typing.Optional[typing.Literal["int8"]] = None
+
+    # Parameters for our (in-memory) cache of text embeddings (a size of 0 disables the cache).
+    query_cache_size: int = pydantic.Field(default=DEFAULT_QUERY_EMBEDDING_CACHE_SIZE, ge=0)
+    query_cache_ttl_seconds: typing.Optional[float] = pydantic.Field(default=None, gt=0)
 
     # The actual embedding model object (we won't type this to avoid the sentence transformers import).
     _embedding_model: None = None
 
+    # Releases our reference to the (process-wide) shared model behind _embedding_model (see learned/registry.py).
+    _release: typing.Optional[weakref.finalize] = None
+
+    # Guards the (one-time) load of our embedding model (e.g., when chained catalogs are searched concurrently).
+    _load_lock: typing.Optional[threading.Lock] = None
+
+    # Our cache of text embeddings, keyed by (embedding model name, embedding model URL, text).
+    _query_cache: typing.Optional[LRUCache[tuple[str, str, str], list[float]]] = None
+
+    # The (background) warm-up of our embedding model, if one has been started (see warm_up).
+    _warm_up: typing.Optional[concurrent.futures.Future] = None
+
     @pydantic.model_validator(mode="after")
     def _bucket_and_cluster_must_be_specified_together(self) -> "EmbeddingModel":
         if self.cb_bucket is not None and self.cb_cluster is None:
@@ -127,79 +163,245 @@ class EmbeddingModel(pydantic.BaseModel):
             raise ValueError("No embedding model found (run 'agentc init' to download one).")
 
         # Note: we won't validate the embedding model name because sentence_transformers takes a while to import.
-        self._embedding_model = None
+        # This validator also runs whenever this instance is given to another model (e.g., a catalog), so we must not
+        # discard an already loaded embedding model (or our cache) here.
+        if self._query_cache is None:
+            self._query_cache = LRUCache(max_size=self.query_cache_size, ttl_seconds=self.query_cache_ttl_seconds)
+        if self._load_lock is None:
+            self._load_lock = threading.Lock()
         return self
 
-    def _load(self) -> None:
-        if self.embedding_model_url is not None:
-            import openai
-
-            open_ai_client = openai.OpenAI(base_url=self.embedding_model_url, api_key=self.embedding_model_auth)
+    def _load_remote_client(self) -> typing.Any:
+        from agentc_core.learned.remote import RemoteEmbeddingClient
+
+        return RemoteEmbeddingClient(
+            base_url=self.embedding_model_url,
+            model_name=self.embedding_model_name,
+            auth=self.embedding_model_auth,
+            max_concurrency=self.embedding_model_max_concurrency,
+            requests_per_second=self.embedding_model_requests_per_second,
+            max_retries=self.embedding_model_max_retries,
+            timeout_seconds=self.embedding_model_timeout_seconds,
+        )
+
+    def _load_sentence_transformer(self) -> typing.Any:
+        if self.sentence_transformers_backend == "onnx":
+            return self._load_onnx_sentence_transformer()
+        try:
+            # This is to quiet any errors we get from sentence transformers.
+            os.environ["HF_HUB_VERBOSITY"] = "error"
+            os.environ["TRANSFORMERS_VERBOSITY"] = "error"
+            os.environ["TRANSFORMERS_NO_ADVISORY_WARNINGS"] = "1"
+
+            import sentence_transformers
+        except ImportError as e:
+            msg = (
+                "sentence-transformers package not found! "
+                "Please install sentence-transformers using "
+                "`pip install sentence-transformers` for pip environments, "
+                "`poetry add sentence-transformers` for poetry environments, or "
+                "`uv add sentence-transformers` for uv environments."
+            )
+            raise ImportError(msg) from e
 
-            def _encode(_text: str) -> list[float]:
-                return (
-                    open_ai_client.embeddings.create(
-                        model=self.embedding_model_name, input=_text, encoding_format="float"
-                    )
-                    .data[0]
-                    .embedding
+        last_error: Exception = None
+        for i in range(self.sentence_transformers_retry_attempts):
+            try:
+                return sentence_transformers.SentenceTransformer(
+                    self.embedding_model_name,
+                    processor_kwargs={"clean_up_tokenization_spaces": True},
+                    cache_folder=self.sentence_transformers_model_cache,
+                    local_files_only=i == 0,
                 )
 
-            self._embedding_model = _encode
+            except OSError as e:
+                logger.warning(f"Failed to load embedding model {self.embedding_model_name} (attempt {i}): {e}")
+                last_error = e
 
-        else:
+        # If we still don't have an embedding model, raise an exception.
+        raise last_error
+
+    def _load_onnx_sentence_transformer(self) -> typing.Any:
+        from agentc_core.learned.onnx import ONNXSentenceTransformer
+
+        last_error: Exception = None
+        for i in range(self.sentence_transformers_retry_attempts):
             try:
-                # This is to quiet any errors we get from sentence transformers.
-                os.environ["HF_HUB_VERBOSITY"] = "error"
-                os.environ["TRANSFORMERS_VERBOSITY"] = "error"
-                os.environ["TRANSFORMERS_NO_ADVISORY_WARNINGS"] = "1"
-
-                import sentence_transformers
-            except ImportError as e:
-                msg = (
-                    "sentence-transformers package not found! "
-                    "Please install sentence-transformers using "
-                    "`pip install sentence-transformers` for pip environments, "
-                    "`poetry add sentence-transformers` for poetry environments, or "
-                    "`uv add sentence-transformers` for uv environments."
+                return ONNXSentenceTransformer(
+                    self.embedding_model_name,
+                    cache_folder=self.sentence_transformers_model_cache,
+                    local_files_only=i == 0,
+                    quantization=self.sentence_transformers_onnx_quantization,
                 )
-                raise ImportError(msg) from e
-
-            embedding_model = None
-            last_error: Exception = None
-            for i in range(self.sentence_transformers_retry_attempts):
-                try:
-                    embedding_model = sentence_transformers.SentenceTransformer(
-                        self.embedding_model_name,
-                        processor_kwargs={"clean_up_tokenization_spaces": True},
-                        cache_folder=self.sentence_transformers_model_cache,
-                        local_files_only=i == 0,
-                    )
-                    break
 
-                except OSError as e:
-                    logger.warning(f"Failed to load embedding model {self.embedding_model_name} (attempt {i}): {e}")
-                    last_error = e
+            except OSError as e:
+                logger.warning(f"Failed to load embedding model {self.embedding_model_name} (attempt {i}): {e}")
+                last_error = e
+        raise last_error
 
-            # If we still don't have an embedding model, raise an exception.
-            if embedding_model is None:
-                raise last_error
+    def _load(self) -> None:
+        # Models are shared by all instances (in this process) with the same key, so weights are only loaded once.
+        # Note: our encoders must not reference self (otherwise, our reference would outlive this instance).
+        embedding_model_name = self.embedding_model_name
+        if self.embedding_model_url is not None:
+            # Note: the rate limit of an endpoint is shared by all instances (it is set by the first instance).
+            key = (embedding_model_name, self.embedding_model_url, self.embedding_model_auth, None, "remote")
+            shared_model = model_registry.acquire(key, self._load_remote_client)
 
-            else:
+            def _encode(_texts: list[str], batch_size: int = None) -> list[list[float]]:
+                return shared_model.model.embed(_texts, batch_size=batch_size)
 
-                def _encode(_text: str) -> list[float]:
-                    return embedding_model.encode(_text, normalize_embeddings=True).tolist()
+        else:
+            # Note: (fast) tokenizers cannot be used by multiple threads at once, so encodes are serialized here.
+            backend = self.sentence_transformers_backend
+            if backend == "onnx" and self.sentence_transformers_onnx_quantization is not None:
+                backend += f"-{self.sentence_transformers_onnx_quantization}"
+            key = (embedding_model_name, None, None, self.sentence_transformers_model_cache, backend)
+            shared_model = model_registry.acquire(key, self._load_sentence_transformer, thread_safe=False)
+
+            # Normalize embeddings to unit length (only dot-product is computed with Couchbase, so...).
+            def _encode(_texts: list[str]) -> list[list[float]]:
+                with shared_model.use() as embedding_model:
+                    return embedding_model.encode(_texts, batch_size=len(_texts), normalize_embeddings=True).tolist()
+
+        # Our reference is released when this instance is closed (or garbage collected).
+        self._release = weakref.finalize(self, model_registry.release, shared_model)
+        self._embedding_model = _encode
+
+    def close(self) -> None:
+        """Release our reference to our (shared) embedding model, which is dropped once it is no longer referenced.
+
+        Encoding after this call loads (or reuses) the model again.
+        """
+        with self._load_lock:
+            if self._release is not None:
+                self._release()
+                self._release = None
+            self._embedding_model = None
+
+    def _encode(self, texts: list[str], **kwargs) -> list[list[float]]:
+        if self._embedding_model is None:
+            with self._load_lock:
+                if self._embedding_model is None:
+                    self._load()
+        return self._embedding_model(texts, **kwargs)
+
+    async def _aencode(self, texts: list[str], **kwargs) -> list[list[float]]:
+        # Neither our (shared) remote client nor sentence-transformers models are asyncio-aware, so both are run on a
+        # worker thread (i.e., remote requests are bounded, rate-limited, and retried exactly as in _encode).
+        return await asyncio.to_thread(self._encode, texts, **kwargs)
+
+    def _lookup(self, texts: list[str]) -> tuple[list[typing.Optional[list[float]]], list[str]]:
+        # Only the texts we have not seen (recently) are given to the model.
+        embeddings: list[typing.Optional[list[float]]] = [
+            self._query_cache.get((self.embedding_model_name, self.embedding_model_url, text)) for text in texts
+        ]
+        missing_texts = list(dict.fromkeys(t for t, e in zip(texts, embeddings, strict=True) if e is None))
+        return embeddings, missing_texts
+
+    def _merge(
+        self,
+        texts: list[str],
+        embeddings: list[typing.Optional[list[float]]],
+        missing_embeddings: dict[str, list[float]],
+    ) -> list[list[float]]:
+        for text, embedding in missing_embeddings.items():
+            self._query_cache.put((self.embedding_model_name, self.embedding_model_url, text), embedding)
+        return [e if e is not None else missing_embeddings[t] for t, e in zip(texts, embeddings, strict=True)]
+
+    def warm_up(self) -> concurrent.futures.Future:
+        """Load our embedding model (and encode one dummy text) on a daemon thread, without blocking the caller.
+
+        The returned future resolves to None once the model is ready (or holds the error raised while loading it).
+        Subsequent calls return the same future.
+        """
+        if self._warm_up is not None:
+            return self._warm_up
+
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        self._warm_up = future
+
+        def _warm_up():
+            try:
+                # Note: we bypass our cache here (the dummy embedding is of no use to anyone).
+                self._encode(["warm-up"])
+                logger.debug("Embedding model %s has been warmed up.", self.embedding_model_name)
+                future.set_result(None)
+            except Exception as e:
+                logger.warning(f"Failed to warm up embedding model {self.embedding_model_name}: {e}")
+                future.set_exception(e)
 
-                self._embedding_model = _encode
+        threading.Thread(target=_warm_up, name="agentc-embedding-warm-up", daemon=True).start()
+        return future
 
     @property
     def name(self) -> str:
         return self.embedding_model_name
 
-    # TODO (GLENN): Leverage batch encoding for performance here.
+    @property
+    def concurrency(self) -> int:
+        """The number of batches :py:meth:`encode_batch` encodes at once (i.e., callers should give it this many
+        batches worth of texts at a time)."""
+        return self.embedding_model_max_concurrency if self.embedding_model_url is not None else 1
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """The hit, miss, and eviction counts of our text embedding cache (for monitoring)."""
+        return self._query_cache.stats
+
     def encode(self, text: str) -> list[float]:
-        if self._embedding_model is None:
-            self._load()
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts: list[str], batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE) -> list[list[float]]:
+        """Encodes all texts in batches of (at most) batch_size texts (one embedding per text, in order).
+
+        Each batch is a single call to the underlying model (a batched encode for sentence-transformers models, and a
+        multi-input request for OpenAI-client-compatible endpoints).
+        Requests to OpenAI-client-compatible endpoints are sent concurrently (at most embedding_model_max_concurrency at
+        once), rate-limited, and retried (see :py:class:`agentc_core.learned.remote.RemoteEmbeddingClient`).
+        Texts that have been encoded recently are served from our cache (and are not sent to the model).
+        """
+        if len(texts) == 0:
+            return list()
+
+        embeddings, missing_texts = self._lookup(texts)
+        if self.embedding_model_url is not None and len(missing_texts) > 0:
+            missing_embeddings = dict(
+                zip(missing_texts, self._encode(missing_texts, batch_size=batch_size), strict=True)
+            )
+            return self._merge(texts, embeddings, missing_embeddings)
+
+        missing_embeddings = dict()
+        for i in range(0, len(missing_texts), batch_size):
+            batch = missing_texts[i : i + batch_size]
+            missing_embeddings.update(zip(batch, self._encode(batch), strict=True))
+        return self._merge(texts, embeddings, missing_embeddings)
+
+    async def aencode(self, text: str) -> list[float]:
+        return (await self.aencode_batch([text]))[0]
+
+    async def aencode_batch(
+        self, texts: list[str], batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
+    ) -> list[list[float]]:
+        """An asyncio counterpart of :py:meth:`encode_batch` that never blocks the event loop.
+
+        Models are run on a worker thread, so requests to OpenAI-client-compatible endpoints are sent exactly as in
+        :py:meth:`encode_batch` (concurrently, but at most embedding_model_max_concurrency at once, rate-limited, and
+        retried).
+        """
+        if len(texts) == 0:
+            return list()
+
+        embeddings, missing_texts = self._lookup(texts)
+        if self.embedding_model_url is not None and len(missing_texts) > 0:
+            missing_embeddings = dict(
+                zip(missing_texts, await self._aencode(missing_texts, batch_size=batch_size), strict=True)
+            )
+            return self._merge(texts, embeddings, missing_embeddings)
 
-        # Normalize embeddings to unit length (only dot-product is computed with Couchbase, so...).
-        return self._embedding_model(text)
+        missing_embeddings = dict()
+        for i in range(0, len(missing_texts), batch_size):
+            batch = missing_texts[i : i + batch_size]
+            missing_embeddings.update(zip(batch, await self._aencode(batch), strict=True))
+        return self._merge(texts, embeddings, missing_embeddings)
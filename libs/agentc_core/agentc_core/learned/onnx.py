@@ -0,0 +1,179 @@
+import json
+import logging
+import numpy
+import os
+import pathlib
+import typing
+
+logger = logging.getLogger(__name__)
+
+# The files we need from a sentence-transformers model repository (we never fetch the torch weights).
+_MODEL_FILE_PATTERNS = [
+    "onnx/model.onnx",
+    "model.onnx",
+    "tokenizer.json",
+    "tokenizer_config.json",
+    "special_tokens_map.json",
+    "config.json",
+    "sentence_bert_config.json",
+    "modules.json",
+    "1_Pooling/config.json",
+]
+
+# Models that do not define a maximum sequence length are truncated at this length.
+_DEFAULT_MAX_SEQUENCE_LENGTH = 512
+
+
+def _import_error(package: str) -> ImportError:
+    return ImportError(
+        f"{package} package not found! "
+        f"Please install {package} using "
+        f"`pip install {package}` for pip environments, "
+        f"`poetry add {package}` for poetry environments, or "
+        f"`uv add {package}` for uv environments."
+    )
+
+
+def _read_json(path: pathlib.Path) -> dict:
+    if not path.exists():
+        return dict()
+    with path.open("r") as fp:
+        return json.load(fp)
+
+
+class ONNXSentenceTransformer:
+    """A sentence-transformers model that is run with ONNX Runtime (i.e., without importing torch).
+
+    The ONNX export of a model (``onnx/model.onnx``, shipped by most ``sentence-transformers/*`` repositories) and its
+    tokenizer are read from (or fetched into) the given model cache folder.
+    If ``quantization`` is ``int8``, the weights of the export are dynamically quantized to int8 (once, and the result
+    is kept in the model cache folder).
+    Instances mirror the :py:meth:`sentence_transformers.SentenceTransformer.encode` method we use.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_folder: str = None,
+        local_files_only: bool = True,
+        quantization: typing.Optional[typing.Literal["int8"]] = None,
+    ):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise _import_error("onnxruntime") from e
+        try:
+            import tokenizers
+        except ImportError as e:
+            raise _import_error("tokenizers") from e
+
+        model_folder = self._model_folder(model_name, cache_folder, local_files_only)
+        model_file = model_folder / "onnx" / "model.onnx"
+        if not model_file.exists():
+            model_file = model_folder / "model.onnx"
+        if not model_file.exists():
+            raise FileNotFoundError(
+                f"No ONNX export found for embedding model {model_name}! "
+                "Please export the model first, e.g., with "
+                f"`SentenceTransformer('{model_name}', backend='onnx').save_pretrained('<folder>')`."
+            )
+        if quantization == "int8":
+            model_file = self._quantize(model_file)
+        elif quantization is not None:
+            raise ValueError(f"Unknown ONNX quantization '{quantization}'.")
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = onnxruntime.InferenceSession(
+            str(model_file), session_options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {x.name for x in self._session.get_inputs()}
+        output_names = [x.name for x in self._session.get_outputs()]
+        self._output_index = output_names.index("last_hidden_state") if "last_hidden_state" in output_names else 0
+
+        # Our tokenizer pads (and truncates) each batch like its sentence-transformers counterpart.
+        max_sequence_length = _read_json(model_folder / "sentence_bert_config.json").get("max_seq_length")
+        tokenizer_config = _read_json(model_folder / "tokenizer_config.json")
+        if max_sequence_length is None:
+            max_sequence_length = min(tokenizer_config.get("model_max_length", 0), _DEFAULT_MAX_SEQUENCE_LENGTH)
+        self._tokenizer = tokenizers.Tokenizer.from_file(str(model_folder / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=max_sequence_length or _DEFAULT_MAX_SEQUENCE_LENGTH)
+        pad_token = tokenizer_config.get("pad_token", "[PAD]")
+        if isinstance(pad_token, dict):
+            pad_token = pad_token["content"]
+        self._tokenizer.enable_padding(pad_id=self._tokenizer.token_to_id(pad_token) or 0, pad_token=pad_token)
+
+        pooling_config = _read_json(model_folder / "1_Pooling" / "config.json")
+        if pooling_config.get("pooling_mode_cls_token", False):
+            self._pooling = "cls"
+        elif pooling_config.get("pooling_mode_max_tokens", False):
+            self._pooling = "max"
+        else:
+            self._pooling = "mean"
+
+    @staticmethod
+    def _model_folder(model_name: str, cache_folder: str, local_files_only: bool) -> pathlib.Path:
+        if pathlib.Path(model_name).is_dir():
+            return pathlib.Path(model_name)
+        try:
+            import huggingface_hub
+        except ImportError as e:
+            raise _import_error("huggingface_hub") from e
+
+        # Like sentence-transformers, we assume that unqualified model names belong to the sentence-transformers org.
+        repo_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        return pathlib.Path(
+            huggingface_hub.snapshot_download(
+                repo_id,
+                cache_dir=cache_folder,
+                local_files_only=local_files_only,
+                allow_patterns=_MODEL_FILE_PATTERNS,
+            )
+        )
+
+    @staticmethod
+    def _quantize(model_file: pathlib.Path) -> pathlib.Path:
+        quantized_file = model_file.with_name(model_file.stem + "_qint8_dynamic.onnx")
+        if quantized_file.exists():
+            return quantized_file
+
+        from onnxruntime.quantization import QuantType
+        from onnxruntime.quantization import quantize_dynamic
+
+        logger.debug("Quantizing ONNX embedding model %s to int8.", str(model_file))
+
+        # Note: we write to a temporary file first (concurrent loads of the same model should never see a partial file).
+        temporary_file = quantized_file.with_suffix(f".{os.getpid()}.tmp")
+        quantize_dynamic(str(model_file), str(temporary_file), weight_type=QuantType.QInt8)
+        temporary_file.replace(quantized_file)
+        return quantized_file
+
+    def _pool(self, token_embeddings: numpy.ndarray, attention_mask: numpy.ndarray) -> numpy.ndarray:
+        if self._pooling == "cls":
+            return token_embeddings[:, 0]
+        mask = attention_mask[:, :, None].astype(token_embeddings.dtype)
+        if self._pooling == "max":
+            return numpy.max(numpy.where(mask > 0, token_embeddings, -numpy.inf), axis=1)
+        return numpy.sum(token_embeddings * mask, axis=1) / numpy.clip(numpy.sum(mask, axis=1), 1e-9, None)
+
+    def encode(
+        self, sentences: list[str], batch_size: int = 32, normalize_embeddings: bool = False, **kwargs
+    ) -> numpy.ndarray:
+        """Returns a (sentences x dimension) float32 matrix of sentence embeddings."""
+        batches = list()
+        for i in range(0, len(sentences), max(batch_size, 1)):
+            encodings = self._tokenizer.encode_batch(sentences[i : i + batch_size])
+            attention_mask = numpy.array([e.attention_mask for e in encodings], dtype=numpy.int64)
+            feeds = {
+                "input_ids": numpy.array([e.ids for e in encodings], dtype=numpy.int64),
+                "attention_mask": attention_mask,
+            }
+            if "token_type_ids" in self._input_names:
+                feeds["token_type_ids"] = numpy.array([e.type_ids for e in encodings], dtype=numpy.int64)
+            token_embeddings = self._session.run(None, feeds)[self._output_index]
+            batches.append(self._pool(token_embeddings, attention_mask))
+
+        embeddings = numpy.concatenate(batches).astype(numpy.float32) if batches else numpy.empty((0, 0))
+        if normalize_embeddings and len(embeddings) > 0:
+            embeddings /= numpy.clip(numpy.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
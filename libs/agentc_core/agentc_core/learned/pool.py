@@ -0,0 +1,84 @@
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+
+from agentc_core.defaults import DEFAULT_EMBEDDING_BATCH_SIZE
+from agentc_core.learned.embedding import EmbeddingModel
+
+logger = logging.getLogger(__name__)
+
+# The embedding model of a worker process (loaded once, by _initialize_worker).
+_worker_embedding_model: EmbeddingModel = None
+
+
+def _initialize_worker(model_class: type[EmbeddingModel], parameters: dict, threads_per_worker: int) -> None:
+    global _worker_embedding_model
+
+    # Each worker should only use its share of our cores (torch and ONNX Runtime otherwise use every core).
+    for variable in ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"]:
+        os.environ.setdefault(variable, str(threads_per_worker))
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    _worker_embedding_model = model_class(**parameters)
+    _worker_embedding_model._encode(["warm-up"])
+
+
+def _encode_shard(texts: list[str]) -> list[list[float]]:
+    return _worker_embedding_model.encode_batch(texts, batch_size=len(texts))
+
+
+class EmbeddingProcessPool:
+    """A pool of worker processes that encode texts with (their own copy of) a local embedding model.
+
+    Each worker loads the model once.
+    :py:meth:`encode_batch` shards its texts across all workers and returns their embeddings in order, so instances
+    can be used in place of an :py:class:`EmbeddingModel` for bulk encoding (e.g., by ``agentc index --jobs N``).
+    """
+
+    def __init__(self, embedding_model: EmbeddingModel, jobs: int):
+        self.embedding_model = embedding_model
+        self.jobs = jobs
+
+        # Only the parameters that identify our model are given to our workers (e.g., clusters cannot be pickled).
+        # Note: workers are spawned (not forked), as our process may already be running other threads.
+        parameters = embedding_model.model_dump(
+            include={
+                "embedding_model_name",
+                "sentence_transformers_model_cache",
+                "sentence_transformers_retry_attempts",
+                "sentence_transformers_backend",
+                "sentence_transformers_onnx_quantization",
+            }
+        )
+        parameters["query_cache_size"] = 0
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(type(embedding_model), parameters, max(1, (os.cpu_count() or 1) // jobs)),
+        )
+        logger.debug(f"Started {jobs} embedding worker(s) for {embedding_model.name}.")
+
+    @property
+    def name(self) -> str:
+        return self.embedding_model.name
+
+    @property
+    def concurrency(self) -> int:
+        return self.jobs
+
+    def encode_batch(self, texts: list[str], batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE) -> list[list[float]]:
+        shards = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        embeddings = list()
+        for shard_embeddings in self._executor.map(_encode_shard, shards):
+            embeddings.extend(shard_embeddings)
+        return embeddings
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "EmbeddingProcessPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,84 @@
+import contextlib
+import logging
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Models are keyed by (embedding model name, embedding model URL, embedding model auth, model cache folder, backend).
+# Note: the auth token is part of our key because the clients of OpenAI-client-compatible endpoints are bound to it.
+ModelKey = tuple[str, typing.Optional[str], typing.Optional[str], typing.Optional[str], str]
+
+
+class SharedModel:
+    """A loaded embedding model (e.g., a SentenceTransformer instance) that is shared by all users of the same key.
+
+    Models that are not thread-safe are only used by one thread at a time (see :py:meth:`use`).
+    """
+
+    def __init__(self, key: ModelKey, thread_safe: bool):
+        self.key = key
+        self.model: typing.Any = None
+        self.references = 0
+        self._load_lock = threading.Lock()
+        self._use_lock = None if thread_safe else threading.Lock()
+
+    @contextlib.contextmanager
+    def use(self) -> typing.Iterator[typing.Any]:
+        if self._use_lock is None:
+            yield self.model
+        else:
+            with self._use_lock:
+                yield self.model
+
+
+class ModelRegistry:
+    """A (thread-safe) registry of reference-counted embedding models.
+
+    The first :py:meth:`acquire` of a key loads its model, and the model is dropped once the last reference to it has
+    been released.
+    Loads of different keys do not block each other.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: dict[ModelKey, SharedModel] = dict()
+
+    def acquire(self, key: ModelKey, load: typing.Callable[[], typing.Any], thread_safe: bool = True) -> SharedModel:
+        with self._lock:
+            shared_model = self._models.get(key)
+            if shared_model is None:
+                shared_model = SharedModel(key, thread_safe)
+                self._models[key] = shared_model
+            shared_model.references += 1
+
+        # Concurrent acquisitions of the same key wait for (and then reuse) the first load.
+        try:
+            with shared_model._load_lock:
+                if shared_model.model is None:
+                    logger.debug("Loading shared embedding model %s.", key[0])
+                    shared_model.model = load()
+        except Exception:
+            self.release(shared_model)
+            raise
+        return shared_model
+
+    def release(self, shared_model: SharedModel) -> None:
+        with self._lock:
+            shared_model.references -= 1
+            if shared_model.references == 0 and self._models.get(shared_model.key) is shared_model:
+                logger.debug("Dropping shared embedding model %s.", shared_model.key[0])
+                del self._models[shared_model.key]
+
+    def references(self, key: ModelKey) -> int:
+        with self._lock:
+            shared_model = self._models.get(key)
+            return shared_model.references if shared_model is not None else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+
+# Our process-wide registry, shared by all EmbeddingModel instances (and by our generated semantic search tools).
+model_registry = ModelRegistry()
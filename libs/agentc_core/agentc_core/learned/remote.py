@@ -0,0 +1,147 @@
+import concurrent.futures
+import logging
+import random
+import requests
+import threading
+import time
+import typing
+
+from agentc_core.defaults import DEFAULT_EMBEDDING_BATCH_SIZE
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_MAX_RETRIES
+from agentc_core.defaults import DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Responses with these status codes are (transient) errors worth retrying.
+_RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# The backoff before our i-th retry is (at most) _BACKOFF_BASE_SECONDS * 2^i, capped at _BACKOFF_MAX_SECONDS.
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 30.0
+
+
+class TokenBucket:
+    """A (thread-safe) token-bucket rate limiter that allows ``rate`` acquisitions per second.
+
+    Up to ``capacity`` tokens accumulate while the bucket is idle (by default, one second worth of tokens), so short
+    bursts are not throttled.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` tokens are available (and take them)."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_seconds = (tokens - self._tokens) / self.rate
+
+            # Note: we do not hold our lock while sleeping (other threads may refill and acquire in the meantime).
+            time.sleep(wait_seconds)
+
+
+class RemoteEmbeddingClient:
+    """A client for the embeddings API of OpenAI-client-compatible endpoints, built for bulk encoding.
+
+    Texts are sent in batches (one request per batch), and batches are sent concurrently (at most ``max_concurrency``
+    requests are in flight at once).
+    Requests are optionally rate-limited (``requests_per_second``) and transient failures (connection errors, timeouts,
+    and 408 / 409 / 429 / 5xx responses) are retried with exponential backoff (honoring ``Retry-After``).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model_name: str,
+        auth: str = None,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_EMBEDDING_MODEL_MAX_CONCURRENCY,
+        requests_per_second: float = None,
+        max_retries: int = DEFAULT_EMBEDDING_MODEL_MAX_RETRIES,
+        timeout_seconds: float = DEFAULT_EMBEDDING_MODEL_TIMEOUT_SECONDS,
+    ):
+        self.url = base_url.rstrip("/") + "/embeddings"
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.timeout_seconds = timeout_seconds
+        self._rate_limiter = TokenBucket(requests_per_second) if requests_per_second is not None else None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="agentc-embedding-client"
+        )
+
+        # Note: requests sessions are not guaranteed to be thread-safe, so each of our workers has its own session.
+        self._headers = {"Content-Type": "application/json"}
+        if auth is not None:
+            self._headers["Authorization"] = f"Bearer {auth}"
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(self._headers)
+        return self._local.session
+
+    def _backoff_seconds(self, attempt: int, response: typing.Optional[requests.Response]) -> float:
+        if response is not None and "Retry-After" in response.headers:
+            try:
+                return min(float(response.headers["Retry-After"]), _BACKOFF_MAX_SECONDS)
+            except ValueError:
+                pass
+
+        # We use "full jitter" here (so clients that failed together do not retry together).
+        return random.uniform(0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2**attempt))
+
+    def _request(self, texts: list[str]) -> list[list[float]]:
+        body = {"model": self.model_name, "input": texts, "encoding_format": "float"}
+        for attempt in range(self.max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            response = None
+            try:
+                response = self._session().post(self.url, json=body, timeout=self.timeout_seconds)
+                if response.status_code not in _RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    data = response.json()["data"]
+                    return [x["embedding"] for x in sorted(data, key=lambda x: x["index"])]
+                error = requests.HTTPError(f"{response.status_code} response from {self.url}.", response=response)
+
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if attempt == self.max_retries:
+                raise error
+            backoff_seconds = self._backoff_seconds(attempt, response)
+            logger.debug(f"Embedding request failed (attempt {attempt}): {error}. Retrying in {backoff_seconds:.2f}s.")
+            time.sleep(backoff_seconds)
+
+    def embed(self, texts: list[str], batch_size: int = None) -> list[list[float]]:
+        """Returns the embeddings of all texts (in order), sending each batch of (at most) batch_size texts
+        concurrently."""
+        batch_size = batch_size or self.batch_size
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            return self._request(texts) if len(texts) > 0 else list()
+
+        embeddings = list()
+        for batch_embeddings in self._executor.map(self._request, batches):
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -65,6 +65,7 @@ class EntryLoader:
     def __init__(
         self,
         output: typing.Optional[pathlib.Path | tempfile.TemporaryDirectory],
+        resolve_blob: typing.Callable[[str], typing.Optional[str]] = None,
     ):
         # TODO (GLENN): We should close this somewhere (need to add a close method).
         if isinstance(output, pathlib.Path):
@@ -77,6 +78,9 @@ class EntryLoader:
             logger.warning("Unexpected output type given! Attempting to convert to a pathlib.Path.")
             self.output = pathlib.Path(output)
 
+        # Used to resolve the raw contents of entries that only hold a reference (raw_ref) to these contents.
+        self._resolve_blob = resolve_blob
+
         # Signal to Python that it should also search for modules in our _ModuleFinder.
         self._modules = dict()
         self._loader = _ModuleLoader()
@@ -100,6 +104,14 @@ class EntryLoader:
                     fp.write(module_content)
                 self._load_module_from_filename(self.output / f"{module_name}.py")
 
+    def _resolve_raw(self, entry: RecordDescriptor) -> str:
+        if entry.raw is not None:
+            return entry.raw
+        content = self._resolve_blob(entry.raw_ref) if self._resolve_blob is not None else None
+        if content is None:
+            raise ValueError(f"Could not resolve the indexed contents of {entry.name} (blob {entry.raw_ref}).")
+        return content
+
     def _get_tool_from_module(self, module_name: str, entry: RecordDescriptor) -> typing.Callable:
         for name, tool in inspect.getmembers(self._modules[module_name]):
             if not is_tool(tool):
@@ -133,7 +145,7 @@ class EntryLoader:
                     except ModuleNotFoundError as e:
                         logger.debug(f"Swallowing exception {str(e)} (raised while trying to import {source_file}).")
                         logger.warning(f"Module {source_file} not found. Attempting to use the indexed contents.")
-                        self._load_module_from_string(source_file.stem, entries[0].raw)
+                        self._load_module_from_string(source_file.stem, self._resolve_raw(entries[0]))
                     for entry in entries:
                         loaded_entry = self._get_tool_from_module(source_file.stem, entry)
                         yield LoadResult(record_descriptor=entry, func=loaded_entry, args_schema=None)
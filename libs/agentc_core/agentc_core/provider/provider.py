@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import dataclasses
 import logging
 import os
@@ -57,7 +58,7 @@ class ToolProvider(BaseProvider):
         """
         super(ToolProvider, self).__init__(catalog=catalog, refiner=refiner)
         self._tool_cache = dict()
-        self._loader = EntryLoader(output=output)
+        self._loader = EntryLoader(output=output, resolve_blob=catalog.resolve_blob)
 
         # Handle our defaults.
         self.decorator = decorator
@@ -70,6 +71,21 @@ class ToolProvider(BaseProvider):
         result = self._tool_cache[tool_descriptor]
         return result if self.decorator is None else self.decorator(result)
 
+    def _load_into_cache(self, results: list[SearchResult]):
+        # Load all tools that we have not already cached (loading each unique tool once).
+        non_cached_results = list(dict.fromkeys(f.entry for f in results if f.entry not in self._tool_cache))
+        for load_result in self._loader.load(non_cached_results):
+            self._tool_cache[load_result["record_descriptor"]] = ToolProvider.ToolResult(
+                func=load_result["func"],
+                meta=load_result["record_descriptor"],
+                input=load_result["args_schema"],
+            )
+
+    async def _aload_into_cache(self, results: list[SearchResult]):
+        # Loading a tool may touch the disk (or the cluster), so tools we have not cached are loaded on a worker thread.
+        if any(f.entry not in self._tool_cache for f in results):
+            await asyncio.to_thread(self._load_into_cache, results)
+
     def find_with_query(
         self,
         query: str,
@@ -88,32 +104,102 @@ class ToolProvider(BaseProvider):
         results = self.refiner(
             self.catalog.find(query=query, snapshot=snapshot, annotations=annotation_predicate, limit=limit)
         )
+        self._load_into_cache(results)
 
-        # Load all tools that we have not already cached.
-        non_cached_results = [f.entry for f in results if f.entry not in self._tool_cache]
-        for load_result in self._loader.load(non_cached_results):
-            self._tool_cache[load_result["record_descriptor"]] = ToolProvider.ToolResult(
-                func=load_result["func"],
-                meta=load_result["record_descriptor"],
-                input=load_result["args_schema"],
+        # Return the tools from the cache.
+        return [self._generate_result(x.entry) for x in results]
+
+    def find_with_queries(
+        self,
+        queries: list[str],
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[ToolResult]]:
+        """
+        :param queries: A list of strings to search the catalog with (searched together in one batch).
+        :param annotations: An annotation query string in the form of KEY=VALUE (AND|OR KEY=VALUE)*.
+        :param snapshot: The snapshot version to search.
+        :param limit: The maximum number of results to return per query.
+        :return: A list of tools (Python functions OR decorated tool instances) for each query, in order.
+        """
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results_per_query = [
+            self.refiner(results)
+            for results in self.catalog.find_many(
+                queries=queries, snapshot=snapshot, annotations=annotation_predicate, limit=limit
             )
+        ]
+        self._load_into_cache([x for results in results_per_query for x in results])
 
         # Return the tools from the cache.
-        return [self._generate_result(x.entry) for x in results]
+        return [[self._generate_result(x.entry) for x in results] for results in results_per_query]
 
     def find_with_name(self, name: str, snapshot: str = "__LATEST__", annotations: str = None) -> ToolResult | None:
         annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
         results = self.catalog.find(name=name, snapshot=snapshot, annotations=annotation_predicate, limit=1)
+        self._load_into_cache(results)
+        return self._result_with_name(results)
 
-        # Load all tools that we have not already cached.
-        non_cached_results = [f.entry for f in results if f.entry not in self._tool_cache]
-        for load_result in self._loader.load(non_cached_results):
-            self._tool_cache[load_result["record_descriptor"]] = ToolProvider.ToolResult(
-                func=load_result["func"],
-                meta=load_result["record_descriptor"],
-                input=load_result["args_schema"],
+    def find_with_names(self, names: list[str], snapshot: str = "__LATEST__") -> list[ToolResult | None]:
+        """
+        :param names: The names of the tools to fetch (fetched together in one batch).
+        :param snapshot: The snapshot version to search.
+        :return: The tool (or None, if no such tool exists) with each name, in order.
+        """
+        results_per_name = self.catalog.find_names(names=names, snapshot=snapshot)
+        self._load_into_cache([x for results in results_per_name for x in results])
+        return [self._result_with_name(results) for results in results_per_name]
+
+    async def afind_with_query(
+        self,
+        query: str,
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[ToolResult]:
+        """An asyncio counterpart of :py:meth:`find_with_query`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results = self.refiner(
+            await self.catalog.afind(query=query, snapshot=snapshot, annotations=annotation_predicate, limit=limit)
+        )
+        await self._aload_into_cache(results)
+        return [self._generate_result(x.entry) for x in results]
+
+    async def afind_with_queries(
+        self,
+        queries: list[str],
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[ToolResult]]:
+        """An asyncio counterpart of :py:meth:`find_with_queries`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results_per_query = [
+            self.refiner(results)
+            for results in await self.catalog.afind_many(
+                queries=queries, snapshot=snapshot, annotations=annotation_predicate, limit=limit
             )
+        ]
+        await self._aload_into_cache([x for results in results_per_query for x in results])
+        return [[self._generate_result(x.entry) for x in results] for results in results_per_query]
+
+    async def afind_with_name(
+        self, name: str, snapshot: str = "__LATEST__", annotations: str = None
+    ) -> ToolResult | None:
+        """An asyncio counterpart of :py:meth:`find_with_name`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results = await self.catalog.afind(name=name, snapshot=snapshot, annotations=annotation_predicate, limit=1)
+        await self._aload_into_cache(results)
+        return self._result_with_name(results)
+
+    async def afind_with_names(self, names: list[str], snapshot: str = "__LATEST__") -> list[ToolResult | None]:
+        """An asyncio counterpart of :py:meth:`find_with_names`."""
+        results_per_name = await self.catalog.afind_names(names=names, snapshot=snapshot)
+        await self._aload_into_cache([x for results in results_per_name for x in results])
+        return [self._result_with_name(results) for results in results_per_name]
 
+    def _result_with_name(self, results: list[SearchResult]) -> ToolResult | None:
         # Return the tools from the cache.
         match len(results):
             case 0:
@@ -145,21 +231,73 @@ class PromptProvider(BaseProvider):
         if self.tool_provider is None:
             logger.warning("PromptProvider has been instantiated without a ToolProvider.")
 
-    def _generate_result(self, prompt_descriptor: PromptDescriptor) -> PromptResult:
-        # If our prompt has defined tools, fetch them here.
-        tools = list()
+    def _query_groups(self, prompt_descriptor: PromptDescriptor) -> dict[tuple[str, int], list[int]]:
         if len(prompt_descriptor.tools) > 0 and self.tool_provider is None:
             raise ValueError(
                 "Tool(s) have been defined in the prompt, but no ToolProvider has been provided. "
                 "If this is a new repo, please run `agentc index tool` to first index your tools."
             )
-        for tool in prompt_descriptor.tools:
+
+        # Tools defined by a query are searched for in batches (grouped by their annotations and limit).
+        query_groups: dict[tuple[str, int], list[int]] = dict()
+        for i, tool in enumerate(prompt_descriptor.tools):
+            if tool.query is not None:
+                query_groups.setdefault((tool.annotations, tool.limit), list()).append(i)
+        return query_groups
+
+    def _generate_result(self, prompt_descriptor: PromptDescriptor) -> PromptResult:
+        # If our prompt has defined tools, fetch them here.
+        tools_from_query: dict[int, list[ToolProvider.ToolResult]] = dict()
+        for (annotations, limit), indices in self._query_groups(prompt_descriptor).items():
+            results_per_query = self.tool_provider.find_with_queries(
+                queries=[prompt_descriptor.tools[i].query for i in indices], annotations=annotations, limit=limit
+            )
+            tools_from_query.update(zip(indices, results_per_query, strict=True))
+        # Tools defined by name are fetched together (in one batch).
+        named_tools = [i for i, tool in enumerate(prompt_descriptor.tools) if tool.query is None]
+        tools_from_name = dict()
+        if len(named_tools) > 0:
+            results_per_name = self.tool_provider.find_with_names(
+                names=[prompt_descriptor.tools[i].name for i in named_tools]
+            )
+            tools_from_name = dict(zip(named_tools, results_per_name, strict=True))
+        return self._prompt_result(prompt_descriptor, tools_from_query, tools_from_name)
+
+    async def _agenerate_result(self, prompt_descriptor: PromptDescriptor) -> PromptResult:
+        # All tool searches of a prompt are issued concurrently.
+        query_groups = self._query_groups(prompt_descriptor)
+        named_tools = [i for i, tool in enumerate(prompt_descriptor.tools) if tool.query is None]
+        results_per_group, results_per_name = await asyncio.gather(
+            asyncio.gather(
+                *[
+                    self.tool_provider.afind_with_queries(
+                        queries=[prompt_descriptor.tools[i].query for i in indices],
+                        annotations=annotations,
+                        limit=limit,
+                    )
+                    for (annotations, limit), indices in query_groups.items()
+                ]
+            ),
+            self.tool_provider.afind_with_names(names=[prompt_descriptor.tools[i].name for i in named_tools]),
+        )
+        tools_from_query: dict[int, list[ToolProvider.ToolResult]] = dict()
+        for indices, results_per_query in zip(query_groups.values(), results_per_group, strict=True):
+            tools_from_query.update(zip(indices, results_per_query, strict=True))
+        tools_from_name = dict(zip(named_tools, results_per_name, strict=True))
+        return self._prompt_result(prompt_descriptor, tools_from_query, tools_from_name)
+
+    @staticmethod
+    def _prompt_result(
+        prompt_descriptor: PromptDescriptor,
+        tools_from_query: dict[int, list[ToolProvider.ToolResult]],
+        tools_from_name: dict[int, ToolProvider.ToolResult],
+    ) -> "PromptProvider.PromptResult":
+        tools = list()
+        for i, tool in enumerate(prompt_descriptor.tools):
             if tool.query is not None:
-                tools += self.tool_provider.find_with_query(
-                    query=tool.query, annotations=tool.annotations, limit=tool.limit
-                )
+                tools += tools_from_query[i]
             else:  # tool.name is not None
-                tools.append(self.tool_provider.find_with_name(name=tool.name, annotations=tool.annotations))
+                tools.append(tools_from_name[i])
 
         return PromptProvider.PromptResult(
             content=prompt_descriptor.content,
@@ -181,6 +319,19 @@ class PromptProvider(BaseProvider):
         )
         return [self._generate_result(r.entry) for r in results]
 
+    def find_with_queries(
+        self,
+        queries: list[str],
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[PromptResult]]:
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results_per_query = self.catalog.find_many(
+            queries=queries, snapshot=snapshot, annotations=annotation_predicate, limit=limit
+        )
+        return [[self._generate_result(r.entry) for r in self.refiner(results)] for results in results_per_query]
+
     def find_with_name(
         self, name: str, snapshot: str = "__LATEST__", annotations: str = None
     ) -> typing.Optional[PromptResult]:
@@ -195,3 +346,44 @@ class PromptProvider(BaseProvider):
                 # TODO (GLENN): Should we check this on agentc index instead?
                 logger.warning("Multiple prompts found with the same name. Returning the first one.")
                 return self._generate_result(results[0].entry)
+
+    async def afind_with_query(
+        self,
+        query: str,
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[PromptResult]:
+        """An asyncio counterpart of :py:meth:`find_with_query`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results = self.refiner(
+            await self.catalog.afind(query=query, snapshot=snapshot, annotations=annotation_predicate, limit=limit)
+        )
+        return list(await asyncio.gather(*[self._agenerate_result(r.entry) for r in results]))
+
+    async def afind_with_queries(
+        self,
+        queries: list[str],
+        annotations: str = None,
+        snapshot: str = "__LATEST__",
+        limit: typing.Union[int | None] = 1,
+    ) -> list[list[PromptResult]]:
+        """An asyncio counterpart of :py:meth:`find_with_queries`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results_per_query = await self.catalog.afind_many(
+            queries=queries, snapshot=snapshot, annotations=annotation_predicate, limit=limit
+        )
+        return [
+            list(await asyncio.gather(*[self._agenerate_result(r.entry) for r in self.refiner(results)]))
+            for results in results_per_query
+        ]
+
+    async def afind_with_name(
+        self, name: str, snapshot: str = "__LATEST__", annotations: str = None
+    ) -> typing.Optional[PromptResult]:
+        """An asyncio counterpart of :py:meth:`find_with_name`."""
+        annotation_predicate = AnnotationPredicate(query=annotations) if annotations is not None else None
+        results = await self.catalog.afind(name=name, snapshot=snapshot, annotations=annotation_predicate, limit=1)
+        if len(results) > 1:
+            logger.warning("Multiple prompts found with the same name. Returning the first one.")
+        return await self._agenerate_result(results[0].entry) if len(results) > 0 else None
@@ -24,7 +24,7 @@ class ClosestClusterRefiner(pydantic.BaseModel, BaseRefiner):
     def __call__(self, ordered_entries: list[SearchResult]):
         try:
             # TODO (GLENN): We could probably move this file to a separate package entirely...
-            # We'll move these imports here (numpy in particular we want to keep out of core for now).
+            # We'll move these imports here (scipy and scikit-learn in particular we want to keep out of core).
             import numpy
             import scipy.signal
             import sklearn.neighbors
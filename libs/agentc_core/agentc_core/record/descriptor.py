@@ -33,6 +33,17 @@ class RecordKind(enum.StrEnum):
     Prompt = "prompt"
 
 
+def record_identifier(source: pathlib.Path, name: str, version: VersionDescriptor) -> str:
+    suffix = version.identifier or ""
+    if version.is_dirty:
+        suffix += "_dirty"
+    match version.version_system:
+        case VersionSystem.Git:
+            suffix = "git_" + suffix
+
+    return f"{source}:{name}:{suffix}"
+
+
 class RecordDescriptor(pydantic.BaseModel):
     """This model represents a tool's persistable description or metadata."""
 
@@ -62,7 +73,18 @@ class RecordDescriptor(pydantic.BaseModel):
         examples=[pathlib.Path("src/tools/finance.py")],
     )
 
-    raw: str = pydantic.Field(description="The raw contents of the file this tool was sourced from.")
+    raw: typing.Optional[str] = pydantic.Field(
+        default=None,
+        description="The raw contents of the file this tool was sourced from "
+        "(None if the raw contents are held by reference, see raw_ref).",
+    )
+
+    raw_ref: typing.Optional[str] = pydantic.Field(
+        default=None,
+        description="Content hash of the raw contents of the file this tool was sourced from "
+        "(or, for items fetched from a DB catalog holding these contents inline, the key of the item itself). "
+        "The raw contents are stored once (per catalog) and must be resolved through the catalog.",
+    )
 
     version: VersionDescriptor = pydantic.Field(
         description="A low water-mark that defines the earliest version this record is valid under.",
@@ -72,6 +94,12 @@ class RecordDescriptor(pydantic.BaseModel):
         default_factory=list, description="Embedding used to search for the record."
     )
 
+    embedding_row: typing.Optional[int] = pydantic.Field(
+        default=None,
+        description="Row of the record's embedding in the catalog's embedding file "
+        "(only set if the catalog stores its embeddings outside of its JSON file).",
+    )
+
     annotations: typing.Optional[dict[str, str] | None] = pydantic.Field(
         default=None,
         description="Dictionary of user-defined annotations attached to this record.",
@@ -81,14 +109,7 @@ class RecordDescriptor(pydantic.BaseModel):
     @pydantic.computed_field
     @property
     def identifier(self) -> str:
-        suffix = self.version.identifier or ""
-        if self.version.is_dirty:
-            suffix += "_dirty"
-        match self.version.version_system:
-            case VersionSystem.Git:
-                suffix = "git_" + suffix
-
-        return f"{self.source}:{self.name}:{suffix}"
+        return record_identifier(self.source, self.name, self.version)
 
     @identifier.setter
     def identifier(self, identifier: str) -> str:
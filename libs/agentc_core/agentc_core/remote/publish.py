@@ -7,13 +7,18 @@ import pathlib
 import pydantic
 import tqdm
 import typing
-import uuid
 
 from agentc_core.activity.models.log import Log
+from agentc_core.catalog.blobs import deduplicate_raw
 from agentc_core.catalog.descriptor import CatalogDescriptor
+from agentc_core.catalog.descriptor import catalog_item_key
+from agentc_core.catalog.embeddings import hydrate_embeddings
+from agentc_core.catalog.embeddings import load_embeddings
 from agentc_core.config import Config
 from agentc_core.defaults import DEFAULT_ACTIVITY_LOG_COLLECTION
 from agentc_core.defaults import DEFAULT_ACTIVITY_SCOPE
+from agentc_core.defaults import DEFAULT_CATALOG_BLOB_COLLECTION
+from agentc_core.defaults import DEFAULT_CATALOG_LATEST_VERSION_KEY
 from agentc_core.defaults import DEFAULT_CATALOG_METADATA_COLLECTION
 from agentc_core.defaults import DEFAULT_CATALOG_PROMPT_COLLECTION
 from agentc_core.defaults import DEFAULT_CATALOG_SCOPE
@@ -22,6 +27,7 @@ from agentc_core.defaults import DEFAULT_PROMPT_CATALOG_FILE
 from agentc_core.defaults import DEFAULT_TOOL_CATALOG_FILE
 from agentc_core.record.descriptor import RecordKind
 from agentc_core.remote.util.ddl import check_if_scope_collection_exist
+from agentc_core.remote.util.ddl import create_scope_and_collection
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +89,9 @@ def publish_catalog(
         catalog_path = cfg.CatalogPath() / DEFAULT_PROMPT_CATALOG_FILE
     with catalog_path.open("r") as fp:
         catalog_desc = CatalogDescriptor.model_validate_json(fp.read())
+    # Note: the embedding file always holds float32 embeddings (quantized catalogs store their codes separately).
+    if catalog_desc.embedding_file is not None:
+        hydrate_embeddings(catalog_desc, load_embeddings(catalog_path, catalog_desc))
 
     # Check to ensure a dirty catalog is not published
     if catalog_desc.version.is_dirty:
@@ -102,7 +111,11 @@ def publish_catalog(
     # get collection ref
     cb_coll = cb.scope(DEFAULT_CATALOG_SCOPE).collection(DEFAULT_CATALOG_METADATA_COLLECTION)
     # dict to store all the metadata - snapshot related data
-    metadata = {el: catalog_desc.model_dump()[el] for el in catalog_desc.model_dump() if el != "items"}
+    metadata = {
+        el: catalog_desc.model_dump()[el]
+        for el in catalog_desc.model_dump()
+        if el not in {"items", "blobs", "embedding_file", "embedding_quantization"}
+    }
     # add annotations to metadata
     annotations_list = {an[0]: an[1].split("+") if "+" in an[1] else an[1] for an in annotations}
     metadata.update({"snapshot_annotations": annotations_list})
@@ -122,6 +135,37 @@ def publish_catalog(
     printer("Using the catalog identifier: ", nl=False)
     printer(metadata["version"]["identifier"] + "\n", bold=True)
 
+    # ---------------------------------------------------------------------------------------- #
+    #                                   Blob collection                                        #
+    # ---------------------------------------------------------------------------------------- #
+    # The raw contents of each source file are stored once (keyed by content hash) and referenced by each item.
+    items, blobs = deduplicate_raw(catalog_desc.items, resolve_blob=(catalog_desc.blobs or dict()).get)
+    if len(blobs) > 0:
+        if not check_if_scope_collection_exist(
+            bucket_manager, DEFAULT_CATALOG_SCOPE, DEFAULT_CATALOG_BLOB_COLLECTION, False
+        ):
+            msg, err = create_scope_and_collection(
+                cfg.Cluster(),
+                cfg.bucket,
+                scope=DEFAULT_CATALOG_SCOPE,
+                collection=DEFAULT_CATALOG_BLOB_COLLECTION,
+                ddl_retry_attempts=cfg.ddl_retry_attempts,
+                ddl_retry_wait_seconds=cfg.ddl_retry_wait_seconds,
+            )
+            if err is not None:
+                raise ValueError(msg)
+        cb_coll = cb.scope(DEFAULT_CATALOG_SCOPE).collection(DEFAULT_CATALOG_BLOB_COLLECTION)
+        logger.debug(f"Inserting {len(blobs)} blob(s)...")
+        for key, content in blobs.items():
+            try:
+                cb_coll.insert(key, {"content": content})
+            except couchbase.exceptions.DocumentExistsException:
+                # Blobs are content-addressed, so an existing blob must hold the same content.
+                pass
+            except couchbase.exceptions.CouchbaseException as e:
+                printer(f"Couldn't insert blobs!\n{e.message}", fg="red")
+                raise e
+
     # ---------------------------------------------------------------------------------------- #
     #                               Catalog items collection                                   #
     # ---------------------------------------------------------------------------------------- #
@@ -131,7 +175,8 @@ def publish_catalog(
     cb_coll = cb.scope(DEFAULT_CATALOG_SCOPE).collection(catalog_col)
     printer(f"Uploading the {k} catalog items to Couchbase.", fg="yellow")
     logger.debug("Inserting catalog items...")
-    progress_bar = tqdm.tqdm(catalog_desc.items)
+    progress_bar = tqdm.tqdm(items)
+    published_keys = set()
     for item in progress_bar:
         if (
             k == "prompt"
@@ -143,16 +188,18 @@ def publish_catalog(
             raise ValueError(f"Invalid record kind for {k} catalog item!\n{item.record_kind}")
 
         try:
-            # raw_key = item.identifier + "_" + metadata["version"]["identifier"]
-            # key = zlib.compress(raw_key.encode("utf-8")).hex()
-            # if len(key) > 245:  # This is the limit on the key-length for our server. We will raise a warning here.
-            #     printer(f"Key value has exceeded 245 characters! Truncating key for {item.identifier}.", fg="yellow")
-            #     key = key[:245]
-            key = uuid.uuid4().hex
+            # Items are keyed by their catalog version, kind, and name (so name lookups are a single KV get).
+            key = catalog_item_key(metadata["version"]["identifier"], k, item.name)
+            if key in published_keys:
+                # Items that share a name can only be found by query (our name lookup returns the first such item).
+                # Note: their key is still deterministic, so republishing the same catalog overwrites (not adds) items.
+                logger.warning(f"Multiple {k}s found with the name {item.name}. Keying {item.source} by its source.")
+                key = catalog_item_key(metadata["version"]["identifier"], k, f"{item.name}@{item.source}")
+            published_keys.add(key)
             progress_bar.set_description(item.name)
 
             # serialise object to str
-            item = json.dumps(item.model_dump(), cls=CustomPublishEncoder)
+            item = json.dumps(item.model_dump(exclude={"embedding_row"}), cls=CustomPublishEncoder)
 
             # convert to dict object and insert snapshot id
             item_json: dict = json.loads(item)
@@ -163,4 +210,11 @@ def publish_catalog(
         except couchbase.exceptions.CouchbaseException as e:
             printer(f"Couldn't insert catalog items!\n{e.message}", fg="red")
             raise e
+
+    # Finally, touch our "latest" document (readers watch its CAS to learn that a new catalog has been published).
+    try:
+        cb_coll = cb.scope(DEFAULT_CATALOG_SCOPE).collection(DEFAULT_CATALOG_METADATA_COLLECTION)
+        cb_coll.upsert(f"{DEFAULT_CATALOG_LATEST_VERSION_KEY}/{k}", {"published": metadata["version"]})
+    except couchbase.exceptions.CouchbaseException as e:
+        raise ValueError(f"Couldn't update the latest catalog version!\n{e.message}") from e
     return True
@@ -131,6 +131,18 @@ def get_fts_nodes_hostname(cfg: Config) -> tuple[list[str] | None, Exception | N
         return None, e
 
 
+# Our catalog identifier and annotations are indexed (verbatim) alongside our embeddings, so kNN searches can filter
+# on these fields before picking their nearest neighbors.
+VECTOR_INDEX_FILTER_PROPERTIES = {
+    "catalog_identifier": {
+        "dynamic": False,
+        "enabled": True,
+        "fields": [{"analyzer": "keyword", "index": True, "name": "catalog_identifier", "type": "text"}],
+    },
+    "annotations": {"default_analyzer": "keyword", "dynamic": True, "enabled": True},
+}
+
+
 def create_vector_index(
     cfg: Config,
     scope: str,
@@ -212,7 +224,8 @@ def create_vector_index(
                                                 "vector_index_optimized_for": "recall",
                                             },
                                         ],
-                                    }
+                                    },
+                                    **VECTOR_INDEX_FILTER_PROPERTIES,
                                 },
                             }
                         },
@@ -301,6 +314,11 @@ def create_vector_index(
                 "fields"
             ] = field_mappings
 
+        # Indexes created before our kNN filters existed are given our filter fields here.
+        properties = index_present["params"]["mapping"]["types"][f"{scope}.{collection}"]["properties"]
+        for name, mapping in VECTOR_INDEX_FILTER_PROPERTIES.items():
+            properties.setdefault(name, mapping)
+
         headers = {
             "Content-Type": "application/json",
         }
@@ -357,7 +375,7 @@ def create_vector_index(
 
 def create_gsi_indexes(cfg: Config, kind: typing.Literal["tool", "prompt", "metadata", "log"], print_progress):
     """Creates required indexes for runtime"""
-    progress_bar = tqdm.tqdm(range(3 if kind not in {"metadata"} else 1))
+    progress_bar = tqdm.tqdm(range({"metadata": 1, "log": 3}.get(kind, 4)))
     progress_bar_it = iter(progress_bar)
     completion_status = True
     all_errs = ""
@@ -475,6 +493,23 @@ def create_gsi_indexes(cfg: Config, kind: typing.Literal["tool", "prompt", "meta
         progress_bar_it,
     )
 
+    # Secondary index on catalog_identifier + document key (used to iterate over a snapshot page-by-page)
+    cat_key_idx_name = f"v2_AgentCatalog{kind.capitalize()}sCatalogIdentifierKeyIndex"
+    completion_status |= create_index(
+        all_errs,
+        cfg,
+        cluster,
+        completion_status,
+        f"""
+            CREATE INDEX IF NOT EXISTS `{cat_key_idx_name}`
+            ON `{cfg.bucket}`.`{DEFAULT_CATALOG_SCOPE}`.`{collection}`(catalog_identifier,META().id);
+        """,
+        cat_key_idx_name,
+        print_progress,
+        progress_bar,
+        progress_bar_it,
+    )
+
     # Secondary index on annotations
     ann_idx_name = f"v2_AgentCatalog{kind.capitalize()}sAnnotationsIndex"
     completion_status |= create_index(
@@ -34,11 +34,25 @@ def execute_query(cluster, exec_query) -> tuple[typing.Any, Exception | None]:
         return None, e
 
 
-def execute_query_with_parameters(cluster, exec_query, params) -> tuple[typing.Any, Exception | None]:
-    """Execute a given query with given named parameters"""
+def execute_query_with_parameters(
+    cluster, exec_query, params, adhoc: bool = True
+) -> tuple[typing.Any, Exception | None]:
+    """Execute a given query with given named parameters (as a prepared statement, if adhoc is False)"""
 
     try:
-        result = cluster.query(exec_query, QueryOptions(metrics=True, named_parameters=params))
+        result = cluster.query(exec_query, QueryOptions(metrics=True, named_parameters=params, adhoc=adhoc))
         return result, None
     except CouchbaseException as e:
         return None, e
+
+
+async def aexecute_query_with_parameters(
+    cluster, exec_query, params, adhoc: bool = True
+) -> tuple[list | None, Exception | None]:
+    """Execute a given query with given named parameters on an (acouchbase) async cluster and fetch all rows"""
+
+    try:
+        result = cluster.query(exec_query, QueryOptions(metrics=True, named_parameters=params, adhoc=adhoc))
+        return [row async for row in result], None
+    except CouchbaseException as e:
+        return None, e
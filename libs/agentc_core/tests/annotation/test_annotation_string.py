@@ -76,3 +76,19 @@ def test_annotation_predicate():
     # Test invalid value format.
     with pytest.raises(ValueError):
         AnnotationPredicate("key=value")
+
+
+@pytest.mark.smoke
+def test_annotation_catalog_query_parameters():
+    condition, params = AnnotationPredicate(
+        'key1 = "value1" AND key2 = "value2" OR key3 = "value3"'
+    ).__catalog_query_parameters__()
+    assert condition == (
+        "(a.annotations.`key1` = $annotation_0 AND a.annotations.`key2` = $annotation_1) "
+        "OR (a.annotations.`key3` = $annotation_2)"
+    )
+    assert params == {"annotation_0": "value1", "annotation_1": "value2", "annotation_2": "value3"}
+
+    # Predicates that only differ in their values share the same condition (i.e., the same prepared statement).
+    other_condition, _ = AnnotationPredicate('key1 = "a" AND key2 = "b" OR key3 = "c"').__catalog_query_parameters__()
+    assert other_condition == condition
@@ -0,0 +1,112 @@
+import numpy
+import pathlib
+import pytest
+
+from agentc_core.catalog.ann import IVFFlatIndex
+from agentc_core.catalog.ann import ann_index_path
+from agentc_core.catalog.ann import recall_at_k
+from agentc_core.catalog.implementations.mem import CatalogMem
+from agentc_core.config import LATEST_SNAPSHOT_VERSION
+from agentc_core.learned.embedding import EmbeddingModel
+from test_catalog_mem import _catalog
+
+
+def _clustered_embeddings(n: int, dim: int, n_topics: int, seed: int = 0) -> tuple[numpy.ndarray, numpy.ndarray]:
+    generator = numpy.random.default_rng(seed)
+    topics = generator.normal(size=(n_topics, dim))
+    embeddings = topics[generator.integers(n_topics, size=n)] + 0.5 * generator.normal(size=(n, dim))
+    embeddings = (embeddings / numpy.linalg.norm(embeddings, axis=1, keepdims=True)).astype(numpy.float32)
+    queries = embeddings[generator.choice(n, 50, replace=False)] + 0.1 * generator.normal(size=(50, dim))
+    queries = (queries / numpy.linalg.norm(queries, axis=1, keepdims=True)).astype(numpy.float32)
+    return embeddings, queries
+
+
+@pytest.mark.smoke
+def test_recall_against_exact_search():
+    embeddings, queries = _clustered_embeddings(5000, 32, 70)
+    index = IVFFlatIndex.build(embeddings, [str(i) for i in range(len(embeddings))])
+    assert index.n_lists == 71
+
+    # Probing every list is an exact search.
+    assert recall_at_k(index, embeddings, queries, k=10, n_probe=index.n_lists) == pytest.approx(1.0)
+    assert recall_at_k(index, embeddings, queries, k=10, n_probe=8) >= 0.9
+
+    # Probing more lists should never hurt recall.
+    recalls = [recall_at_k(index, embeddings, queries, k=10, n_probe=p) for p in [1, 2, 4, 8, 16]]
+    assert recalls == sorted(recalls)
+
+
+@pytest.mark.smoke
+def test_dump_and_load(tmp_path: pathlib.Path):
+    embeddings, _ = _clustered_embeddings(500, 16, 10)
+    index = IVFFlatIndex.build(embeddings, [str(i) for i in range(500)], catalog_identifier="my_catalog_version")
+    index.dump(tmp_path / "tools.ann.npz")
+
+    loaded_index = IVFFlatIndex.load(tmp_path / "tools.ann.npz")
+    assert loaded_index.is_valid_for([str(i) for i in range(500)], "my_catalog_version")
+    assert not loaded_index.is_valid_for([str(i) for i in range(500)], "another_catalog_version")
+    numpy.testing.assert_array_equal(loaded_index.centroids, index.centroids)
+    numpy.testing.assert_array_equal(loaded_index.assignments, index.assignments)
+
+
+@pytest.mark.smoke
+def test_incremental_update():
+    embeddings, queries = _clustered_embeddings(1000, 16, 20)
+    identifiers = [str(i) for i in range(1000)]
+    index = IVFFlatIndex.build(embeddings[:900], identifiers[:900], catalog_identifier="v1")
+
+    # Existing rows keep their lists (even when reordered), and new rows are assigned to their closest centroid.
+    order = numpy.random.default_rng(0).permutation(1000)
+    updated_index = index.update(embeddings[order], [identifiers[i] for i in order], catalog_identifier="v2")
+    assert updated_index.catalog_identifier == "v2"
+    numpy.testing.assert_array_equal(updated_index.centroids, index.centroids)
+    for row, i in enumerate(order):
+        if i < 900:
+            assert updated_index.assignments[row] == index.assignments[i]
+        else:
+            assert updated_index.assignments[row] == numpy.argmax(index.centroids @ embeddings[i])
+    assert recall_at_k(updated_index, embeddings[order], queries, k=10, n_probe=8) >= 0.9
+
+    # An index that is already valid is returned as-is, and a mostly new set of rows triggers a rebuild.
+    assert updated_index.update(embeddings[order], [identifiers[i] for i in order], "v2") is updated_index
+    rebuilt_index = index.update(embeddings[:100], identifiers[:100], catalog_identifier="v3")
+    assert rebuilt_index.identifiers == identifiers[:100]
+    assert len(rebuilt_index.assignments) == 100
+
+
+@pytest.mark.smoke
+def test_catalog_mem_with_ann_index(tmp_path: pathlib.Path):
+    embeddings, queries = _clustered_embeddings(400, 16, 20)
+    query_vectors = {f"query #{i}": q.tolist() for i, q in enumerate(queries)}
+    exact_catalog = _catalog(embeddings.tolist(), query_vectors)
+
+    # An index is built in memory if none has been persisted.
+    catalog_file = tmp_path / "tools.json"
+    exact_catalog.dump(catalog_file)
+    ann_catalog = CatalogMem(
+        catalog_file=catalog_file,
+        embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model"),
+        ann_index=True,
+        ann_index_probes=20,
+    )
+    ann_catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+    for query in query_vectors:
+        exact_results = exact_catalog.find(query, snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+        ann_results = ann_catalog.find(query, snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+        assert [r.entry.name for r in ann_results] == [r.entry.name for r in exact_results]
+
+    # A persisted index is used when it matches the catalog version.
+    ann_catalog.dump_ann_index(catalog_file, n_lists=10)
+    assert ann_index_path(catalog_file).exists()
+    reloaded_catalog = CatalogMem(
+        catalog_file=catalog_file,
+        embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model"),
+        ann_index=True,
+        ann_index_probes=10,
+    )
+    reloaded_catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+    assert reloaded_catalog._ann_index.n_lists == 10
+    results_per_query = reloaded_catalog.find_many(list(query_vectors), snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+    for query, ann_results in zip(query_vectors, results_per_query, strict=True):
+        exact_results = exact_catalog.find(query, snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+        assert [r.entry.name for r in ann_results] == [r.entry.name for r in exact_results]
@@ -0,0 +1,413 @@
+import agentc_core.catalog.implementations.db
+import couchbase.cluster
+import couchbase.exceptions
+import datetime
+import pathlib
+import pytest
+import threading
+import time
+import types
+
+from agentc_core.annotation import AnnotationPredicate
+from agentc_core.catalog.implementations.db import CatalogDB
+from agentc_core.catalog.implementations.mem import CatalogMem
+from agentc_core.config import LATEST_SNAPSHOT_VERSION
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.record.descriptor import RecordKind
+from agentc_core.tool.descriptor import PythonToolDescriptor
+from agentc_core.version import VersionDescriptor
+
+
+class _FakeResult(list):
+    def execute(self) -> list:
+        return list(self)
+
+
+class _FakeCluster(couchbase.cluster.Cluster):
+    """An in-process stand-in for a cluster (and its bucket / scope / collection) holding our published catalogs."""
+
+    def __init__(self, count: int = 3):
+        # Note: we never connect to anything here.
+        self.count = count
+        self.version = VersionDescriptor(
+            identifier="my_catalog_version", timestamp=datetime.datetime.now(tz=datetime.timezone.utc)
+        )
+        self.queries = list()
+        self.kv_gets = list()
+        self.get_error = None
+        self.get_multi_error = None
+
+        # Our (metadata) documents by key, and the (published) item rows of each snapshot.
+        self.documents = dict()
+        self.items = dict()
+        self.fetched_identifiers = list()
+
+    def query(self, statement: str, *args, **kwargs) -> _FakeResult:
+        self.queries.append(statement)
+        params = args[0].get("named_parameters", dict()) if len(args) > 0 else dict()
+        if "COUNT(*)" in statement:
+            return _FakeResult([self.count])
+        elif "t.version" in statement:
+            return _FakeResult([self.version.model_dump(mode="json")])
+        elif "SELECT RAW t.identifier" in statement:
+            return _FakeResult([x["identifier"] for x in self.items.get(params["snapshot"], [])])
+        elif "t.identifier IN $identifiers" in statement:
+            self.fetched_identifiers.extend(params["identifiers"])
+            items = self.items.get(params["snapshot"], [])
+            return _FakeResult([x for x in items if x["identifier"] in params["identifiers"]])
+        return _FakeResult([])
+
+    def bucket(self, name: str) -> "_FakeCluster":
+        return self
+
+    def scope(self, name: str) -> "_FakeCluster":
+        return self
+
+    def collection(self, name: str) -> "_FakeCluster":
+        return self
+
+    def search_indexes(self):
+        raise couchbase.exceptions.CouchbaseException(message="no search service")
+
+    def get(self, key: str) -> types.SimpleNamespace:
+        self.kv_gets.append(key)
+        if self.get_error is not None:
+            raise self.get_error
+        elif key in self.documents:
+            return types.SimpleNamespace(cas=1, content_as={dict: self.documents[key]})
+        elif key.startswith("latest/"):
+            return types.SimpleNamespace(cas=1)
+        raise couchbase.exceptions.DocumentNotFoundException(message=f"{key} not found")
+
+    def get_multi(self, keys: list[str]):
+        self.kv_gets.extend(keys)
+        raise self.get_multi_error
+
+    def lookup_in(self, key: str, specs: list) -> types.SimpleNamespace:
+        self.kv_gets.append(key)
+        if key not in self.documents:
+            raise couchbase.exceptions.DocumentNotFoundException(message=f"{key} not found")
+        return types.SimpleNamespace(content_as={str: lambda i: self.documents[key]["raw"]})
+
+
+def _catalog_db(cluster: _FakeCluster, **kwargs) -> CatalogDB:
+    # Note: we bypass the (sentence-transformers) model load by setting the encoder directly.
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model")
+    embedding_model._embedding_model = lambda texts: [[1.0, 0.0] for _ in texts]
+    return CatalogDB(cluster=cluster, bucket="my_bucket", kind="tool", embedding_model=embedding_model, **kwargs)
+
+
+def _publish(cluster: _FakeCluster, snapshot: str, items: dict[str, tuple[str, list[float]]]) -> None:
+    """Publishes a tool catalog snapshot whose items are given as {name: (item version, embedding)}."""
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    cluster.version = VersionDescriptor(identifier=snapshot, timestamp=now)
+    cluster.documents[f"{snapshot}/tool"] = {
+        "schema_version": "0.0.0",
+        "library_version": "0.0.0",
+        "kind": "tool",
+        "embedding_model": {"name": "my_embedding_model"},
+        "version": cluster.version.model_dump(mode="json"),
+        "source_dirs": ["."],
+    }
+    cluster.items[snapshot] = [
+        PythonToolDescriptor(
+            record_kind=RecordKind.PythonFunction,
+            name=name,
+            description=f"A dummy tool named {name}.",
+            source=pathlib.Path("tools.py"),
+            raw="",
+            version=VersionDescriptor(identifier=item_version, timestamp=now),
+            embedding=embedding,
+            content=PythonToolDescriptor.PythonContent(func_content="", line_no_start=0, line_no_end=0),
+        ).model_dump(mode="json")
+        | {"catalog_identifier": snapshot}
+        for name, (item_version, embedding) in items.items()
+    ]
+
+
+def _wait_for(condition, timeout_seconds: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout_seconds
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.smoke
+def test_version_ttl_zero_disables_cache():
+    cluster = _FakeCluster()
+    catalog = _catalog_db(cluster, version_ttl_seconds=0)
+    assert catalog.version.identifier == "my_catalog_version"
+    assert catalog.version.identifier == "my_catalog_version"
+    assert len(catalog) == 3
+
+    # Nothing is cached, so each access resolves our version again.
+    assert sum("t.version" in q for q in cluster.queries) == 3
+
+
+@pytest.mark.smoke
+def test_version_cas_is_checked_once_per_access():
+    cluster = _FakeCluster()
+    catalog = _catalog_db(cluster, version_cas_invalidation=True)
+
+    # Our count resolves our version, but both share one check of the "latest" document.
+    assert len(catalog) == 3
+    assert cluster.kv_gets == ["latest/tool"]
+    assert catalog.version.identifier == "my_catalog_version"
+    assert cluster.kv_gets == ["latest/tool"] * 2
+    assert sum("t.version" in q for q in cluster.queries) == 1
+
+
+@pytest.mark.smoke
+def test_find_names_falls_back_to_query_on_kv_error():
+    cluster = _FakeCluster()
+    cluster.get_multi_error = couchbase.exceptions.TimeoutException(message="get_multi timed out")
+    catalog = _catalog_db(cluster)
+
+    # A failed batch of KV gets should not fail our lookup (each name is looked up by query instead).
+    assert catalog.find_names(["tool_1", "tool_2"], snapshot="my_catalog_version") == [[], []]
+    assert len(cluster.kv_gets) == 2
+    assert sum("a.name = $name" in q for q in cluster.queries) == 2
+
+
+@pytest.mark.smoke
+def test_replica_pull_and_swap():
+    cluster = _FakeCluster()
+    _publish(cluster, "snapshot_1", {"tool_0": ("v1", [1.0, 0.0]), "tool_1": ("v1", [0.0, 1.0])})
+    catalog = _catalog_db(cluster, replica=True, replica_poll_interval_seconds=None)
+
+    # Our (initial) snapshot is pulled into memory, so finds are served without a query.
+    assert isinstance(catalog._replica, CatalogMem)
+    assert catalog.version.identifier == "snapshot_1"
+    n_queries = len(cluster.queries)
+    results = catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=1)
+    assert [r.entry.name for r in results] == ["tool_0"]
+    assert catalog.find(name="tool_1", snapshot="snapshot_1")[0].entry.name == "tool_1"
+    assert len(cluster.queries) == n_queries
+
+    # A new snapshot is swapped in (only its changed items are fetched), and finds are served from the new snapshot.
+    _publish(cluster, "snapshot_2", {"tool_0": ("v2", [0.0, 1.0]), "tool_1": ("v1", [0.0, 1.0])})
+    previous_replica = catalog._replica
+    catalog.refresh()
+    assert catalog._replica is not previous_replica
+    assert catalog.version.identifier == "snapshot_2"
+    assert cluster.fetched_identifiers[-1:] == [cluster.items["snapshot_2"][0]["identifier"]]
+    results = catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=2)
+    assert {(r.entry.name, r.entry.version.identifier) for r in results} == {("tool_0", "v2"), ("tool_1", "v1")}
+    assert len(catalog) == 2
+
+
+@pytest.mark.smoke
+def test_replica_poller():
+    cluster = _FakeCluster()
+    _publish(cluster, "snapshot_1", {"tool_0": ("v1", [1.0, 0.0])})
+    catalog = _catalog_db(cluster, replica=True, replica_poll_interval_seconds=0.02)
+    poller = next(t for t in threading.enumerate() if t.name == "agentc-tool-replica")
+    try:
+        # A snapshot that cannot be pulled is skipped (we keep serving our current snapshot)...
+        cluster.get_error = couchbase.exceptions.TimeoutException(message="get timed out")
+        _publish(cluster, "snapshot_2", {"tool_0": ("v2", [0.0, 1.0])})
+        assert _wait_for(lambda: any(key == "snapshot_2/tool" for key in cluster.kv_gets))
+        assert catalog.version.identifier == "snapshot_1"
+        assert catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION)[0].entry.version.identifier == "v1"
+
+        # ...and is swapped in by a later poll.
+        cluster.get_error = None
+        assert _wait_for(lambda: catalog.version.identifier == "snapshot_2")
+        assert catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION)[0].entry.version.identifier == "v2"
+    finally:
+        catalog.close()
+
+    # Our poller stops once we are closed.
+    poller.join(timeout=5)
+    assert not poller.is_alive()
+
+
+@pytest.mark.smoke
+def test_replica_pinned_snapshot():
+    cluster = _FakeCluster()
+    _publish(cluster, "snapshot_1", {"tool_0": ("v1", [1.0, 0.0])})
+    _publish(cluster, "snapshot_2", {"tool_0": ("v2", [1.0, 0.0])})
+
+    # A pinned snapshot is never polled (or swapped).
+    catalog = _catalog_db(cluster, replica=True, replica_snapshot="snapshot_1")
+    assert catalog._replica_stop is None
+    catalog.refresh()
+    assert catalog.version.identifier == "snapshot_1"
+    assert catalog.find(query="a query", snapshot="snapshot_1")[0].entry.version.identifier == "v1"
+
+    # A snapshot that has not been published cannot be pulled.
+    with pytest.raises(ValueError, match="Could not pull a replica"):
+        _catalog_db(cluster, replica=True, replica_snapshot="snapshot_3")
+
+
+@pytest.mark.smoke
+def test_queries_are_prepared_with_named_parameters(monkeypatch):
+    calls = list()
+    execute_query_with_parameters = agentc_core.catalog.implementations.db.execute_query_with_parameters
+
+    def _execute_query_with_parameters(cluster, exec_query, params, adhoc=True):
+        calls.append((exec_query, params, adhoc))
+        return execute_query_with_parameters(cluster, exec_query, params, adhoc=adhoc)
+
+    monkeypatch.setattr(
+        agentc_core.catalog.implementations.db, "execute_query_with_parameters", _execute_query_with_parameters
+    )
+    cluster = _FakeCluster()
+    cluster.get_multi_error = couchbase.exceptions.TimeoutException(message="get_multi timed out")
+    catalog = _catalog_db(cluster, version_ttl_seconds=0)
+
+    # None of our user-given values (which may hold quotes) should make it into the text of our statements...
+    snapshot, name = "it's_my_snapshot", "my_'tool'"
+    catalog.find(query="a query", snapshot=snapshot, limit=3, annotations=AnnotationPredicate('team="alpha"'))
+    catalog.find_names([name], snapshot=snapshot)
+    _ = catalog.version
+    (
+        (knn_query, knn_params, knn_adhoc),
+        (name_query, name_params, name_adhoc),
+        (version_query, version_params, version_adhoc),
+    ) = calls[-3:]
+    for value in [snapshot, name, "alpha"]:
+        assert value not in knn_query and value not in name_query and value not in version_query
+    assert "'tool'" not in version_query and '"tool"' not in version_query
+
+    # ...they are given as named parameters instead...
+    assert knn_params["snapshot"] == snapshot and knn_params["annotation_0"] == "alpha" and knn_params["limit"] == 3
+    assert knn_params["query_vector"] == [1.0, 0.0] and knn_params["k"] >= 3
+    assert "$snapshot" in knn_query and "$annotation_0" in knn_query and "$query_vector" in knn_query
+    assert name_params == {"name": name, "snapshot": snapshot}
+    assert "$name" in name_query and "$snapshot" in name_query
+    assert version_params == {"kind": "tool"} and "$kind" in version_query
+
+    # ...so each statement is prepared (and its plan reused) across calls.
+    assert knn_adhoc is False and name_adhoc is False and version_adhoc is False
+    assert all(adhoc is False for _, _, adhoc in calls)
+
+
+@pytest.mark.smoke
+def test_queries_leave_embeddings_and_raw_contents_on_the_cluster():
+    cluster = _FakeCluster()
+    catalog = _catalog_db(cluster)
+    statements = [
+        catalog._knn_statement([1.0, 0.0], "my_snapshot", 3, AnnotationPredicate('team="alpha"'))[0],
+        catalog._name_statement("my_tool", "my_snapshot")[0],
+    ]
+    list(catalog.iterate(snapshot="my_snapshot"))
+    statements.append(cluster.queries[-1])
+    for statement in statements:
+        # Items are never sent back whole: both their embeddings and their raw contents are removed (with their raw
+        # contents given by reference instead).
+        assert "t.*" not in statement
+        assert '"embedding"), "raw"), "raw_ref", CASE WHEN' in statement
+        assert statement.count("OBJECT_PUT(") == 1
+
+    # Our kNN statement only needs each item's embedding to compute its similarity.
+    knn_select = statements[0][: statements[0].index("FROM")]
+    assert knn_select.count("embedding") == 3
+
+
+@pytest.mark.smoke
+def test_resolve_blob_by_item_key():
+    cluster = _FakeCluster()
+    cluster.documents["my_snapshot/tool/my_tool"] = {"raw": "def my_tool(): ..."}
+    cluster.documents["my_blob"] = {"content": "def my_other_tool(): ..."}
+    catalog = _catalog_db(cluster)
+
+    # Inline raw contents are referenced by item key, while deduplicated raw contents are referenced by blob key.
+    assert catalog.resolve_blob("item:my_snapshot/tool/my_tool") == "def my_tool(): ..."
+    assert catalog.resolve_blob("my_blob") == "def my_other_tool(): ..."
+    assert catalog.resolve_blob("item:my_snapshot/tool/my_missing_tool") is None
+
+
+@pytest.mark.smoke
+def test_knn_candidates():
+    catalog = _catalog_db(_FakeCluster(), knn_oversampling=2, knn_max_candidates=100)
+
+    # Our k is our limit oversampled, clamped between our minimum and maximum number of candidates...
+    assert catalog._knn_candidates(20, post_filtered=False) == 40
+    assert catalog._knn_candidates(1, post_filtered=False) == 10
+    assert catalog._knn_candidates(80, post_filtered=False) == 100
+
+    # ...and all candidates are requested for searches without a limit.
+    assert catalog._knn_candidates(None, post_filtered=False) == 100
+    assert catalog._knn_candidates(0, post_filtered=True) == 100
+
+    # Post-filtered searches use our (adaptive) post-filter oversampling.
+    catalog._knn_post_filter_oversampling = 3
+    assert catalog._knn_candidates(20, post_filtered=True) == 60
+    assert catalog._knn_candidates(20, post_filtered=False) == 40
+
+
+@pytest.mark.smoke
+def test_knn_filter():
+    catalog = _catalog_db(_FakeCluster())
+    annotations = AnnotationPredicate('team="alpha" OR team="beta" AND gdpr="true"')
+
+    # Without a filterable vector index, our filters are applied after our kNN clause.
+    assert catalog._knn_prefilter is False
+    assert catalog._knn_filter("my_snapshot", annotations) is None
+    sqlpp_query, params = catalog._knn_statement([1.0, 0.0], "my_snapshot", 5, annotations)
+    assert "knn_filter" not in params and "$knn_filter" not in sqlpp_query
+    assert params["k"] == 10 and params["limit"] == 5
+
+    # With a filterable vector index, our snapshot and annotations are given to our kNN clause (in DNF).
+    catalog._knn_prefilter = True
+    assert catalog._knn_filter(None, None) is None
+    assert catalog._knn_filter("my_snapshot", None) == {
+        "conjuncts": [{"term": "my_snapshot", "field": "catalog_identifier"}]
+    }
+    assert catalog._knn_filter("my_snapshot", annotations) == {
+        "conjuncts": [
+            {"term": "my_snapshot", "field": "catalog_identifier"},
+            {
+                "disjuncts": [
+                    {"conjuncts": [{"term": "alpha", "field": "annotations.team"}]},
+                    {
+                        "conjuncts": [
+                            {"term": "beta", "field": "annotations.team"},
+                            {"term": "true", "field": "annotations.gdpr"},
+                        ]
+                    },
+                ]
+            },
+        ]
+    }
+    sqlpp_query, params = catalog._knn_statement([1.0, 0.0], "my_snapshot", 5, annotations)
+    assert params["knn_filter"] == catalog._knn_filter("my_snapshot", annotations)
+    assert "'k': $k, 'filter': $knn_filter" in sqlpp_query
+    assert params["k"] == 10 and params["limit"] == 5
+
+
+@pytest.mark.smoke
+def test_knn_oversampling_grows_and_shrinks():
+    catalog = _catalog_db(_FakeCluster(), knn_oversampling=2, knn_max_candidates=100)
+
+    def _search(limit: int, n_results: int, snapshot: str = "my_snapshot") -> dict:
+        _, params = catalog._knn_statement([1.0, 0.0], snapshot, limit)
+        catalog._adapt_knn_oversampling(snapshot, None, params, [None] * n_results)
+        return params
+
+    # Post-filtered searches that come back short double our oversampling (up to our maximum number of candidates)...
+    assert _search(10, 3)["k"] == 20
+    assert catalog._knn_post_filter_oversampling == 4
+    assert _search(10, 3)["k"] == 40
+    assert catalog._knn_post_filter_oversampling == 8
+    _search(10, 3), _search(10, 3)
+    assert catalog._knn_post_filter_oversampling == 10
+    assert _search(10, 3)["k"] == 100
+    assert catalog._knn_post_filter_oversampling == 10
+
+    # ...and searches that come back full halve it (down to our knn_oversampling).
+    _search(10, 10)
+    assert catalog._knn_post_filter_oversampling == 5
+    _search(10, 10), _search(10, 10), _search(10, 10)
+    assert catalog._knn_post_filter_oversampling == 2
+
+    # Searches that are not post-filtered leave our oversampling as is.
+    _search(10, 3, snapshot=None)
+    assert catalog._knn_post_filter_oversampling == 2
+
+    # A (post-filtered) find that comes back empty raises our oversampling as well.
+    catalog.find(query="a query", snapshot="my_snapshot", limit=10)
+    assert catalog._knn_post_filter_oversampling == 4
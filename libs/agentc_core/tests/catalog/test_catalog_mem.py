@@ -0,0 +1,551 @@
+import asyncio
+import datetime
+import itertools
+import json
+import numpy
+import pathlib
+import pytest
+import random
+import threading
+import time
+
+from agentc_core.annotation import AnnotationPredicate
+from agentc_core.catalog.blobs import blob_key
+from agentc_core.catalog.descriptor import CatalogDescriptor
+from agentc_core.catalog.descriptor import RecordDescriptorStub
+from agentc_core.catalog.descriptor import catalog_item_key
+from agentc_core.catalog.embeddings import embedding_codes_file_path
+from agentc_core.catalog.embeddings import embedding_file_path
+from agentc_core.catalog.implementations.base import CatalogBase
+from agentc_core.catalog.implementations.chain import CatalogChain
+from agentc_core.catalog.implementations.mem import CatalogMem
+from agentc_core.config import LATEST_SNAPSHOT_VERSION
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.learned.model import EmbeddingModel as CatalogDescriptorEmbeddingModel
+from agentc_core.provider.loader import EntryLoader
+from agentc_core.record.descriptor import RecordKind
+from agentc_core.tool.descriptor import PythonToolDescriptor
+from agentc_core.version import VersionDescriptor
+
+
+def _version() -> VersionDescriptor:
+    return VersionDescriptor(identifier="my_catalog_version", timestamp=datetime.datetime.now(tz=datetime.timezone.utc))
+
+
+def _catalog(
+    embeddings: list[list[float]],
+    query_vectors: dict[str, list[float]],
+    annotations: list[dict] = None,
+    source: str = "tools.py",
+    raw: str = "",
+) -> CatalogMem:
+    items = list()
+    for i, embedding in enumerate(embeddings):
+        items.append(
+            PythonToolDescriptor(
+                record_kind=RecordKind.PythonFunction,
+                name=f"tool_{i}",
+                description=f"A dummy tool #{i}.",
+                source=pathlib.Path(source),
+                raw=raw,
+                version=_version(),
+                embedding=embedding,
+                annotations=annotations[i] if annotations is not None else None,
+                content=PythonToolDescriptor.PythonContent(func_content="", line_no_start=0, line_no_end=0),
+            )
+        )
+    catalog = CatalogMem(
+        embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model"),
+        catalog_descriptor=CatalogDescriptor(
+            schema_version="0.0.0",
+            library_version="0.0.0",
+            kind="tool",
+            embedding_model=CatalogDescriptorEmbeddingModel(name="my_embedding_model"),
+            version=_version(),
+            source_dirs=["."],
+            items=items,
+        ),
+    )
+
+    # Note: we bypass the (sentence-transformers) model load by setting the encoder directly.
+    catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+    return catalog
+
+
+@pytest.mark.smoke
+def test_find_matches_pure_python_scoring():
+    rng = random.Random(42)
+    embeddings = [[rng.uniform(-1, 1) for _ in range(16)] for _ in range(200)]
+    query_vector = [rng.uniform(-1, 1) for _ in range(16)]
+    catalog = _catalog(embeddings, {"a query": query_vector})
+
+    expected = sorted(
+        zip(CatalogBase.get_deltas(query_vector, embeddings), [f"tool_{i}" for i in range(200)], strict=True),
+        key=lambda x: x[0],
+        reverse=True,
+    )
+    for limit in [1, 5, 200, 0]:
+        results = catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=limit)
+        assert len(results) == (limit if limit > 0 else 200)
+        assert [r.entry.name for r in results] == [name for _, name in expected[: len(results)]]
+        for result, (delta, _) in zip(results, expected, strict=False):
+            assert result.delta == pytest.approx(delta, abs=1e-5)
+
+
+@pytest.mark.smoke
+def test_find_with_annotations():
+    catalog = _catalog(
+        [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [0.7, 0.7]],
+        {"a query": [1.0, 0.0]},
+        annotations=[{"gdpr": "true"}, {"gdpr": "false"}, None, {"gdpr": "true", "ccpa": "true"}],
+    )
+    results = catalog.find(
+        query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=10, annotations=AnnotationPredicate('gdpr="true"')
+    )
+    assert [r.entry.name for r in results] == ["tool_0", "tool_3"]
+
+    # Conjuncts are intersected and disjuncts are unioned (AND binds tighter than OR).
+    results = catalog.find(
+        query="a query",
+        snapshot=LATEST_SNAPSHOT_VERSION,
+        limit=10,
+        annotations=AnnotationPredicate('gdpr="false" OR gdpr="true" AND ccpa="true"'),
+    )
+    assert [r.entry.name for r in results] == ["tool_1", "tool_3"]
+
+    # Unknown key-value pairs should yield no candidates.
+    results = catalog.find(
+        query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=10, annotations=AnnotationPredicate('hipaa="true"')
+    )
+    assert len(results) == 0
+
+
+@pytest.mark.smoke
+def test_find_many_matches_find():
+    rng = random.Random(7)
+    embeddings = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(50)]
+    query_vectors = {f"query #{i}": [rng.uniform(-1, 1) for _ in range(8)] for i in range(6)}
+    catalog = _catalog(embeddings, query_vectors)
+
+    queries = list(query_vectors.keys())
+    results_per_query = catalog.find_many(queries=queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=3)
+    assert len(results_per_query) == len(queries)
+    for query, results in zip(queries, results_per_query, strict=True):
+        expected = catalog.find(query=query, snapshot=LATEST_SNAPSHOT_VERSION, limit=3)
+        assert [r.entry.name for r in results] == [r.entry.name for r in expected]
+        assert [r.delta for r in results] == pytest.approx([r.delta for r in expected])
+    assert catalog.find_many(queries=[], snapshot=LATEST_SNAPSHOT_VERSION) == []
+
+
+@pytest.mark.smoke
+def test_chain_find_many():
+    query_vectors = {"first query": [1.0, 0.0], "second query": [0.0, 1.0]}
+    local_catalog = _catalog([[1.0, 0.0], [0.0, 1.0]], query_vectors)
+    other_catalog = _catalog([[0.9, 0.1], [0.1, 0.9], [0.5, 0.5]], query_vectors, source="other_tools.py")
+    chain = CatalogChain(local_catalog, local_catalog, other_catalog)
+
+    results_per_query = chain.find_many(queries=list(query_vectors.keys()), snapshot=LATEST_SNAPSHOT_VERSION, limit=2)
+    # Results are merged by their deltas (and duplicates of earlier catalogs are dropped).
+    assert [(str(r.entry.source), r.entry.name) for r in results_per_query[0]] == [
+        ("tools.py", "tool_0"),
+        ("other_tools.py", "tool_0"),
+    ]
+    assert [(str(r.entry.source), r.entry.name) for r in results_per_query[1]] == [
+        ("tools.py", "tool_1"),
+        ("other_tools.py", "tool_1"),
+    ]
+
+
+@pytest.mark.smoke
+def test_chain_find_names():
+    local_catalog = _catalog([[1.0, 0.0], [0.0, 1.0]], dict())
+    other_catalog = _catalog([[0.9, 0.1], [0.1, 0.9], [0.5, 0.5]], dict(), source="other_tools.py")
+    chain = CatalogChain(local_catalog, other_catalog)
+
+    # Each name resolves to (at most) one item, and items of earlier catalogs take precedence.
+    results_per_name = chain.find_names(names=["tool_2", "tool_0", "tool_9"], snapshot=LATEST_SNAPSHOT_VERSION)
+    assert [[(str(r.entry.source), r.entry.name) for r in results] for results in results_per_name] == [
+        [("other_tools.py", "tool_2")],
+        [("tools.py", "tool_0")],
+        [],
+    ]
+    assert asyncio.run(chain.afind_names(names=["tool_2", "tool_0", "tool_9"], snapshot=LATEST_SNAPSHOT_VERSION)) == (
+        results_per_name
+    )
+
+
+@pytest.mark.smoke
+def test_chain_iter_streams():
+    class EndlessCatalog(CatalogBase):
+        def __init__(self, catalog: CatalogMem):
+            self.catalog = catalog
+
+        def find(self, *args, **kwargs) -> list:
+            return list()
+
+        def __iter__(self):
+            item = next(iter(self.catalog))
+            for i in itertools.count():
+                yield item.model_copy(update={"name": f"endless_tool_{i}"})
+
+        @property
+        def version(self) -> VersionDescriptor:
+            return self.catalog.version
+
+    # Items should be streamed from each catalog (i.e., no catalog is materialized up front).
+    local_catalog = _catalog([[1.0, 0.0], [0.0, 1.0]], dict())
+    chain = CatalogChain(local_catalog, EndlessCatalog(local_catalog))
+    assert [x.name for x in itertools.islice(chain, 4)] == ["tool_0", "tool_1", "endless_tool_0", "endless_tool_1"]
+
+
+@pytest.mark.smoke
+def test_catalog_item_key():
+    assert catalog_item_key("my_catalog_version", "tool", "tool_0") == "my_catalog_version/tool/tool_0"
+
+    # Keys are bounded in length (and remain deterministic).
+    long_key = catalog_item_key("my_catalog_version", "tool", "t" * 300)
+    assert len(long_key) <= 250 and long_key == catalog_item_key("my_catalog_version", "tool", "t" * 300)
+    assert long_key != catalog_item_key("my_catalog_version", "tool", "t" * 301)
+
+
+@pytest.mark.smoke
+def test_chain_deadline():
+    class SlowCatalog(CatalogBase):
+        def __init__(self, catalog: CatalogMem):
+            self.catalog = catalog
+
+        def find(self, *args, **kwargs) -> list:
+            time.sleep(2)
+            return self.catalog.find(*args, **kwargs)
+
+        def __iter__(self):
+            return iter(self.catalog)
+
+        @property
+        def version(self) -> VersionDescriptor:
+            return self.catalog.version
+
+    query_vectors = {"a query": [1.0, 0.0]}
+    local_catalog = _catalog([[1.0, 0.0], [0.0, 1.0]], query_vectors)
+    slow_catalog = SlowCatalog(_catalog([[0.9, 0.1]], query_vectors, source="other_tools.py"))
+
+    # Our (slow) remote catalog should not stall the results of our local catalog.
+    start = time.perf_counter()
+    chain = CatalogChain(local_catalog, slow_catalog, timeout_seconds=0.2)
+    results = chain.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=2)
+    assert time.perf_counter() - start < 1.5
+    assert [(str(r.entry.source), r.entry.name) for r in results] == [("tools.py", "tool_0"), ("tools.py", "tool_1")]
+
+    # Without a deadline, we should wait for both catalogs.
+    chain = CatalogChain(local_catalog, slow_catalog, timeout_seconds=None)
+    results = chain.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=2)
+    assert [(str(r.entry.source), r.entry.name) for r in results] == [
+        ("tools.py", "tool_0"),
+        ("other_tools.py", "tool_0"),
+    ]
+
+
+@pytest.mark.smoke
+def test_chain_deadline_with_hung_catalog():
+    class HungCatalog(CatalogBase):
+        def __init__(self, catalog: CatalogMem):
+            self.catalog = catalog
+            self.release = threading.Event()
+
+        def find(self, *args, **kwargs) -> list:
+            self.release.wait()
+            return list()
+
+        def __iter__(self):
+            return iter(self.catalog)
+
+        @property
+        def version(self) -> VersionDescriptor:
+            return self.catalog.version
+
+    query_vectors = {"a query": [1.0, 0.0]}
+    local_catalog = _catalog([[1.0, 0.0], [0.0, 1.0]], query_vectors)
+    hung_catalog = HungCatalog(local_catalog)
+    chain = CatalogChain(local_catalog, hung_catalog, timeout_seconds=0.1)
+
+    # Searches that never return (and are still running) should not starve the local searches of later calls.
+    try:
+        for _ in range(5):
+            results = chain.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=2)
+            assert [r.entry.name for r in results] == ["tool_0", "tool_1"]
+    finally:
+        hung_catalog.release.set()
+
+
+@pytest.mark.smoke
+def test_chain_async_deadline_exempts_first_catalog():
+    class SlowCatalog(CatalogBase):
+        def __init__(self, catalog: CatalogMem):
+            self.catalog = catalog
+
+        def find(self, *args, **kwargs) -> list:
+            return self.catalog.find(*args, **kwargs)
+
+        async def afind(self, *args, **kwargs) -> list:
+            await asyncio.sleep(0.3)
+            return self.catalog.find(*args, **kwargs)
+
+        def __iter__(self):
+            return iter(self.catalog)
+
+        @property
+        def version(self) -> VersionDescriptor:
+            return self.catalog.version
+
+    query_vectors = {"a query": [1.0, 0.0]}
+    slow_local_catalog = SlowCatalog(_catalog([[1.0, 0.0], [0.0, 1.0]], query_vectors))
+    slow_other_catalog = SlowCatalog(_catalog([[0.9, 0.1]], query_vectors, source="other_tools.py"))
+
+    # Our (slow) local catalog is always waited for, while our other catalogs are skipped after our deadline.
+    chain = CatalogChain(slow_local_catalog, slow_other_catalog, timeout_seconds=0.1)
+    results = asyncio.run(chain.afind(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=2))
+    assert [(str(r.entry.source), r.entry.name) for r in results] == [("tools.py", "tool_0"), ("tools.py", "tool_1")]
+
+
+@pytest.mark.smoke
+def test_embedding_file(tmp_path: pathlib.Path):
+    rng = random.Random(11)
+    embeddings = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(30)]
+    query_vectors = {"a query": [rng.uniform(-1, 1) for _ in range(8)]}
+    catalog = _catalog(embeddings, query_vectors)
+    expected = catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+
+    # Our JSON file should only hold the row of each embedding.
+    catalog_file = tmp_path / "tools.json"
+    catalog.dump(catalog_file, embedding_file=True)
+    assert embedding_file_path(catalog_file).exists()
+    with catalog_file.open("r") as fp:
+        catalog_json = json.load(fp)
+    assert catalog_json["embedding_file"] == "tools.embeddings.npy"
+    assert all("embedding" not in x for x in catalog_json["items"])
+    assert sorted(x["embedding_row"] for x in catalog_json["items"]) == list(range(30))
+
+    # On load, our embedding file is memory-mapped (and should give the same results).
+    loaded_catalog = CatalogMem(
+        catalog_file=catalog_file, embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model")
+    )
+    loaded_catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+    assert isinstance(loaded_catalog._embedding_matrix, numpy.memmap)
+    results = loaded_catalog.find(query="a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=5)
+    assert [r.entry.name for r in results] == [r.entry.name for r in expected]
+    assert [r.delta for r in results] == pytest.approx([r.delta for r in expected], abs=1e-5)
+
+    # Dumping without an embedding file should put our (float32) embeddings back into the JSON file.
+    loaded_catalog.dump(catalog_file)
+    assert not embedding_file_path(catalog_file).exists()
+    with catalog_file.open("r") as fp:
+        catalog_json = json.load(fp)
+    assert "embedding_file" not in catalog_json
+    for item in catalog_json["items"]:
+        assert "embedding_row" not in item
+        assert item["embedding"] == pytest.approx(embeddings[int(item["name"].split("_")[1])], abs=1e-6)
+
+
+@pytest.mark.smoke
+def test_unit_embeddings(tmp_path: pathlib.Path):
+    rng = numpy.random.default_rng(29)
+    embeddings = rng.normal(size=(30, 8))
+    unit_embeddings = embeddings / numpy.linalg.norm(embeddings, axis=1, keepdims=True)
+    for i, matrix in enumerate([embeddings, unit_embeddings]):
+        catalog_file = tmp_path / f"tools_{i}.json"
+        _catalog(matrix.tolist(), dict()).dump(catalog_file, embedding_file=True)
+        loaded_catalog = CatalogMem(
+            catalog_file=catalog_file, embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model")
+        )
+
+        # Our embeddings are normalized once (and embeddings that are already of unit length are used as-is).
+        unit_matrix = loaded_catalog._unit_embeddings()
+        assert loaded_catalog._unit_embeddings() is unit_matrix
+        assert numpy.allclose(numpy.linalg.norm(unit_matrix, axis=1), 1, atol=1e-5)
+        assert (unit_matrix is loaded_catalog._embedding_matrix) == (matrix is unit_embeddings)
+        assert isinstance(unit_matrix, numpy.memmap) == (matrix is unit_embeddings)
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("embedding_file", [False, True])
+def test_lazy_load(tmp_path: pathlib.Path, embedding_file: bool):
+    rng = random.Random(13)
+    embeddings = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(30)]
+    query_vectors = {"a query": [rng.uniform(-1, 1) for _ in range(8)]}
+    annotations = [{"gdpr": "true"} if i % 2 == 0 else None for i in range(30)]
+    catalog = _catalog(embeddings, query_vectors, annotations=annotations)
+    catalog_file = tmp_path / "tools.json"
+    catalog.dump(catalog_file, embedding_file=embedding_file)
+
+    def _load(lazy: bool) -> CatalogMem:
+        loaded_catalog = CatalogMem(
+            catalog_file=catalog_file,
+            embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model"),
+            lazy=lazy,
+        )
+        loaded_catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+        return loaded_catalog
+
+    # No item should be validated in full until it is returned.
+    eager_catalog, lazy_catalog = _load(lazy=False), _load(lazy=True)
+    assert all(isinstance(x, RecordDescriptorStub) for x in lazy_catalog.catalog_descriptor.items)
+    for annotation_predicate in [None, AnnotationPredicate('gdpr="true"')]:
+        expected = eager_catalog.find(
+            "a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=3, annotations=annotation_predicate
+        )
+        results = lazy_catalog.find(
+            "a query", snapshot=LATEST_SNAPSHOT_VERSION, limit=3, annotations=annotation_predicate
+        )
+        assert [r.entry for r in results] == [r.entry for r in expected]
+        assert [r.delta for r in results] == pytest.approx([r.delta for r in expected])
+    assert sum(isinstance(x, PythonToolDescriptor) for x in lazy_catalog.catalog_descriptor.items) <= 6
+    assert lazy_catalog.find(name="tool_7", snapshot=LATEST_SNAPSHOT_VERSION)[0].entry.name == "tool_7"
+
+    # Iterating (or dumping) our catalog should hydrate every item.
+    assert list(lazy_catalog) == list(eager_catalog)
+    assert all(isinstance(x, PythonToolDescriptor) for x in lazy_catalog.catalog_descriptor.items)
+
+
+@pytest.mark.smoke
+def test_lazy_load_concurrent_hydration(tmp_path: pathlib.Path):
+    class InterleavedRawItems(list):
+        """Hydrates each row on another thread right after our (main) thread first reads it."""
+
+        def __init__(self, raw_items: list, catalog: CatalogMem):
+            super().__init__(raw_items)
+            self.catalog = catalog
+            self.interleaved_rows = set()
+
+        def __getitem__(self, row: int):
+            raw_item = super().__getitem__(row)
+            if threading.current_thread() is threading.main_thread() and row not in self.interleaved_rows:
+                self.interleaved_rows.add(row)
+                thread = threading.Thread(target=self.catalog._item, args=(row,))
+                thread.start()
+                thread.join()
+            return raw_item
+
+    rng = random.Random(23)
+    catalog = _catalog([[rng.uniform(-1, 1) for _ in range(8)] for _ in range(10)], dict())
+    catalog_file = tmp_path / "tools.json"
+    catalog.dump(catalog_file)
+    eager_catalog, lazy_catalog = (
+        CatalogMem(catalog_file=catalog_file, embedding_model=catalog.embedding_model, lazy=lazy)
+        for lazy in [False, True]
+    )
+
+    # An item hydrated by another thread (between our check and our use of its raw JSON) should not be re-validated.
+    lazy_catalog._raw_items = InterleavedRawItems(lazy_catalog._raw_items, lazy_catalog)
+    assert list(lazy_catalog) == list(eager_catalog)
+    assert lazy_catalog._raw_items.interleaved_rows == set(range(10))
+
+
+@pytest.mark.smoke
+def test_dump_deduplicates_raw(tmp_path: pathlib.Path):
+    raw = "def tool_0():\n    pass\n" * 100
+    catalog = _catalog([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]], {"a query": [1.0, 0.0]}, raw=raw)
+    catalog_file = tmp_path / "tools.json"
+    catalog.dump(catalog_file)
+
+    # Items that share a source file should reference a single blob.
+    with catalog_file.open("r") as fp:
+        catalog_json = json.load(fp)
+    assert catalog_json["blobs"] == {blob_key(raw): raw}
+    assert all("raw" not in x and x["raw_ref"] == blob_key(raw) for x in catalog_json["items"])
+
+    # Our references should be resolvable after a reload (and survive another dump).
+    loaded_catalog = CatalogMem(
+        catalog_file=catalog_file, embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model")
+    )
+    loaded_catalog.dump(catalog_file)
+    loaded_catalog = CatalogMem(
+        catalog_file=catalog_file, embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model")
+    )
+    entry = loaded_catalog.find(name="tool_1", snapshot=LATEST_SNAPSHOT_VERSION)[0].entry
+    assert entry.raw is None and loaded_catalog.resolve_blob(entry.raw_ref) == raw
+    assert EntryLoader(output=None, resolve_blob=loaded_catalog.resolve_blob)._resolve_raw(entry) == raw
+    assert CatalogChain(loaded_catalog).resolve_blob(entry.raw_ref) == raw
+    with pytest.raises(ValueError):
+        EntryLoader(output=None)._resolve_raw(entry)
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("quantization", ["float16", "int8"])
+def test_quantized_embeddings(tmp_path: pathlib.Path, quantization: str):
+    rng = numpy.random.default_rng(17)
+    embeddings = rng.normal(size=(1000, 32)).tolist()
+    query_vectors = {f"query #{i}": rng.normal(size=32).tolist() for i in range(20)}
+    queries = list(query_vectors.keys())
+    catalog = _catalog(embeddings, query_vectors)
+    expected = catalog.find_many(queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=10)
+
+    # Our quantized pass is followed by an exact (float32) rescoring pass, so our ranking should not change.
+    catalog.embedding_quantization = quantization
+    for results, expected_results in zip(
+        catalog.find_many(queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=10), expected, strict=True
+    ):
+        assert [r.entry.name for r in results] == [r.entry.name for r in expected_results]
+        assert [r.delta for r in results] == pytest.approx([r.delta for r in expected_results], abs=1e-5)
+
+    # On disk, our quantized embeddings are stored next to our float32 embeddings.
+    catalog_file = tmp_path / "tools.json"
+    catalog.dump(catalog_file, embedding_file=True, embedding_quantization=quantization)
+    size_ratio = 2 if quantization == "float16" else 4
+    assert embedding_codes_file_path(catalog_file).stat().st_size <= 128 + 1000 * 32 * 4 // size_ratio
+    assert numpy.load(embedding_file_path(catalog_file)).dtype == numpy.float32
+    loaded_catalog = CatalogMem(
+        catalog_file=catalog_file, embedding_model=EmbeddingModel(embedding_model_name="my_embedding_model")
+    )
+    loaded_catalog.embedding_model._embedding_model = lambda texts: [query_vectors[t] for t in texts]
+
+    # Only our codes are resident: our best candidates are rescored from our (memory-mapped) float32 embeddings.
+    exact_embeddings = {f"tool_{i}": numpy.asarray(x, dtype=numpy.float32) for i, x in enumerate(embeddings)}
+    found, total = 0, 0
+    for query, results, expected_results in zip(
+        queries,
+        loaded_catalog.find_many(queries, snapshot=LATEST_SNAPSHOT_VERSION, limit=10),
+        expected,
+        strict=True,
+    ):
+        expected_names = {r.entry.name for r in expected_results}
+        found += sum(r.entry.name in expected_names for r in results)
+        total += len(expected_results)
+        query_vector = numpy.asarray(query_vectors[query], dtype=numpy.float32)
+        query_vector /= numpy.linalg.norm(query_vector)
+        for result in results:
+            embedding = exact_embeddings[result.entry.name]
+            assert result.delta == pytest.approx(
+                float(embedding @ query_vector / numpy.linalg.norm(embedding)), abs=1e-6
+            )
+    assert found / total >= 0.95
+    assert isinstance(loaded_catalog._embedding_matrix, numpy.memmap)
+    assert loaded_catalog._embedding_norms is None
+
+    # Dumping without an embedding file should restore our (exact) float32 embeddings to our JSON file.
+    loaded_catalog.dump(catalog_file)
+    with catalog_file.open("r") as fp:
+        catalog_json = json.load(fp)
+    assert "embedding_quantization" not in catalog_json
+    assert not embedding_codes_file_path(catalog_file).exists()
+    for item in catalog_json["items"]:
+        assert numpy.array_equal(numpy.asarray(item["embedding"], dtype=numpy.float32), exact_embeddings[item["name"]])
+
+
+@pytest.mark.smoke
+def test_afind_matches_find():
+    rng = random.Random(19)
+    query_vectors = {f"query #{i}": [rng.uniform(-1, 1) for _ in range(8)] for i in range(4)}
+    annotations = [{"gdpr": "true"} if i % 3 == 0 else None for i in range(40)]
+    local_catalog = _catalog([[rng.uniform(-1, 1) for _ in range(8)] for _ in range(40)], query_vectors, annotations)
+    other_catalog = _catalog([[rng.uniform(-1, 1) for _ in range(8)] for _ in range(10)], query_vectors, source="o.py")
+    queries = list(query_vectors.keys())
+
+    for catalog in [local_catalog, CatalogChain(local_catalog, other_catalog)]:
+        for annotation_predicate in [None, AnnotationPredicate('gdpr="true"')]:
+            kwargs = {"snapshot": LATEST_SNAPSHOT_VERSION, "limit": 3, "annotations": annotation_predicate}
+            for query in queries:
+                assert asyncio.run(catalog.afind(query=query, **kwargs)) == catalog.find(query=query, **kwargs)
+            assert asyncio.run(catalog.afind_many(queries=queries, **kwargs)) == catalog.find_many(queries, **kwargs)
+        assert asyncio.run(catalog.afind(name="tool_3", snapshot=LATEST_SNAPSHOT_VERSION)) == catalog.find(
+            name="tool_3", snapshot=LATEST_SNAPSHOT_VERSION
+        )
@@ -0,0 +1,100 @@
+import asyncio
+import concurrent.futures
+import pytest
+import time
+
+from agentc_core.learned.cache import LRUCache
+from agentc_core.learned.embedding import EmbeddingModel
+
+
+def _embedding_model(**kwargs) -> tuple[EmbeddingModel, list[list[str]]]:
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model", **kwargs)
+
+    # Note: we bypass the (sentence-transformers) model load by setting the encoder directly.
+    calls = list()
+
+    def _encode(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+    embedding_model._embedding_model = _encode
+    return embedding_model, calls
+
+
+@pytest.mark.smoke
+def test_lru_cache_eviction():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    # "b" was the least-recently-used entry.
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.max_size) == (3, 1, 1, 2, 2)
+
+
+@pytest.mark.smoke
+def test_lru_cache_ttl():
+    cache = LRUCache(max_size=2, ttl_seconds=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.stats.evictions == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.smoke
+def test_encode_is_cached():
+    embedding_model, calls = _embedding_model()
+    assert embedding_model.encode("a query") == [7.0, 1.0]
+    assert embedding_model.encode("a query") == [7.0, 1.0]
+    assert calls == [["a query"]]
+
+    # Only texts that have not been seen are given to the model (once).
+    assert embedding_model.encode_batch(["a query", "another query", "another query"]) == [
+        [7.0, 1.0],
+        [13.0, 1.0],
+        [13.0, 1.0],
+    ]
+    assert calls == [["a query"], ["another query"]]
+    assert embedding_model.cache_stats.hits == 2
+    assert embedding_model.cache_stats.misses == 3
+
+
+@pytest.mark.smoke
+def test_encode_cache_disabled():
+    embedding_model, calls = _embedding_model(query_cache_size=0)
+    embedding_model.encode("a query")
+    embedding_model.encode("a query")
+    assert calls == [["a query"], ["a query"]]
+    assert embedding_model.cache_stats.size == 0
+
+
+@pytest.mark.smoke
+def test_encode_cache_is_thread_safe():
+    embedding_model, _ = _embedding_model(query_cache_size=8)
+    queries = [f"query #{i % 16}" for i in range(1000)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        embeddings = list(executor.map(embedding_model.encode, queries))
+    assert embeddings == [[float(len(q)), 1.0] for q in queries]
+    stats = embedding_model.cache_stats
+    assert stats.hits + stats.misses == 1000
+    assert stats.size <= 8
+
+
+@pytest.mark.smoke
+def test_aencode_matches_encode():
+    embedding_model, calls = _embedding_model()
+    assert asyncio.run(embedding_model.aencode("a query")) == embedding_model.encode("a query")
+    assert calls == [["a query"]]
+
+    # Batches are encoded on a worker thread (and share our cache with encode()).
+    embeddings = asyncio.run(embedding_model.aencode_batch(["a query", "query #1", "query #22"], batch_size=1))
+    assert embeddings == [[7.0, 1.0], [8.0, 1.0], [9.0, 1.0]]
+    assert calls[1:] == [["query #1"], ["query #22"]]
+    assert asyncio.run(embedding_model.aencode_batch([])) == []
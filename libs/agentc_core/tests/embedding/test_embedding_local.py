@@ -1,3 +1,4 @@
+import numpy
 import os
 import pytest
 
@@ -48,3 +49,36 @@ def test_embedding_local_pretrained():
 
     embedding = embedding_model.encode("agentc")
     assert len(embedding) == 768
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("quantization", [None, "int8"])
+def test_embedding_local_onnx_parity(quantization):
+    pytest.importorskip("onnxruntime")
+
+    # download the model (the ONNX export is fetched by our second load attempt)
+    sentence_transformers.SentenceTransformer(
+        DEFAULT_EMBEDDING_MODEL_NAME,
+        cache_folder=os.getenv("AGENT_CATALOG_SENTENCE_TRANSFORMERS_MODEL_CACHE"),
+        local_files_only=False,
+    )
+
+    # execute both models
+    torch_embedding_model = EmbeddingModel(
+        embedding_model_name=DEFAULT_EMBEDDING_MODEL_NAME,
+        sentence_transformers_model_cache=os.getenv("AGENT_CATALOG_SENTENCE_TRANSFORMERS_MODEL_CACHE"),
+    )
+    onnx_embedding_model = EmbeddingModel(
+        embedding_model_name=DEFAULT_EMBEDDING_MODEL_NAME,
+        sentence_transformers_model_cache=os.getenv("AGENT_CATALOG_SENTENCE_TRANSFORMERS_MODEL_CACHE"),
+        sentence_transformers_backend="onnx",
+        sentence_transformers_onnx_quantization=quantization,
+    )
+    texts = ["agentc", "find me a flight from SFO to JFK", "a tool that looks up hotel reviews by city " * 20]
+    torch_embeddings = numpy.array(torch_embedding_model.encode_batch(texts))
+    onnx_embeddings = numpy.array(onnx_embedding_model.encode_batch(texts))
+    assert onnx_embeddings.shape == torch_embeddings.shape == (3, 384)
+
+    # Both embeddings are unit-length, so their dot product is their cosine similarity.
+    similarities = numpy.sum(torch_embeddings * onnx_embeddings, axis=1)
+    assert numpy.all(similarities > (0.9999 if quantization is None else 0.98))
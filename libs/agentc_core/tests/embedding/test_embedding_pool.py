@@ -0,0 +1,28 @@
+import os
+import pytest
+
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.learned.pool import EmbeddingProcessPool
+
+
+class _PidEmbeddingModel(EmbeddingModel):
+    # Note: we bypass the (sentence-transformers) model load in each worker with this "model".
+    def _load(self) -> None:
+        loads = int(os.environ.get("AGENTC_TEST_LOADS", "0")) + 1
+        os.environ["AGENTC_TEST_LOADS"] = str(loads)
+        self._embedding_model = lambda texts: [[float(len(t)), float(os.getpid()), float(loads)] for t in texts]
+
+
+@pytest.mark.smoke
+def test_process_pool_shards_in_order():
+    texts = ["x" * i for i in range(1, 42)]
+    with EmbeddingProcessPool(_PidEmbeddingModel(embedding_model_name="my_embedding_model"), jobs=3) as pool:
+        assert pool.concurrency == 3
+        assert pool.name == "my_embedding_model"
+        embeddings = pool.encode_batch(texts, batch_size=4)
+        embeddings += pool.encode_batch(texts, batch_size=4)
+
+    # Embeddings come back in order, from (at most) 3 workers that have each loaded their model once.
+    assert [e[0] for e in embeddings] == [float(len(t)) for t in texts] * 2
+    assert 1 <= len({e[1] for e in embeddings}) <= 3
+    assert all(e[1] != os.getpid() and e[2] == 1.0 for e in embeddings)
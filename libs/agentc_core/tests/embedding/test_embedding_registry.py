@@ -0,0 +1,85 @@
+import concurrent.futures
+import gc
+import numpy
+import pytest
+import threading
+import time
+
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.learned.registry import ModelRegistry
+from agentc_core.learned.registry import model_registry
+
+
+class _FakeSentenceTransformer:
+    loads = 0
+
+    def __init__(self):
+        _FakeSentenceTransformer.loads += 1
+
+    def encode(self, texts: list[str], **kwargs) -> numpy.ndarray:
+        return numpy.array([[float(len(t)), 1.0] for t in texts])
+
+
+@pytest.mark.smoke
+def test_embedding_models_share_weights(monkeypatch):
+    # Note: we bypass the (sentence-transformers) model load by substituting a fake model.
+    monkeypatch.setattr(EmbeddingModel, "_load_sentence_transformer", lambda self: _FakeSentenceTransformer())
+    _FakeSentenceTransformer.loads = 0
+    key = ("my_shared_embedding_model", None, None, "my_cache_folder", "torch")
+
+    first, second, other = [
+        EmbeddingModel(embedding_model_name=name, sentence_transformers_model_cache="my_cache_folder")
+        for name in ["my_shared_embedding_model", "my_shared_embedding_model", "my_other_embedding_model"]
+    ]
+    assert first.encode("abc") == [3.0, 1.0]
+    assert second.encode("abcd") == [4.0, 1.0]
+    assert _FakeSentenceTransformer.loads == 1
+    assert model_registry.references(key) == 2
+
+    # Different models are not shared.
+    other.encode("abc")
+    assert _FakeSentenceTransformer.loads == 2
+
+    # The model is dropped once its last user has been closed (or garbage collected).
+    first.close()
+    first.close()
+    assert model_registry.references(key) == 1
+    del second
+    gc.collect()
+    assert model_registry.references(key) == 0
+
+    # A closed model is loaded again on its next use.
+    assert first.encode("abcde") == [5.0, 1.0]
+    assert _FakeSentenceTransformer.loads == 3
+    first.close()
+    other.close()
+
+
+@pytest.mark.smoke
+def test_registry_loads_once_under_contention():
+    registry = ModelRegistry()
+    loads = list()
+
+    def _load():
+        loads.append(threading.get_ident())
+        time.sleep(0.1)
+        return object()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        shared_models = list(
+            executor.map(lambda _: registry.acquire(("a", None, None, None, "torch"), _load), range(8))
+        )
+    assert len(loads) == 1
+    assert len({id(m.model) for m in shared_models}) == 1
+    assert registry.references(("a", None, None, None, "torch")) == 8
+    for shared_model in shared_models:
+        registry.release(shared_model)
+    assert len(registry) == 0
+
+    # Failed loads do not leave a reference behind.
+    def _failed_load():
+        raise OSError("model not found")
+
+    with pytest.raises(OSError):
+        registry.acquire(("b", None, None, None, "torch"), _failed_load)
+    assert len(registry) == 0
@@ -0,0 +1,162 @@
+import asyncio
+import contextlib
+import http.server
+import json
+import pytest
+import requests
+import threading
+import time
+
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.learned.remote import RemoteEmbeddingClient
+from agentc_core.learned.remote import TokenBucket
+
+
+class _StubEmbeddingServer(http.server.ThreadingHTTPServer):
+    """A stub of an OpenAI-client-compatible embeddings endpoint (embeddings are [len(text), 1.0])."""
+
+    def __init__(self, failures: list[int] = None, latency_seconds: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _StubEmbeddingHandler)
+        self.failures = list(failures or [])
+        self.latency_seconds = latency_seconds
+        self.requests = list()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _StubEmbeddingHandler(http.server.BaseHTTPRequestHandler):
+    server: _StubEmbeddingServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests.append((self.path, self.headers.get("Authorization"), body))
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            status = self.server.failures.pop(0) if self.server.failures else 200
+        time.sleep(self.server.latency_seconds)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        if status != 200:
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        # We return our embeddings out of order (clients must sort these by index).
+        data = [{"index": i, "embedding": [float(len(t)), 1.0]} for i, t in enumerate(body["input"])]
+        payload = json.dumps({"data": list(reversed(data))}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@contextlib.contextmanager
+def _stub_server(**kwargs):
+    server = _StubEmbeddingServer(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.smoke
+def test_remote_client_batches_concurrently():
+    texts = ["x" * i for i in range(1, 21)]
+    with _stub_server(latency_seconds=0.1) as server:
+        client = RemoteEmbeddingClient(
+            server.url, "my_embedding_model", auth="my_token", batch_size=4, max_concurrency=3
+        )
+        embeddings = client.embed(texts)
+        client.close()
+
+    # Embeddings are returned in order, and all 5 batches are sent (at most 3 at a time).
+    assert embeddings == [[float(len(t)), 1.0] for t in texts]
+    assert sorted(len(body["input"]) for _, _, body in server.requests) == [4, 4, 4, 4, 4]
+    assert 1 < server.max_in_flight <= 3
+    assert all(path == "/v1/embeddings" and auth == "Bearer my_token" for path, auth, _ in server.requests)
+    assert all(body["model"] == "my_embedding_model" for _, _, body in server.requests)
+
+
+@pytest.mark.smoke
+def test_remote_client_retries_transient_failures():
+    with _stub_server(failures=[429, 503]) as server:
+        client = RemoteEmbeddingClient(server.url, "my_embedding_model", max_retries=2)
+        assert client.embed(["abc"]) == [[3.0, 1.0]]
+    assert len(server.requests) == 3
+
+    # Retries are bounded...
+    with _stub_server(failures=[503, 503, 503]) as server:
+        client = RemoteEmbeddingClient(server.url, "my_embedding_model", max_retries=2)
+        with pytest.raises(requests.HTTPError):
+            client.embed(["abc"])
+    assert len(server.requests) == 3
+
+    # ...and other errors are never retried.
+    with _stub_server(failures=[400]) as server:
+        client = RemoteEmbeddingClient(server.url, "my_embedding_model", max_retries=2)
+        with pytest.raises(requests.HTTPError):
+            client.embed(["abc"])
+    assert len(server.requests) == 1
+
+
+@pytest.mark.smoke
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+
+    # The first token is available immediately, and each subsequent token takes 1/20th of a second.
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.smoke
+def test_embedding_model_remote_encode_batch():
+    with _stub_server() as server:
+        embedding_model = EmbeddingModel(
+            embedding_model_name="my_remote_embedding_model",
+            embedding_model_url=server.url,
+            embedding_model_max_concurrency=2,
+        )
+        assert embedding_model.concurrency == 2
+        texts = ["a", "bb", "ccc", "a"]
+        assert embedding_model.encode_batch(texts, batch_size=2) == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+        assert embedding_model.encode("bb") == [2.0, 1.0]
+        embedding_model.close()
+
+    # Duplicate (and cached) texts are only sent once.
+    assert sorted(len(body["input"]) for _, _, body in server.requests) == [1, 2]
+
+
+@pytest.mark.smoke
+def test_embedding_model_remote_aencode_batch():
+    texts = ["x" * i for i in range(1, 13)]
+    with _stub_server(failures=[503], latency_seconds=0.1) as server:
+        embedding_model = EmbeddingModel(
+            embedding_model_name="my_async_remote_embedding_model",
+            embedding_model_url=server.url,
+            embedding_model_max_concurrency=2,
+            embedding_model_max_retries=2,
+        )
+        embeddings = asyncio.run(embedding_model.aencode_batch(texts, batch_size=2))
+        embedding_model.close()
+
+    # Our async path uses the same (bounded and retrying) client as encode_batch: 6 batches (plus 1 retry) are sent.
+    assert embeddings == [[float(len(t)), 1.0] for t in texts]
+    assert len(server.requests) == 7
+    assert 1 < server.max_in_flight <= 2
@@ -0,0 +1,41 @@
+import pytest
+import threading
+
+from agentc_core.learned.embedding import EmbeddingModel
+
+
+@pytest.mark.smoke
+def test_warm_up_loads_in_background():
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model")
+    release = threading.Event()
+    encoded = list()
+
+    def _load():
+        # We simulate a slow model load here (the warm-up must not block its caller).
+        release.wait()
+        embedding_model._embedding_model = lambda texts: encoded.extend(texts) or [[1.0, 0.0] for _ in texts]
+
+    embedding_model._load = _load
+    future = embedding_model.warm_up()
+    assert not future.done()
+    assert embedding_model.warm_up() is future
+
+    release.set()
+    assert future.result(timeout=5) is None
+    assert encoded == ["warm-up"]
+
+    # Our dummy text is not cached, and the model is not loaded again.
+    assert embedding_model.encode("hello") == [1.0, 0.0]
+    assert embedding_model.cache_stats.size == 1
+
+
+@pytest.mark.smoke
+def test_warm_up_failure_is_surfaced():
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model")
+
+    def _load():
+        raise OSError("model not found")
+
+    embedding_model._load = _load
+    with pytest.raises(OSError, match="model not found"):
+        embedding_model.warm_up().result(timeout=5)
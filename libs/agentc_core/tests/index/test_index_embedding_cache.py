@@ -0,0 +1,113 @@
+import datetime
+import os
+import pathlib
+import pytest
+import shutil
+import typing
+
+from agentc_core.catalog.index import MetaVersion
+from agentc_core.catalog.index import collect_embedding_cache
+from agentc_core.catalog.index import index_catalog
+from agentc_core.indexer import EmbeddingCache
+from agentc_core.learned.embedding import EmbeddingModel
+from agentc_core.version import VersionDescriptor
+from agentc_testing.directory import temporary_directory
+
+# This is to keep ruff from falsely flagging this as unused.
+_ = temporary_directory
+
+
+def _index(embedding_model: EmbeddingModel, embedding_cache: EmbeddingCache, path_version: str, **kwargs):
+    return index_catalog(
+        embedding_model=embedding_model,
+        meta_version=MetaVersion(schema_version="0.1.0", library_version="0.1.0"),
+        catalog_version=VersionDescriptor(
+            timestamp=datetime.datetime.now(tz=datetime.timezone.utc), identifier="SOME_CATALOG_VERSION"
+        ),
+        get_path_version=lambda x: VersionDescriptor(
+            timestamp=datetime.datetime.now(tz=datetime.timezone.utc), identifier=path_version
+        ),
+        kind="tool",
+        catalog_file=pathlib.Path("tools.json"),
+        source_dirs=["tools"],
+        print_progress=False,
+        embedding_cache=embedding_cache,
+        **kwargs,
+    )
+
+
+@pytest.mark.smoke
+def test_embedding_cache(tmp_path: pathlib.Path):
+    embedding_cache = EmbeddingCache(tmp_path / "embedding-cache", max_entries=2)
+    assert embedding_cache.get("a description", "my_embedding_model") is None
+    embedding_cache.put("a description", "my_embedding_model", [0.1, 0.2])
+    assert embedding_cache.get("a description", "my_embedding_model") == [0.1, 0.2]
+    assert embedding_cache.get("a description", "another_embedding_model") is None
+
+    # Unreferenced entries are removed, and then the least-recently-used entries beyond our cap are removed.
+    for i in range(4):
+        embedding_cache.put(f"description #{i}", "my_embedding_model", [float(i)])
+        os.utime(embedding_cache._entry_path(embedding_cache.key(f"description #{i}", "my_embedding_model")), (i, i))
+    referenced = [EmbeddingCache.key(f"description #{i}", "my_embedding_model") for i in range(4)]
+    assert embedding_cache.collect(referenced) == 3
+    assert embedding_cache.get("a description", "my_embedding_model") is None
+    assert embedding_cache.get("description #0", "my_embedding_model") is None
+    assert embedding_cache.get("description #1", "my_embedding_model") is None
+    assert embedding_cache.get("description #3", "my_embedding_model") == [3.0]
+
+
+@pytest.mark.smoke
+def test_index_with_embedding_cache(temporary_directory: typing.Generator[pathlib.Path, None, None]):
+    project_dir = pathlib.Path(temporary_directory)
+    project_dir.mkdir(exist_ok=True)
+    shutil.copytree(pathlib.Path(__file__).parent / "resources", project_dir, dirs_exist_ok=True)
+    os.chdir(temporary_directory)
+
+    # Note: we bypass the (sentence-transformers) model load by setting the encoder directly.
+    encoded_texts = list()
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model", query_cache_size=0)
+
+    def _encode(texts: list[str]) -> list[list[float]]:
+        encoded_texts.extend(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+    embedding_model._embedding_model = _encode
+    embedding_cache = EmbeddingCache(project_dir / "embedding-cache")
+    catalog = _index(embedding_model, embedding_cache, "SOME_PATH_VERSION")
+    catalog.dump(pathlib.Path("tools.json"))
+    assert len(encoded_texts) == len(catalog)
+
+    # A new version of every source file (with the same descriptions) should not require any new embeddings.
+    encoded_texts.clear()
+    next_catalog = _index(embedding_model, embedding_cache, "ANOTHER_PATH_VERSION")
+    assert len(encoded_texts) == 0
+    assert {x.name: x.embedding for x in next_catalog} == {x.name: x.embedding for x in catalog}
+
+    # All entries are referenced by our catalog, so none should be removed.
+    assert collect_embedding_cache(embedding_cache, [pathlib.Path("tools.json")], embedding_model) == 0
+
+    # The items of an unsaved (e.g., dirty) catalog are also referenced.
+    assert collect_embedding_cache(embedding_cache, [], embedding_model, descriptors=next_catalog) == 0
+    assert collect_embedding_cache(embedding_cache, [], embedding_model) > 0
+
+
+@pytest.mark.smoke
+def test_index_in_batches(temporary_directory: typing.Generator[pathlib.Path, None, None]):
+    project_dir = pathlib.Path(temporary_directory)
+    project_dir.mkdir(exist_ok=True)
+    shutil.copytree(pathlib.Path(__file__).parent / "resources", project_dir, dirs_exist_ok=True)
+    os.chdir(temporary_directory)
+
+    # Note: we bypass the (sentence-transformers) model load by setting the encoder directly.
+    batches = list()
+    embedding_model = EmbeddingModel(embedding_model_name="my_embedding_model", query_cache_size=0)
+
+    def _encode(texts: list[str]) -> list[list[float]]:
+        batches.append(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+    embedding_model._embedding_model = _encode
+    catalog = _index(embedding_model, None, "SOME_PATH_VERSION", batch_size=4)
+    assert all(0 < len(batch) <= 4 for batch in batches)
+    assert len(batches) == -(-len({x.description for x in catalog}) // 4)
+    assert all(x.embedding == [float(len(x.description)), 1.0] for x in catalog)